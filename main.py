@@ -3,6 +3,10 @@ from traceback import print_exc
 from server.cli import Console, colored
 from server.config import config
 from server.client import handle_client
+from server.session import session
+from server.keys import keys
+from server.world.states import configuration
+from server.world import scheduler, lobby
 from server.blocks import *
 
 import gc
@@ -12,6 +16,9 @@ stop_event = asyncio.Event()
 console = Console(stop_event)
 
 async def start_server():
+    configuration.prepare(int(config.get("network-compression-threshold", "-1")))
+    lobby.prepare(int(config.get("network-compression-threshold", "-1")))
+    await keys.prepare()
     server = await asyncio.start_server(handle_client, config.get("server-ip", "0.0.0.0"), int(config.get("server-port", "25565")))
     addr = server.sockets[0].getsockname()
     console.print(f"✅ Server started on {addr[0]}:{addr[1]}")
@@ -23,7 +30,8 @@ async def start_server():
 async def entry():
     tasks = [
         asyncio.create_task(start_server()),
-        # asyncio.create_task(world.tick()),
+        asyncio.create_task(scheduler.run()),
+        asyncio.create_task(keys.rotate()),
         asyncio.create_task(console.input())
     ]
 
@@ -36,6 +44,7 @@ async def entry():
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        await session.close()
         print("\nExited cleanly.")
 
 if __name__ == "__main__":
@@ -34,11 +34,21 @@ class Console:
                     print(colored("--------------help------------------","cyan"))
                     print(f" {colored("help","green")}  - show this menu")
                     print(f"{colored("memory","green")} - show the RAM usage in MB")
+                    print(f"{colored("reload","green")} - reload server.properties and the server icon")
+                    print(f"{colored("metrics","green")} - show the server counters")
                     print(f" {colored("cls","green")}   - clears the console")
                     print(colored("------------------------------------","cyan"))
                 elif self.input_buffer.strip().lower() == "memory":
                     from server.blocks import memory_usage
                     print(f"Memory usage: {colored(f"{memory_usage():.2f} MB","cyan")}")
+                elif self.input_buffer.strip().lower() == "reload":
+                    from server.properties import reload
+                    reload()
+                    print(colored("Reloaded server.properties", "green"))
+                elif self.input_buffer.strip().lower() == "metrics":
+                    from server.metrics import metrics
+                    for line in metrics.report() or ["No metrics recorded yet"]:
+                        print(colored(line, "cyan"))
                 elif self.input_buffer.strip().lower() == "cls":
                     from os import system, name
                     system('cls' if name == 'nt' else 'clear')
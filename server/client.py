@@ -1,4 +1,4 @@
-from server.world.engine import ClientSideError
+from server.world.engine import ClientSideError, JoinGameError
 from server.packet.parse import Parse
 from server.packet.build import Build
 from server.transfer import Transfer
@@ -6,19 +6,38 @@ from server.logger import logger
 from server.player import Player
 from server.handle import Handle
 from server.packet import Packet
-from server.world import World
+from server.world import lobby
 from server.vars import Var
+from server.timers import timers
+from server.config import config
 import traceback, asyncio
 
 logger = logger.create_sub_logger("client", ["ALL"])
 
+async def expire(writer):
+    """Drops connections that are still handshaking or logging in when their deadline passes."""
+    logger.warn(f"⚠️ {writer.get_extra_info('peername')} took too long to join")
+    writer.close()
+
 async def handle_client(reader, writer):
-    packet = Packet(reader, writer)
+    buffer = bytearray()
+    next_state = None
     error = 0
-    logger.debug(f"🔗 New connection from {writer.get_extra_info('peername')}")
+    deadline = timers.schedule(float(config.get("login-timeout", "30")), expire, writer)
 
     try:
-        next_state, protocol, addr = await Handle.handshake(packet)
+        buffer += await reader.read(4096)
+        # Legacy ping from old clients and crawlers: a bare 0xFE (pre-1.4), 0xFE 0x01 (1.4-1.5) or 0xFE 0x01 0xFA (1.6).
+        # Anything else starting with 0xFE is a modern frame whose length prefix happens to begin with that byte.
+        if buffer in (b'\xfe', b'\xfe\x01') or buffer[:3] == b'\xfe\x01\xfa':
+            Handle.legacy_ping(writer)
+            writer.close()
+            return
+
+        handshake = await Handle.handshake(reader, buffer)
+        if handshake is None:
+            return
+        next_state, protocol, addr = handshake
 
         # async with Build(0x00, writer) as build:
         #     build.string(json.dumps([
@@ -26,25 +45,27 @@ async def handle_client(reader, writer):
         #         {"text": "Work in progress", "color": "white"}
         #     ], separators=(",", ":")))
 
-        if next_state is None:
-            return
-
         if next_state == 1:
-            await Handle.status_request(packet, protocol)
-            await Handle.ping(packet)
+            await Handle.status(reader, writer, buffer, protocol)
+            writer.close()
+
+        if next_state in (2, 3):
+            logger.debug(f"🔗 New connection from {writer.get_extra_info('peername')}: version={protocol}, addr={addr}, next={next_state}")
+            packet = Packet(reader, writer, state="login")
+            packet.frames.feed(bytes(buffer)) # Whatever arrived with the handshake
 
         if next_state == 2:
-            player = Player(reader, writer)
-            world = World(player)
-            ip = await world.run()
+            player = Player(reader, writer, packet)
+            player.deadline = deadline
+            ip = await lobby.run(player)
             logger.info(f'📡 Transfering {player.username} to {ip}')
             await Transfer.to(player, ip)
             await asyncio.sleep(1)
 
         if next_state == 3:
-            player = Player(reader, writer)
-            world = World(player)
-            ip = await world.run()
+            player = Player(reader, writer, packet)
+            player.deadline = deadline
+            ip = await lobby.run(player)
             logger.info(f'📡 Transfering {player.username} to {ip}')
             await Transfer.to(player, ip)
             await asyncio.sleep(1)
@@ -57,9 +78,13 @@ async def handle_client(reader, writer):
         else: logger.warn(f"⚠️ Client forcibly closed the connection")
     except ClientSideError:
         logger.error(f"❌ An error ocured on the clientside")
+    except JoinGameError:
+        pass # World.run already logged why the join failed
     except Exception as e:
         error = 1
         logger.error(f"❌ Error handling client:\n{traceback.format_exc()}")
     finally:
+        deadline.cancel()
+        writer.close() # Otherwise the socket stays open until the writer is garbage collected
         if error:
             logger.debug("🔌 Connection closed")
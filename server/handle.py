@@ -1,79 +1,73 @@
+from server.packet.frame import split_frame
 from server.packet.parse import Parse
-from server.packet.build import Build
 from server.packet import Packet
 from server.client import logger
-from server.properties import MOTD_DATA
+from server.properties import status_response, legacy_status_response
 from server.vars import Var
 # from struct import pack
-from json import dumps
-import asyncio, traceback
+import asyncio
 
 class Handle:
-    @staticmethod    
-    async def handshake(packet: Packet) -> int:
+    """Handshake and status handling straight off the raw stream, without a Packet or Player."""
+    @staticmethod
+    async def frame(reader: asyncio.StreamReader, buffer: bytearray, limit: int) -> bytes | None:
+        """Cuts the next frame off `buffer`, reading more only when needed. None if the client hung up."""
+        while True:
+            found = split_frame(buffer, 0, limit)
+            if found is not None:
+                frame, end = found
+                del buffer[:end]
+                return frame
+
+            chunk = await reader.read(4096)
+            if not chunk:
+                return None
+            buffer += chunk
+
+    @staticmethod
+    async def handshake(reader: asyncio.StreamReader, buffer: bytearray) -> tuple[int, int, str] | None:
         """Handles the initial handshake packet."""
-        buffer = await packet.recv()
-        
-        # print(f'{buffer}')
-        packet_id, data = buffer[:1], buffer[1:]
-        if packet_id != b'\x00':
-            logger.warn(f"⚠️ Expected handshake (0x00), got {packet_id}")
-            return False
-        
-        with Parse(data) as parse:
+        frame = await Handle.frame(reader, buffer, Packet.max_frame_size("handshake"))
+        if frame is None:
+            return None
+
+        # print(f'{frame}')
+        with Parse(frame) as parse:
+            packet_id = parse.varint()
+            if packet_id != 0x00:
+                logger.warn(f"⚠️ Expected handshake (0x00), got {packet_id}")
+                return None
+
             protocol_version = parse.varint()
             server_addr = parse.string()
             server_port = parse.short()
             next_state = parse.varint()
-        
-        logger.debug(f"🔍 Handshake: version={protocol_version}, addr={server_addr}:{server_port}, next={next_state}")
+
         return next_state, protocol_version, f"{server_addr}:{server_port}"
 
     @staticmethod
-    async def status_request(packet: Packet, protocol_version):
-        try:
-            with Parse(await packet.recv()) as parse:
-                packet_id = parse.varint()
-
-            if packet_id is None:
-                logger.warn("ℹ️ No status request received (client might have disconnected)")
-                return
-            if packet_id != 0x00:
-                logger.warn(f"⚠️ Expected status request (0x00), got {packet_id}")
-                return
+    async def status(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, buffer: bytearray, protocol_version: int):
+        """Answers the status request with the cached response and echoes the ping back."""
+        limit = Packet.max_frame_size("status")
 
-            # Send response
-            if (MOTD_DATA["version"]["protocol"] == -1):
-                response = MOTD_DATA.copy()
-                response["version"]["protocol"] = protocol_version
-                response = dumps(response)
-            else:
-                response = dumps(MOTD_DATA)
+        request = await Handle.frame(reader, buffer, limit)
+        if request is None:
+            return
+        if request != b'\x00':
+            logger.warn(f"⚠️ Expected status request (0x00), got {request[:1]}")
+            return
+        writer.write(status_response(protocol_version))
 
-            async with Build(0x00, packet.writer) as build:
-                build.string(response)
-
-            logger.debug("✅ Sent status response")
-        except Exception as e:
-            logger.error(f"Error durring status request: {e}")
+        ping = await Handle.frame(reader, buffer, limit)
+        if ping is None:
+            return # Normal for some clients
+        if ping[:1] != b'\x01':
+            logger.warn(f"⚠️ Expected ping (0x01), got {ping[:1]}")
+            return
+        # Pong has the same id and payload as the ping
+        writer.write(Var.write_varint(len(ping)) + ping)
 
     @staticmethod
-    async def ping(packet: Packet):
-        try:
-            with Parse(await packet.recv()) as parse:
-                packet_id = parse.varint()
-                timestamp = parse.long()
-
-            if packet_id is None:
-                logger.warn("ℹ️ No ping received (normal for some clients)")
-                return
-            if packet_id != 0x01:
-                logger.warn(f"⚠️ Expected ping (0x01), got {packet_id}")
-                return
-                
-            async with Build(0x01, packet.writer) as build:
-                build.long(timestamp)
-
-            logger.debug("✅ Responded to ping")
-        except Exception as e:
-            logger.error(f"Error durring ping: "); traceback.print_exc()
+    def legacy_ping(writer: asyncio.StreamWriter):
+        """Answers a pre-1.7 (0xFE) server-list ping. The rest of its request is never parsed."""
+        writer.write(legacy_status_response())
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from Crypto.Cipher import PKCS1_v1_5
+from Crypto.PublicKey import RSA
+from server.config import config
+from server.logger import logger
+from server.vars import Var
+import asyncio, hashlib
+
+logger = logger.create_sub_logger("keys")
+
+class KeyPair:
+    def __init__(self, bits:int = 1024):
+        self.key = RSA.generate(bits)
+        self.public_key = self.key.publickey().export_key(format='DER') # Sent in every Encryption Request
+        self.cipher = PKCS1_v1_5.new(self.key)
+
+class Keys:
+    """Server RSA keypair shared by all online-mode logins, replaced every `rsa-key-rotation` seconds."""
+    def __init__(self):
+        self._current = None
+
+    def current(self) -> KeyPair:
+        return self._current
+
+    async def prepare(self):
+        """Generates a keypair in a worker thread, first before the server listens and then on every rotation."""
+        self._current = await asyncio.to_thread(KeyPair)
+        logger.debug("🔑 Generated a new RSA keypair")
+
+    async def rotate(self):
+        while True:
+            await asyncio.sleep(int(config.get("rsa-key-rotation", "3600")))
+            await self.prepare()
+
+class LoginCrypto:
+    """Bounded worker pool for the RSA decryption and server hash of online-mode logins."""
+    def __init__(self):
+        self._executor = None
+        self.queued = 0
+
+    def reserve(self) -> bool:
+        if self.queued >= int(config.get("login-crypto-queue", "32")):
+            return False
+        self.queued += 1
+        return True
+
+    def release(self):
+        self.queued -= 1
+
+    async def verify(self, keypair:KeyPair, secret:bytes, token:bytes, verify_token:bytes) -> tuple[bytes, str] | None:
+        """Returns (shared_secret, server_hash), or None if the verify token doesn't match."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(int(config.get("login-crypto-workers", "2")), thread_name_prefix="login-crypto")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, _verify, keypair, bytes(secret), bytes(token), verify_token)
+
+def _verify(keypair:KeyPair, secret:bytes, token:bytes, verify_token:bytes) -> tuple[bytes, str] | None:
+    shared_secret = keypair.cipher.decrypt(secret, None)
+    if keypair.cipher.decrypt(token, None) != verify_token:
+        return None
+
+    sha1 = hashlib.sha1()
+    sha1.update(b"")  # empty server ID
+    sha1.update(shared_secret)
+    sha1.update(keypair.public_key)
+    return shared_secret, Var.java_hex(sha1.digest())
+
+keys = Keys()
+crypto = LoginCrypto()
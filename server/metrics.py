@@ -0,0 +1,30 @@
+from collections import Counter
+
+class Metrics:
+    """Process-wide counters and timings, shown by the `metrics` console command."""
+    def __init__(self):
+        self.counters = Counter()
+        self.timings = {}
+
+    def count(self, name:str, amount:int = 1):
+        self.counters[name] += amount
+
+    def timing(self, name:str, seconds:float):
+        """Adds one duration to a running count, total and maximum."""
+        count, total, peak = self.timings.get(name, (0, 0.0, 0.0))
+        self.timings[name] = (count + 1, total + seconds, max(peak, seconds))
+
+    def get(self, name:str) -> int:
+        return self.counters[name]
+
+    def report(self) -> list[str]:
+        lines = [f"{name}: {value:,}" for name, value in sorted(self.counters.items())]
+        for name, (count, total, peak) in sorted(self.timings.items()):
+            lines.append(f"{name}: {count:,} x {total / count * 1000:.2f} ms avg, {peak * 1000:.2f} ms max")
+
+        joins = self.get("known-packs-hit")
+        if joins:
+            lines.append(f"registry bytes sent per join: {self.get('registry-bytes-sent') // joins:,}")
+        return lines
+
+metrics = Metrics()
@@ -1,16 +1,35 @@
+from server.packet.frame import FrameDecoder
+from contextlib import asynccontextmanager
+from Crypto.Cipher import AES
+from server.config import config
 from server.vars import Var
 import asyncio
 
 class Packet:
-    def __init__(self, reader=None, writer=None, ed_key=None, compression=-1):
-        from Crypto.Cipher import AES
+    # Largest frame (as sent on the wire) accepted from a client in each state.
+    # Override with `max-frame-size-<state>` in server.properties.
+    MAX_FRAME_SIZE = {
+        "handshake": 1024,
+        "status": 64,
+        "login": 8192,
+        "config": 65536,
+        "play": 2097151,
+    }
+    MAX_DATA_LENGTH = 8388608 # Largest decompressed packet
+
+    def __init__(self, reader=None, writer=None, ed_key=None, compression=-1, state="handshake"):
         self.reader = reader
         self.writer = writer
         self.compression = compression
+        self.frames = FrameDecoder(reader)
+        self.set_state(state)
+        self._outbound = []
+        self._batching = 0
 
         if ed_key is not None:
             self.encryption = AES.new(ed_key, AES.MODE_CFB, iv=ed_key, segment_size=8)
             self.decryption = AES.new(ed_key, AES.MODE_CFB, iv=ed_key, segment_size=8)
+            self.frames.set_decryption(self.decryption)
         else:
             self.encryption = None
             self.decryption = None
@@ -34,60 +53,62 @@ class Packet:
         
         raise TypeError("No matching reader or writer found.")
 
+    @staticmethod
+    def max_frame_size(state:str) -> int:
+        return int(config.get(f"max-frame-size-{state}", Packet.MAX_FRAME_SIZE[state]))
+
+    def set_state(self, state:str):
+        self.state = state
+        self.frames.limit = self.max_frame_size(state)
+
     def set_compression(self, compression:int):
         self.compression = compression
 
     def set_encryption(self, shared_secret:bytes):
-        from Crypto.Cipher import AES
         self.encryption = AES.new(shared_secret, AES.MODE_CFB, iv=shared_secret, segment_size=8)
         self.decryption = AES.new(shared_secret, AES.MODE_CFB, iv=shared_secret, segment_size=8)
+        self.frames.set_decryption(self.decryption)
 
     async def recv(self, reader: asyncio.StreamReader = None):
         from server.world import logger
         _reader = self.__check(reader, True)
-        
-        async def read_varint_encrypted() -> int:
-            """Reads a VarInt from an encrypted stream."""
-            data = b""
-            for _ in range(5):  # VarInt can be at most 5 bytes
-                byte = await _reader.read(1)
-                if not byte:
-                    return None, 0, b""
-                byte = self.decryption.decrypt(byte)
-                data += byte
-                if byte[0] & 0x80 == 0:
-                    break
-            length, _ = Var.read_varint_from_bytes(data)
-            return length
-        
-        if getattr(self, 'encryption', None) != None:
-            packet_length = await read_varint_encrypted()
-        else:
-            packet_length = await Var.read_varint(_reader)
-
-        data = await _reader.read(packet_length)
+        # Never wait on the client while our own packets are still queued
+        await self.flush()
 
-        if getattr(self, 'encryption', None) != None:
-            data = self.decryption.decrypt(data)
+        if _reader is self.reader:
+            data = await self.frames.read()
+        else:
+            frames = FrameDecoder(_reader)
+            frames.decryption = self.decryption
+            data = await frames.read()
 
         if getattr(self, "compression", -1) > 0:
-            from zlib import decompress
+            from server.world.engine import ClientSideError
+            from zlib import decompressobj, error as ZlibError
             data_length, offset = Var.read_varint_from(data); data = data[offset:]
+            if data_length > self.MAX_DATA_LENGTH:
+                raise ClientSideError(f"Packet of {data_length} bytes is too large")
             if data_length > 0:
-                data = decompress(data)
+                inflate = decompressobj()
+                try:
+                    data = inflate.decompress(data, data_length)
+                except ZlibError:
+                    raise ClientSideError("Malformed compressed packet")
+                # Anything left over means the packet inflates past its declared length
+                if len(data) != data_length or inflate.unconsumed_tail or inflate.unused_data or not inflate.eof:
+                    raise ClientSideError("Decompressed packet length mismatch")
 
         logger.debug(f'{"🔒 " if self.encryption is not None else ""}Recieved: {data}')
         return data
     
-    async def send(self, data: bytes, writer: asyncio.StreamWriter = None):
-        from server.world import logger
+    @staticmethod
+    def frame(data: bytes, compression: int = -1) -> bytes:
+        """Compresses (above the threshold) and length-prefixes a packet, ready for queue_framed()."""
         from zlib import compress
-        _writer = self.__check(writer, False)
 
         # Apply compression if enabled and data is large enough
-        if getattr(self, "compression", -1) > 0:
-            threshold = self.compression
-            if len(data) >= threshold:
+        if compression > 0:
+            if len(data) >= compression:
                 uncompressed_length = Var.write_varint(len(data))
                 data = compress(data)
                 data = uncompressed_length + data
@@ -96,12 +117,64 @@ class Packet:
                 data = Var.write_varint(0) + data
 
         length_prefix = Var.write_varint(len(data))
-        data = length_prefix + data
+        return length_prefix + data
+
+    def queue(self, data: bytes):
+        """Frames, compresses and encrypts a packet and holds it until the next flush."""
+        from server.world import logger
+
+        data = self.frame(data, getattr(self, "compression", -1))
 
         logger.debug(f'{"🔒 " if self.encryption is not None else ""}Sending: {data}')
 
         if getattr(self, 'encryption', None) is not None:
             data = self.encryption.encrypt(data)
 
-        _writer.write(data)
+        self._outbound.append(data)
+
+    def queue_framed(self, frame: bytes):
+        """Queues a packet that was already framed (and compressed) for this connection."""
+        if getattr(self, 'encryption', None) is not None:
+            frame = self.encryption.encrypt(frame)
+        self._outbound.append(frame)
+
+    async def flush(self, writer: asyncio.StreamWriter = None):
+        """Writes every queued packet at once and drains a single time."""
+        if not self._outbound:
+            return
+        _writer = self.__check(writer, False)
+        outbound, self._outbound = self._outbound, []
+        _writer.writelines(outbound)
         await _writer.drain()
+
+    def write(self, writer: asyncio.StreamWriter = None) -> int:
+        """Writes every queued packet without draining and returns the bytes still buffered."""
+        _writer = self.__check(writer, False)
+        if self._outbound:
+            outbound, self._outbound = self._outbound, []
+            _writer.writelines(outbound)
+        return _writer.transport.get_write_buffer_size()
+
+    @asynccontextmanager
+    async def batch(self, drain: bool = True):
+        """Sends the packets queued inside it together; drain=False only writes them, so the caller never waits on a slow client."""
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+        if not self._batching:
+            if drain:
+                await self.flush()
+            else:
+                self.write()
+
+    async def send(self, data: bytes, writer: asyncio.StreamWriter = None):
+        self.queue(data)
+        if not self._batching:
+            await self.flush(writer)
+
+    async def send_framed(self, frame: bytes, writer: asyncio.StreamWriter = None):
+        self.queue_framed(frame)
+        if not self._batching:
+            await self.flush(writer)
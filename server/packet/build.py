@@ -1,17 +1,28 @@
 from server.packet import Packet
 from server.player import Player
+from contextlib import contextmanager
+from server.vars import Var
 from typing import Callable
-from struct import pack
-from io import BytesIO
+from struct import Struct
 import asyncio
 
+_byte = Struct('>b')
+_ubyte = Struct('>B')
+_short = Struct('>h')
+_int = Struct('>i')
+_long = Struct('>q')
+_ulong = Struct('>Q')
+_float = Struct('>f')
+_double = Struct('>d')
+
 class Build:
-    def __init__(self, packet_id: int, writer: asyncio.StreamWriter | Player = None, send: bool = True):
+    def __init__(self, packet_id: int | None, writer: asyncio.StreamWriter | Player = None, send: bool = True):
         self._writer = writer
         self._send = send
-        self._stream = BytesIO()
+        self._buffer = bytearray()
 
-        self.varint(packet_id)
+        if packet_id is not None: # None builds a bare fragment of a packet
+            self.varint(packet_id)
 
     async def __aenter__(self):
         return self
@@ -24,81 +35,82 @@ class Build:
                 packet = self._writer.packet
             else:
                 packet = Packet(writer=self._writer)
-            await packet.send(self._stream.getvalue())
+            await packet.send(self.get())
 
-        self._stream.close()
         del self
 
     def get(self) -> bytes:
         """Raw payload."""
-        return self._stream.getvalue()
+        return bytes(self._buffer)
+
+    @contextmanager
+    def prefixed(self):
+        """Prefixes everything written inside the block with its VarInt byte length."""
+        start = len(self._buffer)
+        yield self
+        self._buffer[start:start] = Var.write_varint(len(self._buffer) - start)
 
     #-----------------------------------------------------------
 
     def varint(self, value: int):
-        while True:
-            temp = value & 0x7F
+        if 0 <= value < 0x80:
+            self._buffer.append(value)
+        elif 0 <= value < 0x4000:
+            buffer = self._buffer
+            buffer.append((value & 0x7F) | 0x80)
+            buffer.append(value >> 7)
+        else:
+            value &= 0xFFFFFFFF
+            out = bytearray()
+            while True:
+                temp = value & 0x7F
+                value >>= 7
+                if value != 0:
+                    out.append(temp | 0x80)
+                else:
+                    out.append(temp)
+                    break
+            self._buffer += out
+
+    def varlong(self, value: int):
+        value &= 0xFFFFFFFFFFFFFFFF
+        while value >= 0x80:
+            self._buffer.append((value & 0x7F) | 0x80)
             value >>= 7
-            if value != 0:
-                self._stream.write(bytes([temp | 0x80]))
-            else:
-                self._stream.write(bytes([temp]))
-                break
+        self._buffer.append(value)
 
     def string(self, text: str):
         encoded = text.encode("utf-8")
         self.varint(len(encoded))
-        self._stream.write(encoded)
+        self.raw(encoded)
 
     def long(self, value: int):
-        self._stream.write(value.to_bytes(8, byteorder='big', signed=True))
+        self._buffer += _long.pack(value)
 
     def raw(self, value: bytes):
-        self._stream.write(value)
+        self._buffer += value
 
     def bool(self, value: bool):
-        self._stream.write(b'\x01' if value else b'\x00')
+        self._buffer.append(1 if value else 0)
 
     def text(self, component):
-        import io
-
         def encode_string(s: str) -> bytes:
             return len(s).to_bytes(2, 'big') + s.encode('utf-8')
 
         def encode_field(name: str, value: str):
-            self._stream.write(b'\x08')
-            self._stream.write(encode_string(name))
-            self._stream.write(encode_string(value))
-
-        class _MiniChatEncoder:
-            def __init__(self, stream):
-                self._stream = stream
-
-            def encode_string(self, s: str) -> bytes:
-                return len(s).to_bytes(2, 'big') + s.encode('utf-8')
-
-            def encode_field(self, name: str, value: str):
-                self._stream.write(b'\x08')
-                self._stream.write(self.encode_string(name))
-                self._stream.write(self.encode_string(value))
-
-            def encode_component(self, obj: dict):
-                self._stream.write(b'\x0a')  # Begin compound
-                if "color" in obj:
-                    self.encode_field("color", obj["color"])
-                if "text" in obj:
-                    self.encode_field("text", obj["text"])
-                self._stream.write(b'\x00')  # End compound
+            self.raw(b'\x08')
+            self.raw(encode_string(name))
+            self.raw(encode_string(value))
 
         def encode_component(obj: dict):
-            self._stream.write(b'\x0a')  # Begin compound
+            self.raw(b'\x0a')  # Begin compound
 
             if "extra" in obj:
                 if "color" in obj:
                     encode_field("color", obj["color"])
 
-                self._stream.write(b'\x00\x05extra')
-                self._stream.write(b'\n\x00\x00\x00' + len(obj["extra"]).to_bytes(1, 'big'))
+                self.raw(b'\x00\x05extra')
+                self.raw(b'\n\x00\x00\x00' + len(obj["extra"]).to_bytes(1, 'big'))
 
                 for child in obj["extra"]:
                     if isinstance(child, str):
@@ -106,17 +118,18 @@ class Build:
                     elif not isinstance(child, dict):
                         raise TypeError("Each item in 'extra' must be a dict or str")
 
-                    nested_buf = io.BytesIO()
-                    _MiniChatEncoder(nested_buf).encode_component(child)
-                    nested_data = nested_buf.getvalue()
-                    self._stream.write(nested_data[1:-1])  # Strip outer compound tags
+                    # Children are written in place, without their own compound tags
+                    if "color" in child:
+                        encode_field("color", child["color"])
+                    if "text" in child:
+                        encode_field("text", child["text"])
             else:
                 if "color" in obj:
                     encode_field("color", obj["color"])
                 if "text" in obj:
                     encode_field("text", obj["text"])
 
-            self._stream.write(b'\x00')  # End compound
+            self.raw(b'\x00')  # End compound
 
         # Normalize input and call encoder
         if isinstance(component, list):
@@ -137,64 +150,30 @@ class Build:
         for item in array:
             func(item)
 
+    def byte_array(self, value: bytes):
+        self.varint(len(value))
+        self.raw(value)
+
     def double(self, value: float):
-        from struct import pack
-        self._stream.write(pack('>d', value))
+        self._buffer += _double.pack(value)
 
     def float(self, value: float):
-        from struct import pack
-        self._stream.write(pack('>f', value))
+        self._buffer += _float.pack(value)
 
     def byte(self, value: int, signed=True):
-        self._stream.write(value.to_bytes(1, byteorder='big', signed=signed))
+        self._buffer += (_byte if signed else _ubyte).pack(value)
 
     def short(self, value: int):
-        from struct import pack
-        self._stream.write(pack('>h', value))
+        self._buffer += _short.pack(value)
 
     def int(self, value: int):
-        self._stream.write(value.to_bytes(4, byteorder='big', signed=True))
+        self._buffer += _int.pack(value)
 
     def fixed_bytes(self, size: int, signed: bool = True) -> Callable[[int], None]:
         def write_fn(value: int):
-            self._stream.write(value.to_bytes(size, byteorder='big', signed=signed))
+            self.raw(value.to_bytes(size, byteorder='big', signed=signed))
         return write_fn
 
-    def data_array(self, palette_indices: list[int], bits_per_entry: int):
-        if bits_per_entry == 0:
-            return  # empty
-
-        longs = []
-        current_long = 0
-        bits_used = 0
-
-        for index in palette_indices:
-            if bits_used + bits_per_entry > 64:
-                # Pad and store the current long
-                longs.append(current_long)
-                current_long = 0
-                bits_used = 0
-
-            # Insert the index into the current long
-            assert index < (1 << bits_per_entry), f"Index {index} out of bounds for {bits_per_entry} bits"
-            current_long |= index << bits_used
-
-            bits_used += bits_per_entry
-
-            if bits_used == 64:
-                longs.append(current_long)
-                current_long = 0
-                bits_used = 0
-
-        # Don't forget the last long
-        if bits_used > 0:
-            longs.append(current_long)
-
-        # Write the longs as big-endian
-        self.varint(len(longs))  # write number of longs
-        for value in longs:
-            self.long(value)
-
     def position(self, x: int, y: int, z: int):
         # Ensure values are within valid ranges
         if not (-33554432 <= x <= 33554431):
@@ -208,4 +187,4 @@ class Build:
         y &= 0xFFF      # 12 bits
         z &= 0x3FFFFFF  # 26 bits
 
-        self._stream.write(pack(">Q", ((x << 38) | (z << 12) | y)))
+        self._buffer += _ulong.pack((x << 38) | (z << 12) | y)
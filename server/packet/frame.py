@@ -0,0 +1,80 @@
+import asyncio
+
+def split_frame(buffer: bytes | bytearray, offset: int, limit: int) -> tuple[bytes, int] | None:
+    """Returns (frame, offset after it) for the frame at `offset`, or None while it is incomplete."""
+    from server.world.engine import ClientSideError
+    end = len(buffer)
+    i = offset
+    length = 0
+    shift = 0
+    while True:
+        if i >= end:
+            return None
+        byte = buffer[i]
+        i += 1
+        length |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+        shift += 7
+        if shift >= 35:
+            raise ClientSideError("VarInt too big")
+
+    if length > limit:
+        raise ClientSideError(f"Frame of {length} bytes exceeds the limit of {limit}")
+    if end - i < length:
+        return None
+    return bytes(buffer[i:i + length]), i + length
+
+class FrameDecoder:
+    """Splits a (possibly encrypted) stream into length-prefixed frames of at most `limit` bytes."""
+    CHUNK_SIZE = 65536
+
+    def __init__(self, reader: asyncio.StreamReader, limit: int = 2097151):
+        self.reader = reader
+        self.limit = limit
+        self.decryption = None
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def set_decryption(self, cipher):
+        """Everything still buffered after the current frame was sent encrypted."""
+        pending = bytes(self._buffer[self._offset:])
+        self._buffer = bytearray(cipher.decrypt(pending) if pending else b"")
+        self._offset = 0
+        self.decryption = cipher
+
+    def feed(self, data: bytes):
+        if self.decryption is not None:
+            data = self.decryption.decrypt(data)
+        self._buffer += data
+
+    def pending(self) -> int:
+        return len(self._buffer) - self._offset
+
+    def next_frame(self) -> bytes | None:
+        """Returns the next complete frame from the buffer, or None if more data is needed."""
+        found = split_frame(self._buffer, self._offset, self.limit)
+        if found is None:
+            return None
+        frame, self._offset = found
+        return frame
+
+    async def read(self) -> bytes:
+        from server.world.engine import ClientSideError
+        while True:
+            frame = self.next_frame()
+            if frame is not None:
+                return frame
+
+            # Drop consumed frames before growing the buffer
+            if self._offset:
+                del self._buffer[:self._offset]
+                self._offset = 0
+
+            try:
+                chunk = await self.reader.read(self.CHUNK_SIZE)
+            except Exception:
+                raise ConnectionResetError
+            if not chunk:
+                raise ClientSideError("Unexpected end of stream while reading frame")
+            self.feed(chunk)
@@ -1,47 +1,68 @@
-from io import BytesIO
-from struct import unpack
+from struct import Struct
+
+_short = Struct('>h')
+_int = Struct('>i')
+_long = Struct('>q')
+_float = Struct('>f')
+_double = Struct('>d')
 
 class Parse:
+    """Reads packet fields straight out of a memoryview with an integer cursor."""
     def __init__(self, data: bytes):
         self.data = data
-        self.stream = None
+        self.view = memoryview(data)
+        self.pos = 0
 
     def __enter__(self):
-        self.stream = BytesIO(self.data)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stream.close()
+        self.view.release()
 
     def varint(self) -> int:
-        num = 0
-        shift = 0
-        while True:
-            byte = self.stream.read(1)
-            if not byte:
-                raise EOFError("Unexpected end of data while reading varint")
-            b = byte[0]
-            num |= (b & 0x7F) << shift
+        view = self.view
+        pos = self.pos
+        try:
+            b = view[pos]
             if not (b & 0x80):
-                break
-            shift += 7
-            if shift > 35:
-                raise ValueError("Varint too big")
+                self.pos = pos + 1
+                return b
+
+            num = b & 0x7F
+            shift = 7
+            while True:
+                pos += 1
+                b = view[pos]
+                num |= (b & 0x7F) << shift
+                if not (b & 0x80):
+                    break
+                shift += 7
+                if shift > 28:
+                    raise ValueError("Varint too big")
+        except IndexError:
+            raise EOFError("Unexpected end of data while reading varint")
+        self.pos = pos + 1
         return num
 
     def string(self) -> str:
         length = self.varint()
-        raw = self.stream.read(length)
-        if len(raw) < length:
+        end = self.pos + length
+        if end > len(self.view):
             raise EOFError("Unexpected end of data while reading string")
-        return raw.decode("utf-8")
+        text = str(self.view[self.pos:end], "utf-8")
+        self.pos = end
+        return text
 
     def short(self) -> int:
         """Decodes a 2-byte signed short integer from big-endian bytes."""
-        return unpack('>h', self.stream.read(2))[0]
-    
+        pos = self.pos
+        self.pos = pos + 2
+        return _short.unpack_from(self.view, pos)[0]
+
     def long(self) -> int:
-        return int.from_bytes(self.stream.read(8), byteorder='big', signed=True)
+        pos = self.pos
+        self.pos = pos + 8
+        return _long.unpack_from(self.view, pos)[0]
 
     def position(self) -> tuple[int, int, int]:
         value = self.long()
@@ -78,16 +99,31 @@ class Parse:
         return result
 
     def byte(self) -> bytes:
-        return self.stream.read(1)
+        pos = self.pos
+        self.pos = min(pos + 1, len(self.view))
+        return self.view[pos:self.pos].tobytes()
 
     def rest(self) -> bytes:
-        return self.stream.read()
+        pos = self.pos
+        self.pos = len(self.view)
+        return self.view[pos:].tobytes()
 
     def double(self) -> float:
-        return unpack('>d', self.stream.read(8))[0]
+        pos = self.pos
+        self.pos = pos + 8
+        return _double.unpack_from(self.view, pos)[0]
+
+    def float(self) -> float:
+        pos = self.pos
+        self.pos = pos + 4
+        return _float.unpack_from(self.view, pos)[0]
 
     def bool(self) -> bool:
-        return bool.from_bytes(self.stream.read(1))
+        pos = self.pos
+        if pos >= len(self.view):
+            raise EOFError("Unexpected end of data")
+        self.pos = pos + 1
+        return self.view[pos] != 0
 
     def hashed_slot(self) -> dict:
         if not self.bool(): return {"hasItem":False}
@@ -100,4 +136,19 @@ class Parse:
         return slot
 
     def int(self) -> int:
-        return int.from_bytes(self.stream.read(4), byteorder='big', signed=True)
\ No newline at end of file
+        pos = self.pos
+        self.pos = pos + 4
+        return _int.unpack_from(self.view, pos)[0]
+
+    def bytes(self, length: int) -> memoryview:
+        """The next `length` bytes, without copying them out of the packet."""
+        end = self.pos + length
+        if end > len(self.view):
+            raise EOFError("Unexpected end of data")
+        chunk = self.view[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def byte_array(self) -> memoryview:
+        """A VarInt length-prefixed byte array."""
+        return self.bytes(self.varint())
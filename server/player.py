@@ -6,28 +6,79 @@ import asyncio
 logger = logger.create_sub_logger("world", ["ALL"])
 
 class Player:
-    def __init__(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter):
+    """Everything the server tracks per connection, None until it is known."""
+    __slots__ = (
+        "reader", "writer", "packet", "world",
+        # Session
+        "username", "uuid", "Id", "brand", "info", "configured", "ip",
+        # Position, None until the client first reports it
+        "x", "y", "z", "yaw", "pitch", "chunk_x", "chunk_z",
+        # Packets waiting for the next tick, and the server the player asked to be sent to
+        "inbox", "transfer",
+        # Blocks only this player sees, and those still to be sent to them
+        "overlay", "changes",
+        # Lobby floor tile under the player, highlighted in white
+        "tile",
+        # Timers on the shared wheel, and what the keepalives measured
+        "deadline", "keepAlive", "keepAliveId", "keepAliveTimer", "ping", "lastAction", "idleTimer",
+    )
+
+    def __init__(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter, packet:Packet=None):
         self.reader = reader
         self.writer = writer
+        self.packet = packet or Packet(reader, writer)
+        self.world = None
+        self.state = "login"
 
+        self.username = None
+        self.uuid = None
+        self.Id = None
+        self.brand = None
         self.info = {}
-        self.state = "login"
-        self.packet = Packet(reader, writer)
+        self.configured = False
+        self.ip = ""
+
+        self.x = self.y = self.z = None
+        self.yaw = self.pitch = 0.0
+        self.chunk_x = self.chunk_z = None
+        self.tile = None
+
+        self.inbox = None
+        self.transfer = None
+        self.overlay = None
+        self.changes = None
+
+        self.deadline = None # Login has to finish before this fires
+        self.keepAlive = 0.0 # When the outstanding keepalive was sent
+        self.keepAliveId = None
+        self.keepAliveTimer = None # Next keepalive, or the timeout of the outstanding one
+        self.ping = None # Last keepalive round trip in ms
+        self.lastAction = 0 # Timer wheel tick of the last movement
+        self.idleTimer = None
+
+    @property
+    def state(self) -> str:
+        return self.packet.state
+
+    @state.setter
+    def state(self, state:str):
+        self.packet.set_state(state)
+
+    async def flush(self):
+        await self.packet.flush()
+
+    def write(self) -> int:
+        return self.packet.write()
 
-        class Data:
-            def __init__(self):
-                self.lock = asyncio.Lock()
-        self.data = Data()
+    def batch(self, drain:bool=True):
+        return self.packet.batch(drain)
 
     async def disconnect(self, message:set):
-        if self in self.world.players:
-            from server.packet.build import Build
-            self.world.players.remove(self)
-            async with Build({'l':0x00, 'c':0x02, 'p':0x1C}[self.state[0].lower()], self) as build:
-                if self.state[0].lower() == "p":
-                    self.world.engine.playerIds.remove(self.Id)
-                if self.state[0].lower() in ["c","p"]:
-                    build.text(message)
-                else:
-                    build.string(dumps(message, separators=(",", ":")))
-            logger.info(f"Player {getattr(self, "username", "Unknown")} disconnected")
+        """Tells the client why it is being dropped. Leaving the world happens once the connection closes."""
+        from server.packet.build import Build
+        async with Build({'l':0x00, 'c':0x02, 'p':0x1C}[self.state[0].lower()], self) as build:
+            if self.state[0].lower() in ["c","p"]:
+                build.text(message)
+            else:
+                build.string(dumps(message, separators=(",", ":")))
+        logger.info(f"Player {self.username or "Unknown"} disconnected")
@@ -1,4 +1,6 @@
 from server.config import config
+from server.vars import Var
+from json import dumps
 
 MOTD_DATA = {
     "version": {
@@ -7,7 +9,7 @@ MOTD_DATA = {
     },
     "players": {
         "max": 1,  # Large number creates display space
-        "online": 1,  # Must be ≥1 (zero hides hover in some clients)
+        "online": 0,  # Kept up to date by set_players_online() as players join and leave
         "sample": [
             {
                 "name": "§aMain Text Line", 
@@ -25,4 +27,49 @@ MOTD_DATA = {
     "favicon": config.icon(),  # Optional
     "enforcesSecureChat": False,  # Important for 1.19+ clients
     "previewsChat": False  # Important for 1.19+ clients
-}
\ No newline at end of file
+}
+
+_status = {}
+_legacy = None
+
+def status_response(protocol:int) -> bytes:
+    """The framed Status Response for a protocol version, encoded once and reused for every ping."""
+    if MOTD_DATA["version"]["protocol"] != -1:
+        protocol = MOTD_DATA["version"]["protocol"] # Every client gets the same answer
+    response = _status.get(protocol)
+    if response is None:
+        if len(_status) >= 64: # Clients pick the protocol number, keep the cache small
+            _status.clear()
+        payload = b"\x00" + Var.write_string(dumps({**MOTD_DATA, "version": {**MOTD_DATA["version"], "protocol": protocol}}))
+        response = _status[protocol] = Var.write_varint(len(payload)) + payload
+    return response
+
+def legacy_status_response() -> bytes:
+    """The kick packet pre-1.7 clients and crawlers expect in reply to a 0xFE ping, encoded once."""
+    global _legacy
+    if _legacy is None:
+        motd = MOTD_DATA["description"]["text"].replace("\n", " ")
+        fields = ["§1", MOTD_DATA["version"]["protocol"], MOTD_DATA["version"]["name"], motd, MOTD_DATA["players"]["online"], MOTD_DATA["players"]["max"]]
+        text = "\0".join(str(field) for field in fields).encode("utf-16-be")
+        _legacy = b"\xff" + (len(text) // 2).to_bytes(2, "big") + text # Length is in UTF-16 code units
+    return _legacy
+
+def invalidate_status():
+    global _legacy
+    _status.clear()
+    _legacy = None
+
+def set_players_online(online:int):
+    if MOTD_DATA["players"]["online"] != online:
+        MOTD_DATA["players"]["online"] = online
+        invalidate_status()
+
+def reload():
+    """Re-reads server.properties and the server icon into the status response."""
+    config.load()
+    MOTD_DATA["description"]["text"] = config.get("motd").replace("\\n", "\n")
+    MOTD_DATA["favicon"] = config.icon()
+    invalidate_status()
+
+    from server.world.states.configuration import invalidate_intro
+    invalidate_intro() # The known packs name the configured version
@@ -0,0 +1,40 @@
+from server.world.engine import JoinGameError
+from server.config import config
+import asyncio, aiohttp
+
+class SessionServer:
+    """Non-blocking, pooled client for the session server's hasJoined check."""
+    def __init__(self):
+        self._session = None
+        self._limit = None
+
+    def _client(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=int(config.get("session-server-connections", "16")), keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=float(config.get("session-server-timeout", "5"))),
+            )
+            self._limit = asyncio.Semaphore(int(config.get("session-server-concurrency", "64")))
+        return self._session
+
+    async def has_joined(self, username:str, server_hash:str) -> dict:
+        """Returns the player's profile, or raises JoinGameError if the session can't be verified."""
+        client = self._client()
+        url = config.get("session-server", "https://sessionserver.mojang.com").rstrip("/") + "/session/minecraft/hasJoined"
+
+        async with self._limit:
+            try:
+                async with client.get(url, params={"username": username, "serverId": server_hash}) as resp:
+                    if resp.status != 200:
+                        raise JoinGameError("Mojang authentication failed")
+                    return await resp.json(content_type=None)
+            except asyncio.TimeoutError:
+                raise JoinGameError("Mojang authentication timed out")
+            except aiohttp.ClientError as e:
+                raise JoinGameError(f"Mojang authentication unavailable: {e}")
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+session = SessionServer()
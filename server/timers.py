@@ -0,0 +1,89 @@
+from server.logger import logger
+from traceback import format_exc
+from time import monotonic
+from math import ceil
+
+logger = logger.create_sub_logger("timers")
+
+class Timer:
+    __slots__ = ("due", "callback", "args", "cancelled", "slot")
+
+    def __init__(self, due:int, callback, args:tuple):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.slot = None # The wheel slot holding this timer, until it fires
+
+    def cancel(self):
+        self.cancelled = True
+        if self.slot is not None:
+            del self.slot[self]
+            self.slot = None
+
+class TimerWheel:
+    """Hierarchical timing wheel for connection deadlines, shared by every connection."""
+    SLOTS = 64
+    BITS = 6
+    LEVELS = 4
+
+    def __init__(self, resolution:float = 0.05):
+        self.resolution = resolution
+        self.tick = int(monotonic() / resolution)
+        self.levels = [[{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)] # Slots are ordered sets of timers
+
+    def schedule(self, delay:float, callback, *args) -> Timer:
+        """Awaits `callback(*args)` once `delay` seconds have passed, give or take a tick."""
+        timer = Timer(self.tick + max(1, ceil(delay / self.resolution)), callback, args)
+        self._insert(timer, self.tick)
+        return timer
+
+    def _insert(self, timer:Timer, now:int):
+        bits = self.BITS
+        for level in range(self.LEVELS):
+            # Same block one level up, so this level's slot comes around before it wraps
+            if timer.due >> (bits * (level + 1)) == now >> (bits * (level + 1)):
+                break
+        else:
+            level = self.LEVELS - 1
+            timer.due = ((now >> (bits * self.LEVELS)) + 1 << (bits * self.LEVELS)) - 1
+        timer.slot = self.levels[level][(timer.due >> (bits * level)) & (self.SLOTS - 1)]
+        timer.slot[timer] = None
+
+    def _cascade(self, level:int, now:int):
+        slots = self.levels[level]
+        index = (now >> (self.BITS * level)) & (self.SLOTS - 1)
+        timers, slots[index] = slots[index], {}
+        for timer in timers:
+            self._insert(timer, now)
+
+    async def advance(self):
+        """Fires everything that came due since the last call."""
+        target = int(monotonic() / self.resolution)
+        mask = self.SLOTS - 1
+        while self.tick < target:
+            self.tick += 1
+            tick = self.tick
+            if not tick & mask:
+                # Refill from the coarsest level that wrapped down to level 1
+                level = 1
+                while level < self.LEVELS - 1 and not (tick >> (self.BITS * level)) & mask:
+                    level += 1
+                for cascade in range(level, 0, -1):
+                    self._cascade(cascade, tick)
+
+            slots = self.levels[0]
+            due, slots[tick & mask] = slots[tick & mask], {}
+            for timer in due:
+                timer.slot = None # So a callback cancelling a later timer in `due` doesn't touch the slot
+            for timer in due:
+                if timer.cancelled:
+                    continue
+                try:
+                    await timer.callback(*timer.args)
+                except (ConnectionError, OSError):
+                    pass # The connection went away before its timer was cancelled
+                except Exception:
+                    logger.error(f"Timer callback failed:\n{format_exc()}")
+
+timers = TimerWheel()
@@ -4,157 +4,310 @@ from server.logger import logger as log
 logger = log.create_sub_logger("world")
 
 from server.packet.build import Build
-from server.packet.parse import Parse
 from server.player import Player
 from server.config import config
+from server.metrics import metrics
+from server.properties import set_players_online
+from server.world.dispatch import dispatch
+from server.world.changes import BlockChanges
+from server.world.chunk import Chunk, lobby_chunk
+from server.timers import timers
+from server.palette import palette
+from itertools import count
+from collections import deque
+from math import floor
 import time, asyncio
 
+async def read(player:Player):
+    """Moves decoded packets into the player's inbox until the connection ends, then queues None."""
+    try:
+        while True:
+            data = await player.packet.recv()
+            if data[:1] == b'\x1a': # Keepalives skip the inbox so the round trip doesn't include the wait for a tick
+                await dispatch("play", player, data)
+                continue
+            player.inbox.append(data)
+    except ConnectionResetError: pass
+    except Exception as e:
+        from traceback import format_exc
+        if not isinstance(e, ClientSideError):
+            logger.error(f"Exception caught:\n{format_exc()}")
+    player.inbox.append(None)
+
 class World:
-    def __init__(self, player:Player):
-        self.player = player
-        self.keepAlive = time.time()
+    """A world shared by every player in it, with per-player overlays on top."""
+    def __init__(self, chunks):
+        self.players = {} # Player -> future resolving with their transfer address
+        self.chunks = {(chunk.x, chunk.z): chunk for chunk in chunks}
+        self.changes = BlockChanges()
 
-    async def tick(self):
-        from server.packet.build import Build
-        while True:
-            try: data = await asyncio.wait_for(self.player.packet.recv(), timeout=0.05)
-            except (asyncio.TimeoutError, ConnectionResetError): pass
-            except Exception as e:
-                from traceback import format_exc
-                if not isinstance(e, ClientSideError):
-                    logger.error(f"Exception caught:\n{format_exc()}")
-                raise ConnectionResetError
-            if data: await self.message(data)
-            else: raise ConnectionResetError
-
-            if await tick(self): return self.proxy_value[0]
-
-    async def message(self, data:bytes):
-        from time import time
-        with Parse(data) as parse:
-            packet_id = parse.varint()
-            if packet_id in [0x1d,0x1c]:
-                if not hasattr(self.player, "pos"):
-                    class Position:
-                        def __init__(self):
-                            self.x = 0
-                            self.y = 0
-                            self.z = 0
-                    self.player.pos = Position()
-                self.player.pos.x = parse.double()
-                self.player.pos.y = parse.double()
-                self.player.pos.z = parse.double()
-            elif packet_id == 0x1A:
-                self.keepAlive = time()
-            elif packet_id == 0x3f:
-                parse.varint()
-                if parse.position() == (8,1,13):
-                    async with Build(0x34, self.player) as build:
-                        build.varint(1)
-                        build.varint(8)
-                        build.text({"text":"Enter server ip:"})
-                    async with Build(0x14, self.player) as build:
-                        build.varint(1)
-                        build.varint(0)
-                        build.short(0)
-                        build.varint(1)
-                        # self.player.attempts = getattr(self.player, "attempts", 0) + 1
-                        build.varint(983)#+self.player.attempts
-                        build.raw(b'\x01\x00\x05\x08\x00')
-                        build.string("mc.hypixel.net")
-                    async with Build(0x13, self.player) as build:
-                        build.varint(1)
-                        build.short(0)
-                        build.short(0)
-
-            elif packet_id == 0x2f:
-                self.player.ip = parse.string()
-                async with Build(0x13, self.player) as build:
-                    build.varint(1)
-                    build.short(0)
-                    build.short(0)
-            elif packet_id == 0x11:
-                parse.varint()
-                parse.varint()
-                check = parse.short() == 2
-                parse.byte()
-                parse.varint()
-                # def shs(): return (parse.short(), parse.hashed_slot())
-                # parse.array(shs)
-                if check and getattr(self.player, "ip", "") != "":
-                    async with Build(0x72, self.player) as build: build.text({"text":f"Atempting to connect to: {self.player.ip}","color":"green"}); build.bool(0)
-                    async with Build(0x22, self.player) as build: build.byte(6, False); build.float(0)
-
-                    if ping_minecraft_server(resolve_minecraft_srv(self.player.ip)).get("players_online",-1) > -1:
-                        async with Build(0x72, self.player) as build: build.text({"text":f"Transfering","color":"green"}); build.bool(0)
-                        async with Build(0x22, self.player) as build: build.byte(6, False); build.float(0)
-
-                        self.proxy_value = [self.player.ip]
-                    else:
-                        async with Build(0x72, self.player) as build: build.text({"text":f"Failed to connect to: {self.player.ip}","color":"red"}); build.bool(0)
-                        async with Build(0x22, self.player) as build: build.byte(6, False); build.float(0)
-
-                # logger.info(parse.rest())
+    def chunk_at(self, x:int, z:int) -> Chunk | None:
+        return self.chunks.get((x >> 4, z >> 4))
 
+    def block(self, x:int, y:int, z:int) -> int:
+        """What everyone sees at a position, air outside the loaded chunks."""
+        chunk = self.chunk_at(x, z)
+        if chunk is None:
+            return palette["minecraft:air"]
+        return chunk.get_block(x, y, z)
 
-    async def run(self):
+    def set_block(self, x:int, y:int, z:int, state:int):
+        """Changes a block for everyone, except players who overlay it."""
+        chunk = self.chunk_at(x, z)
+        if chunk is None:
+            raise ValueError(f"No chunk loaded at x={x}, z={z}")
+        if not chunk.set_block(x, y, z, state):
+            return
+        self.changes.set(x, y, z, state)
+        for player in self.players:
+            shown = player.overlay.get((x, y, z))
+            if shown is not None:
+                player.changes.set(x, y, z, shown)
+
+    def prepare(self, compression:int):
+        """Encodes every chunk ahead of the first join."""
+        for chunk in self.chunks.values():
+            chunk.frame(compression)
+
+    def show(self, player:Player, x:int, y:int, z:int, state:int):
+        """Changes a block for one player only."""
+        player.overlay[(x, y, z)] = state
+        player.changes.set(x, y, z, state)
+
+    def hide(self, player:Player, x:int, y:int, z:int):
+        """Drops a player's overlay at a position, showing them the shared block again."""
+        if player.overlay.pop((x, y, z), None) is not None:
+            player.changes.set(x, y, z, self.block(x, y, z))
+
+    async def run(self, player:Player):
         from server.world.states import login, configuration, play
 
         try:
-            await login.login(self.player, True if config.get("online-mode", "false") == "true" else False, int(config.get("network-compression-threshold", "-1")))
-            await configuration.config(self.player)
-            await play.play(self.player)
+            await login.login(player, True if config.get("online-mode", "false") == "true" else False, int(config.get("network-compression-threshold", "-1")))
+            await configuration.config(player)
+            await play.play(player, self)
         except Exception as e:
-            logger.info(f"👋 Player {getattr(self.player, 'username', 'Unknown')} caused error during world join: {e}")
+            logger.info(f"👋 Player {player.username or 'Unknown'} caused error during world join: {e}")
             raise JoinGameError
-                
-        from main import palette
-        async with Build(0x08, self.player) as build:
-            build.position(8, 1, 13)
-            build.varint(palette['minecraft:anvil']+2)
-
-        return await self.tick()
-    
-async def tick(self):
-    from server.packet.build import Build
-    from server.world import logger
-    from main import palette
-    from time import time
-    player = self.player
-    if (time() - getattr(player, "keepAliveKick", time())) > 5 and player.state == "play":
-        logger.info(f"{player.name} Timed out")
-        player.disconnect({"text":"Timed out"})
-        del player
-
-    if (time() - getattr(player, "keepAlive", 0)) > 1 and player.state == "play":
-        player.keepAlive = time()
+
+        return await self.join(player)
+
+    async def join(self, player:Player):
+        """Ticks the player with the world until they transfer or leave, resolving with the transfer address."""
+        if player.deadline is not None:
+            player.deadline.cancel()
+        player.world = self
+        player.inbox = deque() # Only touched between awaits, so a plain deque will do
+        player.overlay = {}
+        player.changes = BlockChanges()
+        reader = asyncio.create_task(read(player))
+
+        player.keepAliveTimer = timers.schedule(float(config.get("keep-alive-interval", "1")), send_keep_alive, player)
+        idle = float(config.get("player-idle-timeout", "0")) # Minutes, 0 turns it off
+        if idle > 0:
+            player.lastAction = timers.tick
+            player.idleTimer = timers.schedule(idle * 60, idle_check, player)
+
+        done = asyncio.get_running_loop().create_future()
+        self.players[player] = done
+        set_players_online(len(self.players))
+        try:
+            return await done
+        finally:
+            self.players.pop(player, None)
+            set_players_online(len(self.players))
+            reader.cancel()
+            for timer in (player.keepAliveTimer, player.idleTimer):
+                if timer is not None:
+                    timer.cancel()
+
+    async def step(self):
+        """One tick: every player's packets and tick, then the block changes."""
+        for player, done in list(self.players.items()):
+            if done.done():
+                continue
+            try:
+                async with player.batch(drain=False):
+                    while player.inbox:
+                        data = player.inbox.popleft()
+                        if data is None: raise ConnectionResetError
+                        await dispatch("play", player, data)
+
+                    if await tick(self, player): done.set_result(player.transfer)
+            except Exception as e:
+                done.set_exception(e)
+
+        # Shared changes first, so overlays queued afterwards stay on top
+        players = [player for player, done in self.players.items() if not done.done()]
+        self.changes.flush(players)
+        limit = int(config.get("write-buffer-limit", "1048576"))
+        for player in players:
+            if player.changes:
+                player.changes.flush((player,))
+            done = self.players[player]
+            try:
+                buffered = player.write()
+            except Exception as e:
+                done.set_exception(e)
+                continue
+            if buffered > limit:
+                logger.info(f"{player.username} was dropped: {buffered} bytes waiting to be read")
+                metrics.count("write-buffer-drops")
+                player.writer.transport.abort()
+                done.set_exception(ConnectionResetError("Client stopped reading"))
+
+@dispatch.on("play", 0x1c, decode=lambda parse: (parse.double(), parse.double(), parse.double()))
+async def move(player:Player, x:float, y:float, z:float):
+    player.x = x
+    player.y = y
+    player.z = z
+    player.chunk_x = floor(x) >> 4
+    player.chunk_z = floor(z) >> 4
+    player.lastAction = timers.tick
+
+@dispatch.on("play", 0x1d, decode=lambda parse: (parse.double(), parse.double(), parse.double(), parse.float(), parse.float()))
+async def move_and_rotate(player:Player, x:float, y:float, z:float, yaw:float, pitch:float):
+    await move(player, x, y, z)
+    await rotate(player, yaw, pitch)
+
+@dispatch.on("play", 0x1e, decode=lambda parse: (parse.float(), parse.float()))
+async def rotate(player:Player, yaw:float, pitch:float):
+    player.yaw = yaw
+    player.pitch = pitch
+    player.lastAction = timers.tick
+
+_keep_alive_ids = count(1)
+
+async def send_keep_alive(player:Player):
+    player.keepAliveId = next(_keep_alive_ids)
+    player.keepAlive = time.monotonic()
+    async with player.batch(drain=False):
         async with Build(0x26, player) as build:
-            build.long(0)            
-
-    if hasattr(player, "pos"):
-        if not hasattr(player, "data.m"): player.data.m = [0,0]
-        n = lambda c: int(c-1) if c < 0 else int(c)
-        x = player.pos.x
-        z = player.pos.z
-        if (0 < x < 1) and (0 < z < 1): x,z = 0,0
-        m = [n(x),n(z)]
-        # async with Build(0x50, player) as build: build.text({"text":f"M: {[x,z]}; {m}{f", P: {player.data.p}" if hasattr(player.data, "p") else ""}"})
-        if player.data.m != m or (m == [0,0] and getattr(player.data, "bonce", 0) == 0):
-            if m == [0,0]: player.data.bonce = 1
-            else: player.data.bonce = 0
-            player.data.m = m
-            if not hasattr(player.data, "p"): player.data.p = [0,0]
-            # async with Build(0x50, player) as build: build.text({"text":f"M: {m}, P: {player.data.p}"})
-
-            block = lambda pos: "minecraft:gray_concrete" if ((pos[0] // 2) % 2) == ((pos[1] // 2) % 2) else "minecraft:light_gray_concrete"
-            async with Build(0x08, player) as build:
-                build.position(player.data.p[0],0,player.data.p[1])
-                build.varint(palette[block(player.data.p)])
-            async with Build(0x08, player) as build:
-                build.position(m[0],0,m[1])
-                build.varint(palette["minecraft:white_concrete"])
-                # player.executed = 0
-            player.data.p = m
-
-    if getattr(self, "proxy_value", ""):
-        return True
\ No newline at end of file
+            build.long(player.keepAliveId)
+    player.keepAliveTimer = timers.schedule(float(config.get("keep-alive-timeout", "5")), kick, player, "Timed out")
+
+@dispatch.on("play", 0x1A, decode=lambda parse: (parse.long(),))
+async def keep_alive(player:Player, keep_alive_id:int):
+    if keep_alive_id != player.keepAliveId:
+        return # Late answer to a keepalive that already timed out, or made up
+    rtt = time.monotonic() - player.keepAlive
+    player.ping = round(rtt * 1000)
+    metrics.timing("keepalive-rtt", rtt)
+
+    player.keepAliveId = None
+    player.keepAliveTimer.cancel()
+    player.keepAliveTimer = timers.schedule(float(config.get("keep-alive-interval", "1")), send_keep_alive, player)
+
+async def idle_check(player:Player):
+    idle = float(config.get("player-idle-timeout", "0")) * 60
+    remaining = idle - (timers.tick - player.lastAction) * timers.resolution
+    if remaining > 0: # Moved since this was scheduled
+        player.idleTimer = timers.schedule(remaining, idle_check, player)
+    else:
+        await kick(player, "You have been idle for too long!")
+
+async def kick(player:Player, reason:str):
+    logger.info(f"{player.username} was kicked: {reason}")
+    try:
+        async with player.batch(drain=False):
+            await player.disconnect({"text":reason})
+    finally:
+        if player.writer.transport.get_write_buffer_size():
+            player.writer.transport.abort() # Not reading, so the reason would never get through anyway
+        else:
+            player.writer.close()
+
+@dispatch.on("play", 0x3f, decode=lambda parse: (parse.varint(), parse.position()))
+async def use_item_on(player:Player, hand:int, position:tuple[int, int, int]):
+    if position == (8,1,13):
+        async with Build(0x34, player) as build:
+            build.varint(1)
+            build.varint(8)
+            build.text({"text":"Enter server ip:"})
+        async with Build(0x14, player) as build:
+            build.varint(1)
+            build.varint(0)
+            build.short(0)
+            build.varint(1)
+            # player.attempts = getattr(player, "attempts", 0) + 1
+            build.varint(983)#+player.attempts
+            build.raw(b'\x01\x00\x05\x08\x00')
+            build.string("mc.hypixel.net")
+        async with Build(0x13, player) as build:
+            build.varint(1)
+            build.short(0)
+            build.short(0)
+
+@dispatch.on("play", 0x2f, decode=lambda parse: (parse.string(),))
+async def rename_item(player:Player, name:str):
+    player.ip = name
+    async with Build(0x13, player) as build:
+        build.varint(1)
+        build.short(0)
+        build.short(0)
+
+@dispatch.on("play", 0x11, decode=lambda parse: (parse.varint(), parse.varint(), parse.short(), parse.byte(), parse.varint()))
+async def click_container(player:Player, window:int, state:int, slot:int, button:bytes, mode:int):
+    # def shs(): return (parse.short(), parse.hashed_slot())
+    # parse.array(shs)
+    if slot == 2 and player.ip != "":
+        async with Build(0x72, player) as build: build.text({"text":f"Atempting to connect to: {player.ip}","color":"green"}); build.bool(0)
+        async with Build(0x22, player) as build: build.byte(6, False); build.float(0)
+
+        if ping_minecraft_server(resolve_minecraft_srv(player.ip)).get("players_online",-1) > -1:
+            async with Build(0x72, player) as build: build.text({"text":f"Transfering","color":"green"}); build.bool(0)
+            async with Build(0x22, player) as build: build.byte(6, False); build.float(0)
+
+            player.transfer = player.ip
+        else:
+            async with Build(0x72, player) as build: build.text({"text":f"Failed to connect to: {player.ip}","color":"red"}); build.bool(0)
+            async with Build(0x22, player) as build: build.byte(6, False); build.float(0)
+
+async def tick(world:World, player:Player):
+    if player.x is not None:
+        tile = (floor(player.x), floor(player.z))
+        # async with Build(0x50, player) as build: build.text({"text":f"M: {tile}, P: {player.tile}"})
+        if tile != player.tile:
+            if player.tile is not None:
+                world.hide(player, player.tile[0], 0, player.tile[1])
+            world.show(player, tile[0], 0, tile[1], palette["minecraft:white_concrete"])
+            player.tile = tile
+
+    if player.transfer is not None:
+        return True
+
+class Scheduler:
+    """The one tick loop every World runs on, stepping them all once per `ticks-per-second` boundary."""
+    def __init__(self):
+        self.worlds = []
+
+    def add(self, world:World):
+        self.worlds.append(world)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / float(config.get("ticks-per-second", "20"))
+        while True:
+            start = loop.time()
+            await timers.advance()
+            for world in self.worlds:
+                try:
+                    await world.step()
+                except Exception:
+                    from traceback import format_exc
+                    logger.error(f"Exception caught while stepping a world:\n{format_exc()}")
+
+            elapsed = loop.time() - start
+            metrics.timing("tick", elapsed)
+            if elapsed > interval:
+                metrics.count("tick-overruns")
+
+            # A tick that overran skips the boundaries it missed instead of bursting
+            now = loop.time()
+            await asyncio.sleep((now // interval + 1) * interval - now)
+
+scheduler = Scheduler()
+
+lobby = World(lobby_chunk(x, z) for x in range(-2, 3) for z in range(-2, 3))
+lobby.chunk_at(8, 13).set_block(8, 1, 13, palette["minecraft:anvil"] + 2) # Opens the server picker when used
+scheduler.add(lobby)
@@ -0,0 +1,50 @@
+from server.packet.build import Build
+from server.player import Player
+from server.packet import Packet
+from struct import Struct
+
+_section = Struct('>Q')
+
+class BlockChanges:
+    """Block changes collected during a tick and sent together when it ends."""
+    def __init__(self):
+        self.sections = {}
+
+    def __len__(self) -> int:
+        return sum(len(blocks) for blocks in self.sections.values())
+
+    def set(self, x:int, y:int, z:int, state:int):
+        local = ((x & 15) << 8) | ((z & 15) << 4) | (y & 15)
+        self.sections.setdefault((x >> 4, y >> 4, z >> 4), {})[local] = state
+
+    def packets(self) -> list[bytes]:
+        """Payloads for everything collected so far, which is then forgotten."""
+        sections, self.sections = self.sections, {}
+        payloads = []
+        for (sx, sy, sz), blocks in sections.items():
+            if len(blocks) == 1:
+                (local, state), = blocks.items()
+                build = Build(0x08, send=False)
+                build.position((sx << 4) | (local >> 8), (sy << 4) | (local & 15), (sz << 4) | ((local >> 4) & 15))
+                build.varint(state)
+            else:
+                build = Build(0x4D, send=False)
+                build.raw(_section.pack(((sx & 0x3FFFFF) << 42) | ((sz & 0x3FFFFF) << 20) | (sy & 0xFFFFF)))
+                build.varint(len(blocks))
+                for local, state in blocks.items():
+                    build.varlong((state << 12) | local)
+            payloads.append(build.get())
+        return payloads
+
+    def flush(self, viewers:list[Player]):
+        """Queues the collected changes for every viewer, or nothing if there are none."""
+        if not self.sections:
+            return
+        payloads = self.packets()
+        frames = {}
+        for player in viewers:
+            compression = player.packet.compression
+            frame = frames.get(compression)
+            if frame is None:
+                frame = frames[compression] = b"".join(Packet.frame(data, compression) for data in payloads)
+            player.packet.queue_framed(frame)
@@ -1,104 +1,103 @@
 from server.packet.build import Build
-from server.player import Player
-
-def get_block(x, y, z):
-    return 'minecraft:air'
-
-async def section(blocks, section, preset=1):
-    async with Build(0x00, send=False) as build:
-        build.short(blocks) #Block count
-
-        if preset == 0:
-            if section == 0:
-                build.byte(0) #Bytes per entry
-                build.varint(10)
-            else:
-                from main import palette as pallete
-                from math import ceil, log2
-
-                unique_states = []
-                state_to_index = {}
-
-                bpe = max(4, ceil(log2(len(pallete))))
-                build.byte(bpe)
-
-                for y in range(16):
-                    for z in range(16):
-                        for x in range(16):
-                            state = get_block(x, y, z)  #'minecraft:stone'
-                            # state = "minecraft:stone"
-                            if state not in state_to_index:
-                                index = len(unique_states)
-                                unique_states.append(state)
-                                state_to_index[state] = index
-
-                palette = [pallete[state] for state in unique_states]
-
-                build.varint(len(palette))
-                for global_id in palette:
-                    build.varint(global_id)
-
-                indexes = []
-                for y in range(16):
-                    for z in range(16):
-                        for x in range(16):
-                            state = get_block(x, y, z)
-                            # state = 'minecraft:stone'
-                            index = state_to_index[state]
-                            indexes.append(index)
-
-                build.data_array(indexes, bpe)
-        elif preset == 1:
-            build.byte(0) #Bytes per entry
-            build.varint(10)
-        #Biome data
-        build.byte(0) #Bytes per entry
-        build.varint(1) #Plains
-        return build.get()[1:]
-
-async def build_chunk(xz, player:Player, preset):
-    x = xz[0]
-    z = xz[1]
-    async with Build(0x27, player) as build:
-        build.int(x)
-        build.int(z)
-
-        if preset == 2:
-            build.raw(b'\x03\x01\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41\x04\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41\x05\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41\xd9\x11\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x01\x00\x04\x0e\xc6\x6b\x00\x09\x8b\x2f\x0f\xc1\x17\xb7\x17\x0a\x96\x6b\x93\x6b\x95\x6b\x94\x6b\xbe\x6b\xbf\x6b\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\xcc\xdd\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x39\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x70\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x70\x03\x80\x10\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\x80\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00')
-        else:
-            data = [
-                # (1, [111, 222, 333]),
-                # (2, [444, 555])
-            ]
-
-            # build.array(data, lambda i: (
-            #     build.varint(i[0]),
-            #     build.array(i[1], build.long)
-            # ))
-
-            build.array(data, lambda item: (
-                build.varint(item[0]),
-                build.varint(item[1]),
-                build.long(item[2])
-            )) #Heightmaps
-
-            async with Build(0x00, send=False) as data_b:
-                for i in range(24):
-                    data_b.raw(await section(4096, i, preset))
-
-                data = data_b.get()[1:]
-            build.varint(len(data))
-            build.raw(data)
-
-            build.varint(0) #No Block Entities
-
-            build.varint(0)
-            build.varint(0)
-            build.varint(0)
-            build.varint(0)
-            
-            build.array([], build.byte)
-            build.array([], build.byte)
-            # build.array([0]*2048, build.byte)
-            # build.array([0]*2048, build.byte)
-
+from server.packet import Packet
+from server.world.container import paletted, BLOCKS, BIOMES, AIR
+from server.palette import palette
+from struct import Struct
+import numpy as np
+
+# Heightmaps and light of the old preset-2 chunk, which lobby chunks wrap around their own sections
+HEIGHTMAPS = b'\x03\x01\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41\x04\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41\x05\x25\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x10\x48\x24\x12\x09\x04\x82\x41\x00\x00\x00\x02\x09\x04\x82\x41'
+LIGHT = b'\x01\x00\x00\x00\x00\x00\x00\x00\x70\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x70\x03\x80\x10\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xee\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x78\x87\xa9\xcb\xed\xde\xbc\x9a\x88\x88\xa9\xcb\xed\xde\xbc\x9a\x99\x99\xa9\xcb\xed\xde\xbc\xaa\xaa\xaa\xaa\xcb\xed\xde\xbc\xbb\xbb\xbb\xbb\xcb\xed\xde\xcc\xcc\xcc\xcc\xcc\xcc\xed\xde\xdd\xdd\xdd\xdd\xdd\xdd\xed\xee\xee\xee\xee\xee\xee\xee\xee\x80\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00' # Four masks, then the sky and block light arrays
+
+class ChunkSection:
+    """16x16x16 block states as uint16, indexed [y, z, x], with a running non-air count."""
+    def __init__(self, fill:int = 0, biome:int = 1):
+        self.blocks = np.full((16, 16, 16), fill, dtype=np.uint16)
+        self.biomes = np.full((4, 4, 4), biome, dtype=np.uint16)
+        self.count = 0 if fill in _air else 4096
+        self.dirty = True
+        self._encoded = None
+
+    def get(self, x:int, y:int, z:int) -> int:
+        return int(self.blocks[y, z, x])
+
+    def set(self, x:int, y:int, z:int, state:int) -> bool:
+        """Returns whether the block actually changed."""
+        old = int(self.blocks[y, z, x])
+        if old == state:
+            return False
+        self.blocks[y, z, x] = state
+        self.count += (old in _air) - (state in _air)
+        self.dirty = True
+        return True
+
+    def encode(self) -> bytes:
+        if self.dirty or self._encoded is None:
+            build = Build(None, send=False)
+            build.short(self.count)
+            paletted(build, self.blocks, BLOCKS)
+            paletted(build, self.biomes, BIOMES)
+            self._encoded = build.get()
+            self.dirty = False
+        return self._encoded
+
+class Chunk:
+    """A 16x384x16 column of ChunkSections from y=-64, addressed by world coordinates."""
+    MIN_Y = -64
+    SECTIONS = 24
+
+    def __init__(self, x:int, z:int, fill:int = 0, biome:int = 1, heightmaps:bytes = b'\x00', light:bytes = b'\x00' * 6):
+        self.x = x
+        self.z = z
+        self.sections = [ChunkSection(fill, biome) for _ in range(self.SECTIONS)]
+        self.heightmaps = heightmaps
+        self.light = light # Everything after the block entities: four masks, then sky and block light arrays
+        self._body = None
+        self._frames = {}
+
+    def section_at(self, y:int) -> ChunkSection:
+        index = (y - self.MIN_Y) >> 4
+        if not 0 <= index < self.SECTIONS:
+            raise ValueError(f"y={y} is outside the chunk")
+        return self.sections[index]
+
+    def get_block(self, x:int, y:int, z:int) -> int:
+        return self.section_at(y).get(x & 15, y & 15, z & 15)
+
+    def set_block(self, x:int, y:int, z:int, state:int) -> bool:
+        changed = self.section_at(y).set(x & 15, y & 15, z & 15, state)
+        if changed:
+            self._body = None
+            self._frames.clear()
+        return changed
+
+    def body(self) -> bytes:
+        """Everything after the coordinates, only re-encoding the sections that changed."""
+        if self._body is None:
+            build = Build(None, send=False)
+            build.raw(self.heightmaps)
+            with build.prefixed():
+                for section in self.sections:
+                    build.raw(section.encode())
+            build.varint(0) # No block entities
+            build.raw(self.light)
+            self._body = build.get()
+        return self._body
+
+    def frame(self, compression:int = -1) -> bytes:
+        """The framed Chunk Data packet, kept per compression threshold until a block changes."""
+        frame = self._frames.get(compression)
+        if frame is None:
+            frame = self._frames[compression] = Packet.frame(b'\x27' + _xz.pack(self.x, self.z) + self.body(), compression)
+        return frame
+
+_air = frozenset(AIR.tolist())
+_xz = Struct('>ii')
+
+def lobby_chunk(x:int, z:int) -> Chunk:
+    """A lobby chunk: a 2x2 gray and light gray checkerboard floor at y=0."""
+    chunk = Chunk(x, z, palette["minecraft:air"], 57, HEIGHTMAPS, LIGHT)
+    for bx in range(x << 4, (x << 4) + 16):
+        for bz in range(z << 4, (z << 4) + 16):
+            chunk.set_block(bx, 0, bz, palette["minecraft:gray_concrete" if ((bx // 2) % 2) == ((bz // 2) % 2) else "minecraft:light_gray_concrete"])
+    return chunk
@@ -0,0 +1,44 @@
+from server.packet.build import Build
+from server.palette import palette
+import numpy as np
+
+# (smallest indirect bits, largest indirect bits, direct bits, entries) per container kind.
+# Direct bits are ceil(log2(registry size)) for 1.21.8.
+BLOCKS = (4, 8, 15, 4096)
+BIOMES = (1, 3, 7, 64)
+
+AIR = np.array([palette["minecraft:air"], palette["minecraft:cave_air"], palette["minecraft:void_air"]])
+
+def pack(indices: np.ndarray, bits: int) -> bytes:
+    """Packs entries into big-endian longs, low bits first, without splitting an entry across two longs."""
+    per_long = 64 // bits
+    longs = -(-len(indices) // per_long)
+    padded = np.zeros(longs * per_long, dtype=np.uint64)
+    padded[:len(indices)] = indices
+    shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(bits)
+    return np.bitwise_or.reduce(padded.reshape(longs, per_long) << shifts, axis=1).astype(">u8").tobytes()
+
+def paletted(build: Build, values: np.ndarray, kind: tuple = BLOCKS):
+    """Writes a paletted container for `values`, indexed [y, z, x]."""
+    min_bits, max_bits, direct_bits, entries = kind
+    values = np.asarray(values).ravel()
+    if len(values) != entries:
+        raise ValueError(f"Expected {entries} entries, got {len(values)}")
+
+    ids, indices = np.unique(values, return_inverse=True)
+    if len(ids) == 1:
+        build.byte(0) # Bits per entry
+        build.varint(int(ids[0]))
+        return
+
+    bits = max(min_bits, (len(ids) - 1).bit_length())
+    if bits > max_bits:
+        build.byte(direct_bits)
+        build.raw(pack(values, direct_bits))
+        return
+
+    build.byte(bits)
+    build.varint(len(ids))
+    for value in ids.tolist():
+        build.varint(value)
+    build.raw(pack(indices, bits))
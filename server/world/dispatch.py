@@ -0,0 +1,36 @@
+from server.packet.parse import Parse
+from server.metrics import metrics
+from time import perf_counter
+
+class Dispatch:
+    """Maps (state, packet id) to a decoder and a handler, registered once at import."""
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, state:str, *packet_ids:int, decode=None):
+        def register(handler):
+            for packet_id in packet_ids:
+                self.handlers[(state, packet_id)] = (handler, decode, f"{state} 0x{packet_id:02x}")
+            return handler
+        return register
+
+    async def __call__(self, state:str, target, data:bytes):
+        packet_id = data[0]
+        if packet_id & 0x80: # Only ids above 0x7f take more than one byte
+            with Parse(data) as parse:
+                packet_id = parse.varint()
+
+        entry = self.handlers.get((state, packet_id))
+        if entry is None:
+            return None
+        handler, decode, name = entry
+
+        start = perf_counter()
+        with Parse(data) as parse:
+            parse.varint()
+            fields = decode(parse) if decode is not None else ()
+        result = await handler(target, *fields)
+        metrics.timing(name, perf_counter() - start)
+        return result
+
+dispatch = Dispatch()
@@ -1,3 +1,5 @@
+from server.packet import Packet
+
 regestries = [
     b'\x07\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x72\x6c\x64\x67\x65\x6e\x2f\x62\x69\x6f\x6d\x65\x41\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x64\x6c\x61\x6e\x64\x73\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6d\x62\x6f\x6f\x5f\x6a\x75\x6e\x67\x6c\x65\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x73\x61\x6c\x74\x5f\x64\x65\x6c\x74\x61\x73\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x61\x63\x68\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x69\x72\x63\x68\x5f\x66\x6f\x72\x65\x73\x74\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x65\x72\x72\x79\x5f\x67\x72\x6f\x76\x65\x00\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6c\x64\x5f\x6f\x63\x65\x61\x6e\x00\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x69\x6d\x73\x6f\x6e\x5f\x66\x6f\x72\x65\x73\x74\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x72\x6b\x5f\x66\x6f\x72\x65\x73\x74\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x5f\x63\x6f\x6c\x64\x5f\x6f\x63\x65\x61\x6e\x00\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x5f\x64\x61\x72\x6b\x00\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x5f\x66\x72\x6f\x7a\x65\x6e\x5f\x6f\x63\x65\x61\x6e\x00\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x5f\x6c\x75\x6b\x65\x77\x61\x72\x6d\x5f\x6f\x63\x65\x61\x6e\x00\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x5f\x6f\x63\x65\x61\x6e\x00\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x73\x65\x72\x74\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x69\x70\x73\x74\x6f\x6e\x65\x5f\x63\x61\x76\x65\x73\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x64\x5f\x62\x61\x72\x72\x65\x6e\x73\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x64\x5f\x68\x69\x67\x68\x6c\x61\x6e\x64\x73\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x64\x5f\x6d\x69\x64\x6c\x61\x6e\x64\x73\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x72\x6f\x64\x65\x64\x5f\x62\x61\x64\x6c\x61\x6e\x64\x73\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6c\x6f\x77\x65\x72\x5f\x66\x6f\x72\x65\x73\x74\x00\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6f\x72\x65\x73\x74\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x7a\x65\x6e\x5f\x6f\x63\x65\x61\x6e\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x7a\x65\x6e\x5f\x70\x65\x61\x6b\x73\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x7a\x65\x6e\x5f\x72\x69\x76\x65\x72\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x72\x6f\x76\x65\x00\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x63\x65\x5f\x73\x70\x69\x6b\x65\x73\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6a\x61\x67\x67\x65\x64\x5f\x70\x65\x61\x6b\x73\x00\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6a\x75\x6e\x67\x6c\x65\x00\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x75\x6b\x65\x77\x61\x72\x6d\x5f\x6f\x63\x65\x61\x6e\x00\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x75\x73\x68\x5f\x63\x61\x76\x65\x73\x00\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x6e\x67\x72\x6f\x76\x65\x5f\x73\x77\x61\x6d\x70\x00\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x65\x61\x64\x6f\x77\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x75\x73\x68\x72\x6f\x6f\x6d\x5f\x66\x69\x65\x6c\x64\x73\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x74\x68\x65\x72\x5f\x77\x61\x73\x74\x65\x73\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x63\x65\x61\x6e\x00\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6c\x64\x5f\x67\x72\x6f\x77\x74\x68\x5f\x62\x69\x72\x63\x68\x5f\x66\x6f\x72\x65\x73\x74\x00\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6c\x64\x5f\x67\x72\x6f\x77\x74\x68\x5f\x70\x69\x6e\x65\x5f\x74\x61\x69\x67\x61\x00\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6c\x64\x5f\x67\x72\x6f\x77\x74\x68\x5f\x73\x70\x72\x75\x63\x65\x5f\x74\x61\x69\x67\x61\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6c\x65\x5f\x67\x61\x72\x64\x65\x6e\x00\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x69\x6e\x73\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x69\x76\x65\x72\x00\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x76\x61\x6e\x6e\x61\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x76\x61\x6e\x6e\x61\x5f\x70\x6c\x61\x74\x65\x61\x75\x00\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x61\x6c\x6c\x5f\x65\x6e\x64\x5f\x69\x73\x6c\x61\x6e\x64\x73\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x79\x5f\x62\x65\x61\x63\x68\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x79\x5f\x70\x6c\x61\x69\x6e\x73\x00\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x79\x5f\x73\x6c\x6f\x70\x65\x73\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x79\x5f\x74\x61\x69\x67\x61\x00\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6f\x75\x6c\x5f\x73\x61\x6e\x64\x5f\x76\x61\x6c\x6c\x65\x79\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x72\x73\x65\x5f\x6a\x75\x6e\x67\x6c\x65\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x79\x5f\x70\x65\x61\x6b\x73\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x79\x5f\x73\x68\x6f\x72\x65\x00\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x75\x6e\x66\x6c\x6f\x77\x65\x72\x5f\x70\x6c\x61\x69\x6e\x73\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x77\x61\x6d\x70\x00\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x61\x69\x67\x61\x00\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x68\x65\x5f\x65\x6e\x64\x00\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x68\x65\x5f\x76\x6f\x69\x64\x00\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x6d\x5f\x6f\x63\x65\x61\x6e\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x70\x65\x64\x5f\x66\x6f\x72\x65\x73\x74\x00\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x6e\x64\x73\x77\x65\x70\x74\x5f\x66\x6f\x72\x65\x73\x74\x00\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x6e\x64\x73\x77\x65\x70\x74\x5f\x67\x72\x61\x76\x65\x6c\x6c\x79\x5f\x68\x69\x6c\x6c\x73\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x6e\x64\x73\x77\x65\x70\x74\x5f\x68\x69\x6c\x6c\x73\x00\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x6e\x64\x73\x77\x65\x70\x74\x5f\x73\x61\x76\x61\x6e\x6e\x61\x00\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x64\x5f\x62\x61\x64\x6c\x61\x6e\x64\x73\x00',
     b'\x07\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x61\x74\x5f\x74\x79\x70\x65\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x61\x74\x00\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6d\x6f\x74\x65\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x00\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x73\x67\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x5f\x69\x6e\x63\x6f\x6d\x69\x6e\x67\x00\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x73\x67\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x5f\x6f\x75\x74\x67\x6f\x69\x6e\x67\x00\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x79\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x00\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x65\x61\x6d\x5f\x6d\x73\x67\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x5f\x69\x6e\x63\x6f\x6d\x69\x6e\x67\x00\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x65\x61\x6d\x5f\x6d\x73\x67\x5f\x63\x6f\x6d\x6d\x61\x6e\x64\x5f\x6f\x75\x74\x67\x6f\x69\x6e\x67\x00',
@@ -22,6 +24,17 @@ regestries = [
     #Update tags
     b'\x0d\x0c\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6e\x6e\x65\x72\x5f\x70\x61\x74\x74\x65\x72\x6e\x0b\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x5f\x69\x74\x65\x6d\x5f\x72\x65\x71\x75\x69\x72\x65\x64\x20\x1a\x1b\x1c\x1d\x1f\x26\x23\x25\x20\x24\x22\x21\x19\x05\x1e\x27\x28\x29\x2a\x07\x0a\x09\x08\x03\x17\x13\x11\x14\x12\x01\x0e\x0f\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x70\x69\x67\x6c\x69\x6e\x01\x16\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x66\x69\x65\x6c\x64\x5f\x6d\x61\x73\x6f\x6e\x65\x64\x01\x02\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x66\x6c\x6f\x77\x65\x72\x01\x0c\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x66\x6c\x6f\x77\x01\x0b\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x63\x72\x65\x65\x70\x65\x72\x01\x04\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x67\x6c\x6f\x62\x65\x01\x0d\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x62\x6f\x72\x64\x75\x72\x65\x5f\x69\x6e\x64\x65\x6e\x74\x65\x64\x01\x06\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x67\x75\x73\x74\x65\x72\x01\x10\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x6d\x6f\x6a\x61\x6e\x67\x01\x15\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x74\x74\x65\x72\x6e\x5f\x69\x74\x65\x6d\x2f\x73\x6b\x75\x6c\x6c\x01\x18\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6c\x6f\x63\x6b\xbf\x01\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x6f\x62\x5f\x69\x6e\x74\x65\x72\x61\x63\x74\x61\x62\x6c\x65\x5f\x64\x6f\x6f\x72\x73\x14\xcf\x01\xe6\x04\xe7\x04\xe8\x04\xe9\x04\xeb\x04\xec\x04\xda\x06\xdb\x06\xed\x04\xee\x04\xea\x04\xf0\x07\xf1\x07\xf3\x07\xf2\x07\xf4\x07\xf5\x07\xf7\x07\xf6\x07\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6d\x70\x66\x69\x72\x65\x73\x02\xb2\x06\xb3\x06\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6f\x75\x6c\x5f\x66\x69\x72\x65\x5f\x62\x61\x73\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x91\x02\x92\x02\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x66\x69\x6e\x69\x62\x75\x72\x6e\x5f\x6e\x65\x74\x68\x65\x72\x02\x90\x02\xff\x04\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x73\x6c\x61\x62\x73\x0c\xb7\x04\xb8\x04\xb9\x04\xba\x04\xbb\x04\xbd\x04\xbe\x04\xcc\x06\xcd\x06\xbf\x04\xc0\x04\xbc\x04\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x61\x70\x73\x5f\x67\x6f\x61\x74\x5f\x68\x6f\x72\x6e\x0f\x35\x33\x31\x34\x32\x37\x38\x39\x36\x01\x8c\x04\x2c\x2e\xca\x07\xef\x02\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x61\x6c\x5f\x6f\x72\x65\x73\x02\x2e\x2f\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x63\x63\x6c\x75\x64\x65\x73\x5f\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x5f\x73\x69\x67\x6e\x61\x6c\x73\x10\x8c\x01\x8d\x01\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9a\x01\x9b\x01\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6c\x65\x5f\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x38\x14\x43\x56\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x61\x6c\x6c\x5f\x66\x6c\x6f\x77\x65\x72\x73\x10\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\xcc\x08\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x7a\x61\x6c\x65\x61\x5f\x72\x6f\x6f\x74\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x27\x01\x02\x04\x06\xaf\x07\xa3\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x27\x8c\x02\x28\x25\x89\x02\xbf\x07\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x74\x72\x61\x70\x64\x6f\x6f\x72\x73\x0c\xb1\x02\xaf\x02\xb3\x02\xb4\x02\xb0\x02\xad\x02\xae\x02\xd2\x06\xd3\x06\xb5\x02\xb6\x02\xb2\x02\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x76\x61\x6c\x69\x64\x5f\x73\x70\x61\x77\x6e\x5f\x69\x6e\x73\x69\x64\x65\x02\xe8\x02\xfb\x04\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x79\x5f\x76\x65\x67\x65\x74\x61\x74\x69\x6f\x6e\x5f\x6d\x61\x79\x5f\x70\x6c\x61\x63\x65\x5f\x6f\x6e\x1f\x25\x27\x26\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\xc3\x01\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6f\x78\x65\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x05\x08\x87\x02\x89\x02\x0b\x0a\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6c\x76\x65\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x05\x08\x87\x02\x89\x02\x0a\x0b\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x6c\x10\x8c\x01\x8d\x01\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9a\x01\x9b\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x61\x69\x72\x73\x3a\xbb\x01\xf5\x02\xf6\x02\xf7\x02\xe4\x03\xe6\x03\xe7\x03\xd6\x06\xd7\x06\xe8\x03\xe9\x03\xe5\x03\xea\x03\xd2\x01\xee\x02\xe0\x02\xd4\x02\xd3\x02\xf4\x04\xc1\x03\xb6\x04\xf3\x03\xf2\x03\xf4\x03\xfc\x05\xfd\x05\xfe\x05\xff\x05\x80\x06\x81\x06\x82\x06\x83\x06\x84\x06\x85\x06\x86\x06\x87\x06\x88\x06\x89\x06\xf4\x06\xfc\x06\xff\x06\xa5\x08\xa9\x08\xad\x08\xb1\x08\xd8\x07\xd9\x07\xda\x07\xdb\x07\xe9\x07\xea\x07\xeb\x07\xe8\x07\xd5\x02\xb1\x07\xb5\x07\xba\x07\xda\x02\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x64\x69\x62\x6c\x65\x5f\x66\x6f\x72\x5f\x73\x68\x65\x65\x70\x04\x82\x01\x86\x01\x87\x01\x83\x01\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6f\x67\x73\x2c\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\xbe\x06\xbf\x06\xc0\x06\xc1\x06\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x61\x69\x6c\x5f\x72\x75\x69\x6e\x73\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x01\x28\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x68\x69\x76\x65\x73\x02\xe6\x06\xe7\x06\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x6c\x5f\x73\x69\x67\x6e\x73\x30\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xca\x01\xcb\x01\xcc\x01\xdc\x06\xdd\x06\xcd\x01\xce\x01\xc9\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd8\x01\xd9\x01\xda\x01\xde\x06\xdf\x06\xdb\x01\xdc\x01\xd7\x01\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\xe6\x01\xe7\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf2\x01\xf3\x01\xf1\x01\xf4\x01\x0d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x63\x65\x04\x88\x02\x8c\x04\xf4\x05\xfe\x04\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x6d\x65\x6e\x74\x5f\x70\x6f\x77\x65\x72\x5f\x70\x72\x6f\x76\x69\x64\x65\x72\x01\xb1\x01\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x7a\x61\x6c\x65\x61\x5f\x67\x72\x6f\x77\x73\x5f\x6f\x6e\x20\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x25\x27\x26\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x89\x02\xbf\x07\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x6c\x5f\x63\x61\x72\x70\x65\x74\x73\x10\xfa\x03\xfb\x03\xfc\x03\xfd\x03\xfe\x03\xff\x03\x80\x04\x81\x04\x82\x04\x83\x04\x84\x04\x85\x04\x86\x04\x87\x04\x88\x04\x89\x04\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x61\x67\x6f\x6e\x5f\x69\x6d\x6d\x75\x6e\x65\x13\xec\x03\x22\xe8\x02\xe9\x02\xfb\x04\xf8\x02\xfc\x04\xfd\x04\xe0\x06\xe1\x06\x9c\x01\xb4\x01\xec\x06\xea\x02\xc6\x02\xed\x06\xc2\x08\xe2\x06\xe3\x06\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x6f\x70\x73\x08\xf9\x04\x99\x03\x9a\x03\xc2\x01\xce\x02\xcd\x02\xf6\x04\xf7\x04\x29\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x6e\x67\x72\x6f\x76\x65\x5f\x72\x6f\x6f\x74\x73\x5f\x63\x61\x6e\x5f\x67\x72\x6f\x77\x5f\x74\x68\x72\x6f\x75\x67\x68\x07\xa2\x08\x3b\x3a\x98\x08\xcf\x02\x21\x87\x02\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x65\x61\x74\x75\x72\x65\x73\x5f\x63\x61\x6e\x6e\x6f\x74\x5f\x72\x65\x70\x6c\x61\x63\x65\x07\x22\xb9\x01\xbc\x01\xe9\x02\xc2\x08\xc5\x08\xc6\x08\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x61\x6c\x69\x64\x5f\x73\x70\x61\x77\x6e\x02\x08\x0b\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x75\x73\x68\x72\x6f\x6f\x6d\x5f\x67\x72\x6f\x77\x5f\x62\x6c\x6f\x63\x6b\x04\xd6\x02\x0b\xc2\x06\xb9\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x64\x6f\x6f\x72\x73\x0c\xcf\x01\xe6\x04\xe7\x04\xe8\x04\xe9\x04\xeb\x04\xec\x04\xda\x06\xdb\x06\xed\x04\xee\x04\xea\x04\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x69\x66\x66\x65\x72\x5f\x65\x67\x67\x5f\x68\x61\x74\x63\x68\x5f\x62\x6f\x6f\x73\x74\x01\x9c\x08\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x79\x73\x74\x61\x6c\x5f\x73\x6f\x75\x6e\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x02\xa9\x07\xaa\x07\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x70\x65\x64\x5f\x73\x74\x65\x6d\x73\x04\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x61\x6e\x64\x69\x6e\x67\x5f\x73\x69\x67\x6e\x73\x0c\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xca\x01\xcb\x01\xcc\x01\xdc\x06\xdd\x06\xcd\x01\xce\x01\xc9\x01\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x66\x69\x6e\x69\x62\x75\x72\x6e\x5f\x65\x6e\x64\x03\x90\x02\xff\x04\x22\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6d\x65\x72\x61\x6c\x64\x5f\x6f\x72\x65\x73\x02\xef\x02\xf0\x02\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6d\x62\x6f\x6f\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x3c\x46\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x69\x6d\x73\x6f\x6e\x5f\x73\x74\x65\x6d\x73\x04\xbe\x06\xbf\x06\xc0\x06\xc1\x06\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x65\x64\x73\x5f\x73\x74\x6f\x6e\x65\x5f\x74\x6f\x6f\x6c\x4c\xae\x01\xb9\x08\x2c\x2d\x68\x66\x67\xc6\x07\xba\x08\xca\x07\xcb\x07\xdf\x07\xdb\x07\xcf\x07\xc8\x07\xdd\x07\xd9\x07\xcd\x07\xc9\x07\xdc\x07\xd8\x07\xcc\x07\xc7\x07\xde\x07\xda\x07\xce\x07\xe0\x07\xef\x07\xeb\x07\xe7\x07\xe1\x07\xed\x07\xe9\x07\xe5\x07\xe2\x07\xee\x07\xea\x07\xe6\x07\xe3\x07\xec\x07\xe8\x07\xe4\x07\x90\x08\xc4\x08\xd3\x07\xd2\x07\xd1\x07\xd0\x07\xd7\x07\xd6\x07\xd5\x07\xd4\x07\x80\x08\x81\x08\x82\x08\x83\x08\x84\x08\x85\x08\x86\x08\x87\x08\x88\x08\x89\x08\x8a\x08\x8b\x08\x8c\x08\x8d\x08\x8e\x08\x8f\x08\xf8\x07\xf9\x07\xfb\x07\xfa\x07\xfc\x07\xfd\x07\xff\x07\xfe\x07\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x5f\x62\x79\x5f\x74\x72\x65\x65\x73\x34\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\xcc\x08\xc9\x08\x82\x01\x83\x01\x84\x01\xcf\x02\xd0\x02\x8d\x04\x8e\x04\x8f\x04\x90\x04\x91\x04\x92\x04\xa0\x08\xf8\x04\x23\x88\x01\x89\x01\x85\x01\xcf\x08\xbc\x06\xbd\x06\xc9\x06\x9b\x08\x86\x01\x87\x01\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6e\x63\x72\x65\x74\x65\x5f\x70\x6f\x77\x64\x65\x72\x10\xb6\x05\xb7\x05\xb8\x05\xb9\x05\xba\x05\xbb\x05\xbc\x05\xbd\x05\xbe\x05\xbf\x05\xc0\x05\xc1\x05\xc2\x05\xc3\x05\xc4\x05\xc5\x05\x28\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x61\x76\x61\x5f\x70\x6f\x6f\x6c\x5f\x73\x74\x6f\x6e\x65\x5f\x63\x61\x6e\x6e\x6f\x74\x5f\x72\x65\x70\x6c\x61\x63\x65\x3e\x22\xb9\x01\xbc\x01\xe9\x02\xc2\x08\xc5\x08\xc6\x08\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\xbe\x06\xbf\x06\xc0\x06\xc1\x06\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x73\x69\x64\x65\x5f\x73\x74\x65\x70\x5f\x73\x6f\x75\x6e\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x08\xbf\x07\xc3\x07\xd0\x02\xd7\x02\xae\x07\x99\x08\x9a\x08\x9b\x08\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x76\x65\x6e\x74\x5f\x6d\x6f\x62\x5f\x73\x70\x61\x77\x6e\x69\x6e\x67\x5f\x69\x6e\x73\x69\x64\x65\x04\xd1\x01\x7e\x7f\xc2\x03\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6c\x69\x6d\x62\x61\x62\x6c\x65\x09\xd0\x01\xcf\x02\xa4\x06\xc5\x06\xc6\x06\xc7\x06\xc8\x06\x93\x08\x94\x08\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x74\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x80\x05\xbb\x06\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x65\x72\x72\x61\x63\x6f\x74\x74\x61\x11\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x72\x72\x6f\x74\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x39\x08\x00\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\xbe\x06\xbf\x06\xc0\x06\xc1\x06\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x72\x6b\x5f\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x37\x4d\x42\x55\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x67\x5f\x70\x72\x65\x66\x65\x72\x5f\x6a\x75\x6d\x70\x5f\x74\x6f\x02\xd7\x02\x9d\x08\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x72\x61\x6c\x5f\x70\x6c\x61\x6e\x74\x73\x05\xda\x05\xdb\x05\xdc\x05\xdd\x05\xde\x05\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x61\x74\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x06\x08\x01\x87\x02\x89\x02\x8c\x04\x28\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x63\x75\x6c\x6b\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x5f\x77\x6f\x72\x6c\x64\x5f\x67\x65\x6e\x38\x01\x02\x04\x06\xaf\x07\xa3\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\xc2\x06\xb9\x06\x90\x02\x93\x02\xf3\x06\x25\x27\x28\x91\x02\x92\x02\xbd\x07\xb8\x08\x8c\x02\x92\x08\xea\x02\xb3\x04\x6a\xb0\x08\xac\x08\xa4\x08\xb5\x08\xb6\x08\xa8\x08\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x65\x69\x6c\x69\x6e\x67\x5f\x68\x61\x6e\x67\x69\x6e\x67\x5f\x73\x69\x67\x6e\x73\x0c\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\xe6\x01\xe7\x01\xe8\x01\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x61\x63\x6f\x6e\x5f\x62\x61\x73\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x05\xea\x06\xf4\x02\xc0\x01\xad\x01\xae\x01\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x67\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x04\x08\xa2\x08\x3a\x3b\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x68\x75\x6c\x6b\x65\x72\x5f\x62\x6f\x78\x65\x73\x11\x85\x05\x95\x05\x91\x05\x92\x05\x8f\x05\x8d\x05\x93\x05\x89\x05\x8e\x05\x8b\x05\x88\x05\x87\x05\x8c\x05\x90\x05\x94\x05\x86\x05\x8a\x05\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6c\x6f\x63\x6b\x73\x5f\x77\x69\x6e\x64\x5f\x63\x68\x61\x72\x67\x65\x5f\x65\x78\x70\x6c\x6f\x73\x69\x6f\x6e\x73\x02\xec\x03\x22\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6e\x76\x69\x6c\x03\xb3\x03\xb4\x03\xb5\x03\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x69\x72\x63\x68\x5f\x6c\x6f\x67\x73\x04\x33\x49\x3e\x51\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x6f\x73\x73\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x12\x01\x02\x04\x06\xaf\x07\xa3\x08\x94\x08\x93\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x61\x70\x69\x73\x5f\x6f\x72\x65\x73\x02\x66\x67\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x5f\x63\x6f\x72\x61\x6c\x73\x05\xee\x05\xef\x05\xf0\x05\xf1\x05\xf2\x05\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x69\x6e\x74\x61\x69\x6e\x73\x5f\x66\x61\x72\x6d\x6c\x61\x6e\x64\x0b\xcd\x02\xcb\x02\xce\x02\xcc\x02\xf9\x04\x99\x03\x9a\x03\xf6\x04\x9e\x01\xf7\x04\xc2\x01\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6e\x76\x65\x72\x74\x61\x62\x6c\x65\x5f\x74\x6f\x5f\x6d\x75\x64\x03\x09\x0a\xa1\x08\x0d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x69\x72\x03\x00\xf9\x05\xfa\x05\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x75\x73\x68\x5f\x67\x72\x6f\x75\x6e\x64\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x15\x01\x02\x04\x06\xaf\x07\xa3\x08\x94\x08\x93\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x8c\x02\x28\x25\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x69\x66\x66\x65\x72\x5f\x64\x69\x67\x67\x61\x62\x6c\x65\x5f\x62\x6c\x6f\x63\x6b\x09\x09\x08\x0b\x0a\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x77\x6f\x72\x64\x5f\x69\x6e\x73\x74\x61\x6e\x74\x6c\x79\x5f\x6d\x69\x6e\x65\x73\x02\xf7\x05\xf6\x05\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x5f\x61\x74\x74\x72\x61\x63\x74\x69\x76\x65\x1d\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\x8d\x04\x8e\x04\x90\x04\x8f\x04\xf8\x04\x62\x97\x08\x21\x5d\x99\x08\x9a\x08\xf1\x04\x95\x08\x8b\x02\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x65\x6e\x63\x65\x73\x0d\x8f\x02\xe0\x04\xe2\x04\xe3\x04\xdd\x04\xde\x04\xdf\x04\xd0\x06\xd1\x06\xe4\x04\xe5\x04\xe1\x04\xdf\x02\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x70\x6c\x69\x6e\x67\x73\x0b\x19\x1a\x1b\x1c\x1d\x1f\x20\x96\x08\x97\x08\x21\x1e\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6d\x65\x6c\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x03\x25\x27\x26\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x69\x6e\x65\x61\x62\x6c\x65\x2f\x70\x69\x63\x6b\x61\x78\x65\xb3\x03\x01\x02\x03\x04\x05\x06\x07\x0c\x2a\x2b\x2c\x2d\x2e\x2f\x30\x66\x67\x68\x69\x6a\x6b\x6c\xad\x01\xae\x01\xaf\x01\xb3\x01\xb4\x01\xb9\x01\xbe\x01\xbf\x01\xc0\x01\xc4\x01\xd2\x01\xf6\x01\xf7\x01\x82\x02\x83\x02\x90\x02\x93\x02\x94\x02\xb7\x02\xb8\x02\xb9\x02\xba\x02\xc6\x02\xc7\x02\xd3\x02\xd4\x02\xde\x02\xdf\x02\xe0\x02\xe2\x02\xe3\x02\xea\x02\xee\x02\xef\x02\xf0\x02\xf1\x02\xf4\x02\xb7\x03\xb8\x03\xbb\x03\xbc\x03\xbd\x03\xbe\x03\xbf\x03\xc0\x03\xc1\x03\xc3\x03\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\xee\x03\xef\x03\xf0\x03\xf1\x03\xf2\x03\xf3\x03\xf4\x03\xf5\x03\xf6\x03\xf7\x03\x8a\x04\x8b\x04\xb3\x04\xb4\x04\xb5\x04\xb6\x04\xc2\x04\xc3\x04\xc4\x04\xc5\x04\xc6\x04\xc7\x04\xc8\x04\xc9\x04\xcb\x04\xcc\x04\xcd\x04\xce\x04\xcf\x04\xd0\x04\xd1\x04\xd2\x04\xd3\x04\xf2\x04\xf3\x04\xf4\x04\xf5\x04\xff\x04\x81\x05\x82\x05\x84\x05\x96\x05\x97\x05\x98\x05\x99\x05\x9a\x05\x9b\x05\x9c\x05\x9d\x05\x9e\x05\x9f\x05\xa0\x05\xa1\x05\xa2\x05\xa3\x05\xa4\x05\xa5\x05\xa6\x05\xa7\x05\xa8\x05\xa9\x05\xaa\x05\xab\x05\xac\x05\xad\x05\xae\x05\xaf\x05\xb0\x05\xb1\x05\xb2\x05\xb3\x05\xb4\x05\xb5\x05\xcb\x05\xcc\x05\xcd\x05\xce\x05\xcf\x05\xd0\x05\xd1\x05\xd2\x05\xd3\x05\xd4\x05\xd5\x05\xd6\x05\xd7\x05\xd8\x05\xd9\x05\xdf\x05\xe0\x05\xe1\x05\xe2\x05\xe3\x05\xe9\x05\xea\x05\xeb\x05\xec\x05\xed\x05\xfc\x05\xfd\x05\xfe\x05\xff\x05\x80\x06\x81\x06\x82\x06\x83\x06\x84\x06\x85\x06\x86\x06\x87\x06\x88\x06\x89\x06\x8a\x06\x8b\x06\x8c\x06\x8d\x06\x8e\x06\x8f\x06\x90\x06\x91\x06\x92\x06\x93\x06\x94\x06\x95\x06\x96\x06\xa7\x06\xa8\x06\xab\x06\xae\x06\xaf\x06\xb0\x06\xb1\x06\xb9\x06\xc2\x06\xea\x06\xeb\x06\xec\x06\xed\x06\xf2\x06\xf3\x06\xf4\x06\xf6\x06\xf7\x06\xf8\x06\xf9\x06\xfa\x06\xfb\x06\xfc\x06\xfe\x06\xff\x06\x80\x07\x81\x07\x84\x07\x85\x07\x86\x07\xaf\x07\xbd\x07\xc9\x07\xc8\x07\xc7\x07\xc6\x07\xca\x07\xcb\x07\xcc\x07\xcd\x07\xce\x07\xcf\x07\xd8\x07\xd9\x07\xda\x07\xdb\x07\xdc\x07\xdd\x07\xde\x07\xdf\x07\xe0\x07\xe1\x07\xe2\x07\xe3\x07\xe4\x07\xe5\x07\xe6\x07\xe7\x07\xe8\x07\xe9\x07\xea\x07\xeb\x07\xec\x07\xed\x07\xee\x07\xef\x07\x90\x08\x91\x08\x92\x08\xa3\x08\xa4\x08\xa5\x08\xa6\x08\xa8\x08\xa9\x08\xaa\x08\xac\x08\xad\x08\xae\x08\xb0\x08\xb1\x08\xb2\x08\xb4\x08\xb5\x08\xb6\x08\xb8\x08\xb9\x08\xba\x08\xbb\x08\x88\x02\x8c\x04\xf4\x05\x8a\x01\x80\x01\x8b\x01\xab\x07\xae\x07\xad\x07\xac\x07\xa9\x07\xaa\x07\xbe\x02\xc2\x02\xc1\x02\xb7\x08\xbd\x02\xc0\x02\xbf\x02\x86\x02\x82\x07\xfa\x02\xfb\x02\x97\x06\x98\x06\x99\x06\x9a\x06\x9b\x06\x9c\x06\x9e\x06\x9f\x06\xa0\x06\xa1\x06\xa2\x06\xa3\x06\xf5\x06\xfd\x06\x83\x07\xa7\x08\xab\x08\xaf\x08\xb3\x08\x9d\x06\xb2\x07\xb6\x07\xbb\x07\xdc\x02\x85\x05\x95\x05\x91\x05\x92\x05\x8f\x05\x8d\x05\x93\x05\x89\x05\x8e\x05\x8b\x05\x88\x05\x87\x05\x8c\x05\x90\x05\x94\x05\x86\x05\x8a\x05\xb3\x03\xb4\x03\xb5\x03\xe4\x02\xe5\x02\xe6\x02\xe7\x02\xd1\x01\x7e\x7f\xc2\x03\xf5\x05\xbc\x02\xd5\x02\xca\x04\xbb\x02\xc4\x08\xb0\x07\xb1\x07\xb7\x07\xb3\x07\xb4\x07\xb5\x07\xb8\x07\xb9\x07\xba\x07\xbc\x07\xd3\x07\xd2\x07\xd1\x07\xd0\x07\xd7\x07\xd6\x07\xd5\x07\xd4\x07\x80\x08\x81\x08\x82\x08\x83\x08\x84\x08\x85\x08\x86\x08\x87\x08\x88\x08\x89\x08\x8a\x08\x8b\x08\x8c\x08\x8d\x08\x8e\x08\x8f\x08\xf0\x07\xf1\x07\xf3\x07\xf2\x07\xf4\x07\xf5\x07\xf7\x07\xf6\x07\xf8\x07\xf9\x07\xfb\x07\xfa\x07\xfc\x07\xfd\x07\xff\x07\xfe\x07\xc7\x08\xd9\x02\xdb\x02\xda\x02\xdd\x02\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x64\x73\x10\x7c\x7d\x79\x7a\x77\x75\x7b\x71\x76\x73\x70\x6f\x74\x78\x6e\x72\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x72\x6f\x6e\x5f\x6f\x72\x65\x73\x02\x2c\x2d\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x75\x6e\x73\x74\x61\x62\x6c\x65\x5f\x62\x6f\x74\x74\x6f\x6d\x5f\x63\x65\x6e\x74\x65\x72\x0c\xd7\x04\xd5\x04\xd9\x04\xda\x04\xd6\x04\xd2\x02\xd4\x04\xd4\x06\xd5\x06\xdb\x04\xdc\x04\xd8\x04\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x31\x47\x44\x4f\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x6f\x6f\x72\x73\x15\xcf\x01\xe6\x04\xe7\x04\xe8\x04\xe9\x04\xeb\x04\xec\x04\xda\x06\xdb\x06\xed\x04\xee\x04\xea\x04\xf0\x07\xf1\x07\xf3\x07\xf2\x07\xf4\x07\xf5\x07\xf7\x07\xf6\x07\xf7\x01\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x64\x65\x72\x6d\x61\x6e\x5f\x68\x6f\x6c\x64\x61\x62\x6c\x65\x2c\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\xcc\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x25\x27\x28\xab\x01\xac\x01\xb0\x01\x8a\x02\x8c\x02\xc9\x02\x99\x02\xca\x02\xc3\x06\xc2\x06\xc9\x06\xba\x06\xb9\x06\xbc\x06\x8b\x02\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6e\x6e\x65\x72\x73\x20\x93\x04\x94\x04\x95\x04\x96\x04\x97\x04\x98\x04\x99\x04\x9a\x04\x9b\x04\x9c\x04\x9d\x04\x9e\x04\x9f\x04\xa0\x04\xa1\x04\xa2\x04\xa3\x04\xa4\x04\xa5\x04\xa6\x04\xa7\x04\xa8\x04\xa9\x04\xaa\x04\xab\x04\xac\x04\xad\x04\xae\x04\xaf\x04\xb0\x04\xb1\x04\xb2\x04\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x66\x69\x6e\x69\x62\x75\x72\x6e\x5f\x6f\x76\x65\x72\x77\x6f\x72\x6c\x64\x02\x90\x02\xff\x04\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6c\x6f\x77\x65\x72\x5f\x70\x6f\x74\x73\x26\xfc\x02\xcd\x08\xce\x08\x89\x03\x8a\x03\x8b\x03\x8c\x03\x8d\x03\x8e\x03\x8f\x03\x90\x03\x91\x03\x88\x03\xfe\x02\xff\x02\x80\x03\x81\x03\x82\x03\x84\x03\x85\x03\x95\x03\x96\x03\x97\x03\x87\x03\x98\x03\x92\x03\x93\x03\x94\x03\xf8\x05\xee\x06\xef\x06\xf0\x06\xf1\x06\xbc\x08\xbd\x08\x86\x03\x83\x03\xfd\x02\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x65\x6c\x74\x73\x5f\x74\x6f\x5f\x67\x6c\x61\x73\x73\x02\x25\x27\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x72\x65\x70\x65\x6c\x6c\x65\x6e\x74\x73\x05\xb8\x01\x95\x02\xb1\x06\x96\x02\xb3\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x66\x65\x6e\x63\x65\x73\x0c\x8f\x02\xe0\x04\xe2\x04\xe3\x04\xdd\x04\xde\x04\xdf\x04\xd0\x06\xd1\x06\xe4\x04\xe5\x04\xe1\x04\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x77\x6f\x6f\x64\x65\x6e\x5f\x74\x6f\x6f\x6c\x5d\xb4\x01\xec\x06\xea\x06\xed\x06\xeb\x06\xc0\x01\xbe\x01\xbf\x01\xef\x02\xf0\x02\xf4\x02\xad\x01\xbb\x08\x2a\x2b\x82\x02\x83\x02\xae\x01\xb9\x08\x2c\x2d\x68\x66\x67\xc6\x07\xba\x08\xca\x07\xcb\x07\xdf\x07\xdb\x07\xcf\x07\xc8\x07\xdd\x07\xd9\x07\xcd\x07\xc9\x07\xdc\x07\xd8\x07\xcc\x07\xc7\x07\xde\x07\xda\x07\xce\x07\xe0\x07\xef\x07\xeb\x07\xe7\x07\xe1\x07\xed\x07\xe9\x07\xe5\x07\xe2\x07\xee\x07\xea\x07\xe6\x07\xe3\x07\xec\x07\xe8\x07\xe4\x07\x90\x08\xc4\x08\xd3\x07\xd2\x07\xd1\x07\xd0\x07\xd7\x07\xd6\x07\xd5\x07\xd4\x07\x80\x08\x81\x08\x82\x08\x83\x08\x84\x08\x85\x08\x86\x08\x87\x08\x88\x08\x89\x08\x8a\x08\x8b\x08\x8c\x08\x8d\x08\x8e\x08\x8f\x08\xf8\x07\xf9\x07\xfb\x07\xfa\x07\xfc\x07\xfd\x07\xff\x07\xfe\x07\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x69\x72\x6f\x6e\x5f\x74\x6f\x6f\x6c\x05\xb4\x01\xec\x06\xea\x06\xed\x06\xeb\x06\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x6f\x6f\x73\x68\x72\x6f\x6f\x6d\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x01\xd6\x02\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x6d\x65\x6e\x74\x5f\x70\x6f\x77\x65\x72\x5f\x74\x72\x61\x6e\x73\x6d\x69\x74\x74\x65\x72\x1d\x00\x23\x24\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\xb7\x01\xb8\x01\x87\x02\xcf\x02\xd0\x02\xd1\x02\xed\x03\x91\x04\x92\x04\x83\x05\xf9\x05\xfa\x05\xfb\x05\xbc\x06\xbd\x06\xc9\x06\x9b\x08\xa0\x08\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x5f\x70\x6f\x73\x74\x5f\x6f\x76\x65\x72\x72\x69\x64\x65\x4d\xb5\x01\x95\x02\x84\x02\xf3\x02\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xca\x01\xcb\x01\xcc\x01\xdc\x06\xdd\x06\xcd\x01\xce\x01\xc9\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd8\x01\xd9\x01\xda\x01\xde\x06\xdf\x06\xdb\x01\xdc\x01\xd7\x01\x93\x04\x94\x04\x95\x04\x96\x04\x97\x04\x98\x04\x99\x04\x9a\x04\x9b\x04\x9c\x04\x9d\x04\x9e\x04\x9f\x04\xa0\x04\xa1\x04\xa2\x04\xa3\x04\xa4\x04\xa5\x04\xa6\x04\xa7\x04\xa8\x04\xa9\x04\xaa\x04\xab\x04\xac\x04\xad\x04\xae\x04\xaf\x04\xb0\x04\xb1\x04\xb2\x04\xb7\x03\xb8\x03\xf8\x01\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfe\x01\xff\x01\xce\x06\xcf\x06\x80\x02\x81\x02\xfd\x01\xf6\x01\x81\x07\x8b\x02\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6f\x72\x74\x61\x6c\x73\x03\x98\x02\xe8\x02\xfb\x04\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6d\x62\x6f\x6f\x5f\x70\x6c\x61\x6e\x74\x61\x62\x6c\x65\x5f\x6f\x6e\x11\x25\x27\x26\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\xf7\x05\xf6\x05\x28\x29\x2c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6f\x6c\x61\x72\x5f\x62\x65\x61\x72\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x5f\x61\x6c\x74\x65\x72\x6e\x61\x74\x65\x01\x88\x02\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x75\x6c\x64\x72\x6f\x6e\x73\x04\xe4\x02\xe5\x02\xe6\x02\xe7\x02\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x69\x67\x5f\x64\x72\x69\x70\x6c\x65\x61\x66\x5f\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x0b\x8c\x02\x9c\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\xa2\x08\x3b\xc3\x01\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x77\x6f\x72\x64\x5f\x65\x66\x66\x69\x63\x69\x65\x6e\x74\x16\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\xcf\x02\xd0\x02\xc9\x02\x99\x02\x9a\x02\xca\x02\xed\x02\x9d\x08\x9e\x08\xf0\x04\xf1\x04\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x73\x73\x75\x72\x65\x5f\x70\x6c\x61\x74\x65\x73\x10\xb7\x03\xb8\x03\xf8\x01\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfe\x01\xff\x01\xce\x06\xcf\x06\x80\x02\x81\x02\xfd\x01\xf6\x01\x81\x07\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x6d\x70\x65\x6e\x73\x5f\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x73\x20\x8c\x01\x8d\x01\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9a\x01\x9b\x01\xfa\x03\xfb\x03\xfc\x03\xfd\x03\xfe\x03\xff\x03\x80\x04\x81\x04\x82\x04\x83\x04\x84\x04\x85\x04\x86\x04\x87\x04\x88\x04\x89\x04\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x6e\x67\x72\x6f\x76\x65\x5f\x6c\x6f\x67\x73\x04\x39\x4e\x45\x57\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x76\x65\x72\x77\x6f\x72\x6c\x64\x5f\x63\x61\x72\x76\x65\x72\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x73\x34\x01\x02\x04\x06\xaf\x07\xa3\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x25\x27\x26\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x2c\x2d\xca\x07\xcb\x07\x87\x02\x89\x02\xbf\x07\x23\x28\x29\x6a\xb3\x04\xbd\x07\x8c\x04\xb9\x08\xba\x08\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x5f\x6c\x61\x79\x65\x72\x5f\x63\x61\x6e\x5f\x73\x75\x72\x76\x69\x76\x65\x5f\x6f\x6e\x03\xe8\x06\x91\x02\xa2\x08\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6a\x75\x6e\x67\x6c\x65\x5f\x6c\x6f\x67\x73\x04\x34\x4a\x3f\x52\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x5f\x72\x65\x73\x6f\x6e\x61\x74\x6f\x72\x73\x01\xa9\x07\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x5f\x68\x61\x6e\x67\x69\x6e\x67\x5f\x73\x69\x67\x6e\x73\x0c\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf2\x01\xf3\x01\xf1\x01\xf4\x01\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x63\x75\x6c\x6b\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x32\x01\x02\x04\x06\xaf\x07\xa3\x08\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\xc2\x06\xb9\x06\x90\x02\x93\x02\xf3\x06\x25\x27\x28\x91\x02\x92\x02\xbd\x07\xb8\x08\x8c\x02\x92\x08\xea\x02\xb3\x04\x6a\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x5f\x6c\x61\x79\x65\x72\x5f\x63\x61\x6e\x6e\x6f\x74\x5f\x73\x75\x72\x76\x69\x76\x65\x5f\x6f\x6e\x03\x88\x02\x8c\x04\xec\x03\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x69\x67\x6e\x73\x18\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xca\x01\xcb\x01\xcc\x01\xdc\x06\xdd\x06\xcd\x01\xce\x01\xc9\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd8\x01\xd9\x01\xda\x01\xde\x06\xdf\x06\xdb\x01\xdc\x01\xd7\x01\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x73\x74\x61\x69\x72\x73\x0c\xbb\x01\xf5\x02\xf6\x02\xf7\x02\xe4\x03\xe6\x03\xe7\x03\xd6\x06\xd7\x06\xe8\x03\xe9\x03\xe5\x03\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6e\x63\x69\x65\x6e\x74\x5f\x63\x69\x74\x79\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x0c\xa3\x08\xb0\x08\xac\x08\xb2\x08\xae\x08\xb1\x08\xaf\x08\xb3\x08\xa4\x08\xb5\x08\xb6\x08\x93\x01\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x72\x75\x63\x65\x5f\x6c\x6f\x67\x73\x04\x32\x48\x3d\x50\x28\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x6e\x67\x72\x6f\x76\x65\x5f\x6c\x6f\x67\x73\x5f\x63\x61\x6e\x5f\x67\x72\x6f\x77\x5f\x74\x68\x72\x6f\x75\x67\x68\x08\xa2\x08\x3b\x3a\x60\x39\x21\x98\x08\xcf\x02\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x73\x65\x5f\x73\x74\x6f\x6e\x65\x5f\x6f\x76\x65\x72\x77\x6f\x72\x6c\x64\x06\x01\x02\x04\x06\xaf\x07\xa3\x08\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x62\x75\x74\x74\x6f\x6e\x73\x0c\x9b\x03\x9c\x03\x9d\x03\x9e\x03\x9f\x03\xa1\x03\xa2\x03\xd8\x06\xd9\x06\xa3\x03\xa4\x03\xa0\x03\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x78\x6f\x6c\x6f\x74\x6c\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x01\x8c\x02\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x65\x72\x5f\x73\x75\x6d\x6d\x6f\x6e\x5f\x62\x61\x73\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x91\x02\x92\x02\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x69\x70\x73\x74\x6f\x6e\x65\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x06\x01\x02\x04\x06\xaf\x07\xa3\x08\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x6f\x67\x6c\x69\x6e\x5f\x72\x65\x70\x65\x6c\x6c\x65\x6e\x74\x73\x04\xba\x06\xef\x06\x98\x02\xed\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x62\x72\x69\x63\x6b\x73\x04\xb7\x02\xb8\x02\xb9\x02\xba\x02\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x69\x72\x65\x02\xb7\x01\xb8\x01\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x69\x6e\x65\x61\x62\x6c\x65\x2f\x61\x78\x65\x92\x02\x6d\xf7\x05\xa6\x06\xe6\x06\xe7\x06\x9e\x08\x9d\x08\xb1\x01\xc3\x02\xb2\x06\xa9\x06\x99\x02\xbc\x01\xf1\x04\xf0\x04\xed\x02\xe4\x06\xc1\x01\xba\x03\xaa\x06\xd0\x02\x9a\x02\x8e\x02\xd0\x01\xac\x06\xa5\x06\xca\x02\xc5\x02\xc9\x02\xc4\x02\xad\x06\xb3\x06\xb6\x03\xcf\x02\x93\x04\x94\x04\x95\x04\x96\x04\x97\x04\x98\x04\x99\x04\x9a\x04\x9b\x04\x9c\x04\x9d\x04\x9e\x04\x9f\x04\xa0\x04\xa1\x04\xa2\x04\xa3\x04\xa4\x04\xa5\x04\xa6\x04\xa7\x04\xa8\x04\xa9\x04\xaa\x04\xab\x04\xac\x04\xad\x04\xae\x04\xaf\x04\xb0\x04\xb1\x04\xb2\x04\xd7\x04\xd5\x04\xd9\x04\xda\x04\xd6\x04\xd2\x02\xd4\x04\xd4\x06\xd5\x06\xdb\x04\xdc\x04\xd8\x04\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\xbe\x06\xbf\x06\xc0\x06\xc1\x06\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x0d\x0e\x0f\x10\x11\x13\x15\xca\x06\xcb\x06\x16\x17\x12\xc5\x01\xc6\x01\xc7\x01\xc8\x01\xca\x01\xcb\x01\xcc\x01\xdc\x06\xdd\x06\xcd\x01\xce\x01\xc9\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd8\x01\xd9\x01\xda\x01\xde\x06\xdf\x06\xdb\x01\xdc\x01\xd7\x01\x9b\x03\x9c\x03\x9d\x03\x9e\x03\x9f\x03\xa1\x03\xa2\x03\xd8\x06\xd9\x06\xa3\x03\xa4\x03\xa0\x03\xcf\x01\xe6\x04\xe7\x04\xe8\x04\xe9\x04\xeb\x04\xec\x04\xda\x06\xdb\x06\xed\x04\xee\x04\xea\x04\x8f\x02\xe0\x04\xe2\x04\xe3\x04\xdd\x04\xde\x04\xdf\x04\xd0\x06\xd1\x06\xe4\x04\xe5\x04\xe1\x04\xf8\x01\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfe\x01\xff\x01\xce\x06\xcf\x06\x80\x02\x81\x02\xfd\x01\xb7\x04\xb8\x04\xb9\x04\xba\x04\xbb\x04\xbd\x04\xbe\x04\xcc\x06\xcd\x06\xbf\x04\xc0\x04\xbc\x04\xbb\x01\xf5\x02\xf6\x02\xf7\x02\xe4\x03\xe6\x03\xe7\x03\xd6\x06\xd7\x06\xe8\x03\xe9\x03\xe5\x03\xb1\x02\xaf\x02\xb3\x02\xb4\x02\xb0\x02\xad\x02\xae\x02\xd2\x06\xd3\x06\xb5\x02\xb6\x02\xb2\x02\x3a\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\xe6\x01\xe7\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf2\x01\xf3\x01\xf1\x01\xf4\x01\x18\xc1\x04\xea\x03\x3c\x46\xb2\x01\xba\x01\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x73\x65\x5f\x73\x74\x6f\x6e\x65\x5f\x6e\x65\x74\x68\x65\x72\x03\x90\x02\x93\x02\xf3\x06\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x65\x64\x73\x5f\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x74\x6f\x6f\x6c\x05\xb4\x01\xec\x06\xea\x06\xed\x06\xeb\x06\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x5f\x73\x69\x67\x6e\x73\x0c\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd8\x01\xd9\x01\xda\x01\xde\x06\xdf\x06\xdb\x01\xdc\x01\xd7\x01\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x73\x74\x6f\x6e\x65\x5f\x74\x6f\x6f\x6c\x11\xb4\x01\xec\x06\xea\x06\xed\x06\xeb\x06\xc0\x01\xbe\x01\xbf\x01\xef\x02\xf0\x02\xf4\x02\xad\x01\xbb\x08\x2a\x2b\x82\x02\x83\x02\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6c\x61\x62\x73\x3e\xb7\x04\xb8\x04\xb9\x04\xba\x04\xbb\x04\xbd\x04\xbe\x04\xcc\x06\xcd\x06\xbf\x04\xc0\x04\xbc\x04\xc1\x04\xc2\x04\xc3\x04\xc9\x04\xc4\x04\xcf\x04\xcc\x04\xcd\x04\xc8\x04\xc7\x04\xcb\x04\xc6\x04\xf5\x03\xf6\x03\xf7\x03\x8a\x06\x8b\x06\x8c\x06\x8d\x06\x8e\x06\x8f\x06\x90\x06\x91\x06\x92\x06\x93\x06\x94\x06\x95\x06\x96\x06\xc5\x04\xce\x04\xf6\x06\xfb\x06\x80\x07\xa6\x08\xaa\x08\xae\x08\xb2\x08\xed\x07\xee\x07\xef\x07\xdc\x07\xdd\x07\xde\x07\xdf\x07\xec\x07\xca\x04\xb0\x07\xb4\x07\xb9\x07\xdb\x02\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6e\x69\x6d\x61\x6c\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x01\x08\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x75\x61\x72\x64\x65\x64\x5f\x62\x79\x5f\x70\x69\x67\x6c\x69\x6e\x73\x1b\xad\x01\xa6\x06\xbc\x01\xf1\x02\xfe\x06\xb6\x03\xbb\x08\x85\x05\x95\x05\x91\x05\x92\x05\x8f\x05\x8d\x05\x93\x05\x89\x05\x8e\x05\x8b\x05\x88\x05\x87\x05\x8c\x05\x90\x05\x94\x05\x86\x05\x8a\x05\x2a\x30\x2b\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x5f\x62\x79\x5f\x6d\x75\x73\x68\x72\x6f\x6f\x6d\x73\x38\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\xcc\x08\xc9\x08\x82\x01\x83\x01\x84\x01\xcf\x02\xd0\x02\x8d\x04\x8e\x04\x8f\x04\x90\x04\x91\x04\x92\x04\xa0\x08\xf8\x04\x23\x88\x01\x89\x01\xab\x01\xac\x01\xc3\x02\xc4\x02\xbc\x06\xbd\x06\xc9\x06\x9b\x08\x86\x01\x87\x01\x85\x01\xcf\x08\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x69\x6e\x65\x61\x62\x6c\x65\x2f\x73\x68\x6f\x76\x65\x6c\x24\x8c\x02\x09\x0a\x0b\xc3\x01\x08\x28\xd6\x02\x25\x27\x89\x02\x87\x02\x91\x02\xfa\x04\x92\x02\xa1\x08\x3b\xa2\x08\x26\x29\xb6\x05\xb7\x05\xb8\x05\xb9\x05\xba\x05\xbb\x05\xbc\x05\xbd\x05\xbe\x05\xbf\x05\xc0\x05\xc1\x05\xc2\x05\xc3\x05\xc4\x05\xc5\x05\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x74\x68\x65\x72\x5f\x63\x61\x72\x76\x65\x72\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x73\x19\x01\x02\x04\x06\xaf\x07\xa3\x08\x90\x02\x93\x02\xf3\x06\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\xc2\x06\xb9\x06\x80\x05\xbb\x06\x91\x02\x92\x02\x2b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x79\x73\x5f\x61\x6d\x62\x69\x65\x6e\x74\x5f\x64\x65\x73\x65\x72\x74\x5f\x62\x6c\x6f\x63\x6b\x5f\x73\x6f\x75\x6e\x64\x73\x13\x8a\x04\xc4\x03\xc5\x03\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\x25\x27\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x74\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x06\x01\x02\x04\x06\xaf\x07\xa3\x08\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x6f\x72\x65\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x73\x04\x01\x02\x04\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x64\x73\x74\x6f\x6e\x65\x5f\x6f\x72\x65\x73\x02\x82\x02\x83\x02\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x61\x70\x64\x6f\x6f\x72\x73\x15\xb1\x02\xaf\x02\xb3\x02\xb4\x02\xb0\x02\xad\x02\xae\x02\xd2\x06\xd3\x06\xb5\x02\xb6\x02\xb2\x02\xee\x03\xf8\x07\xf9\x07\xfb\x07\xfa\x07\xfc\x07\xfd\x07\xff\x07\xfe\x07\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x65\x72\x72\x79\x5f\x6c\x6f\x67\x73\x04\x36\x4c\x41\x54\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x61\x6c\x6c\x5f\x64\x61\x6d\x61\x67\x65\x5f\x72\x65\x73\x65\x74\x74\x69\x6e\x67\x0b\xd0\x01\xcf\x02\xa4\x06\xc5\x06\xc6\x06\xc7\x06\xc8\x06\x93\x08\x94\x08\xb4\x06\x81\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x72\x61\x6c\x73\x0a\xda\x05\xdb\x05\xdc\x05\xdd\x05\xde\x05\xe4\x05\xe5\x05\xe6\x05\xe7\x05\xe8\x05\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6c\x6f\x77\x65\x72\x73\x1e\x9d\x01\xcb\x08\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\xaa\x01\xa9\x01\x9e\x01\xcc\x08\x8d\x04\x8e\x04\x90\x04\x8f\x04\xf8\x04\x62\x97\x08\x21\x5d\x99\x08\x9a\x08\xf1\x04\x95\x08\x8b\x02\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x75\x74\x74\x6f\x6e\x73\x0e\x9b\x03\x9c\x03\x9d\x03\x9e\x03\x9f\x03\xa1\x03\xa2\x03\xd8\x06\xd9\x06\xa3\x03\xa4\x03\xa0\x03\x86\x02\x82\x07\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6d\x62\x69\x6e\x61\x74\x69\x6f\x6e\x5f\x73\x74\x65\x70\x5f\x73\x6f\x75\x6e\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x17\xfa\x03\xfb\x03\xfc\x03\xfd\x03\xfe\x03\xff\x03\x80\x04\x81\x04\x82\x04\x83\x04\x84\x04\x85\x04\x86\x04\x87\x04\x88\x04\x89\x04\x98\x08\xc9\x08\x87\x02\xbd\x06\xbc\x06\xc9\x06\xd1\x02\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x61\x62\x62\x69\x74\x73\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x04\x08\x87\x02\x89\x02\x25\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x6e\x6b\x73\x0c\x0d\x0e\x0f\x10\x11\x13\x15\xca\x06\xcb\x06\x16\x17\x12\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x6f\x65\x73\x5f\x6e\x6f\x74\x5f\x62\x6c\x6f\x63\x6b\x5f\x68\x6f\x70\x70\x65\x72\x73\x02\xe6\x06\xe7\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x62\x75\x74\x74\x6f\x6e\x73\x02\x86\x02\x82\x07\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6f\x75\x6c\x5f\x73\x70\x65\x65\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x91\x02\x92\x02\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x61\x69\x6c\x73\x04\xd1\x01\x7e\x7f\xc2\x03\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x6f\x72\x65\x73\x02\xbe\x01\xbf\x01\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x65\x6f\x64\x65\x5f\x69\x6e\x76\x61\x6c\x69\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x06\x22\x23\x24\x88\x02\x8c\x04\xf4\x05\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x64\x6c\x61\x6e\x64\x73\x5f\x74\x65\x72\x72\x61\x63\x6f\x74\x74\x61\x07\x8a\x04\xc4\x03\xc8\x03\xc5\x03\xd2\x03\xd0\x03\xcc\x03\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x76\x65\x72\x77\x6f\x72\x6c\x64\x5f\x6e\x61\x74\x75\x72\x61\x6c\x5f\x6c\x6f\x67\x73\x09\x35\x33\x31\x34\x32\x37\x38\x39\x36\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x6c\x5f\x68\x61\x6e\x67\x69\x6e\x67\x5f\x73\x69\x67\x6e\x73\x18\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\xe6\x01\xe7\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf2\x01\xf3\x01\xf1\x01\xf4\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x65\x61\x76\x65\x73\x0b\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x65\x70\x73\x6c\x61\x74\x65\x5f\x6f\x72\x65\x5f\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x73\x02\xa3\x08\xaf\x07\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x73\x1a\xfa\x02\xfb\x02\x97\x06\x98\x06\x99\x06\x9a\x06\x9b\x06\x9c\x06\x9e\x06\x9f\x06\xa0\x06\xa1\x06\xa2\x06\xa3\x06\xf5\x06\xfd\x06\x83\x07\xa7\x08\xab\x08\xaf\x08\xb3\x08\x9d\x06\xb2\x07\xb6\x07\xbb\x07\xdc\x02\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x76\x65\x5f\x76\x69\x6e\x65\x73\x02\x94\x08\x93\x08\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x72\x61\x6c\x5f\x62\x6c\x6f\x63\x6b\x73\x05\xd0\x05\xd1\x05\xd2\x05\xd3\x05\xd4\x05\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x72\x69\x64\x65\x72\x5f\x77\x61\x72\x6d\x5f\x62\x6c\x6f\x63\x6b\x73\x01\x24\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x65\x6e\x63\x65\x5f\x67\x61\x74\x65\x73\x0c\xd7\x04\xd5\x04\xd9\x04\xda\x04\xd6\x04\xd2\x02\xd4\x04\xd4\x06\xd5\x06\xdb\x04\xdc\x04\xd8\x04\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x5f\x67\x72\x6f\x77\x61\x62\x6c\x65\x73\x0b\xf9\x04\x99\x03\x9a\x03\xc2\x01\xce\x02\xcd\x02\xf6\x04\xf7\x04\xb4\x06\x93\x08\x94\x08\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x67\x6f\x6c\x64\x5f\x74\x6f\x6f\x6c\x5d\xb4\x01\xec\x06\xea\x06\xed\x06\xeb\x06\xc0\x01\xbe\x01\xbf\x01\xef\x02\xf0\x02\xf4\x02\xad\x01\xbb\x08\x2a\x2b\x82\x02\x83\x02\xae\x01\xb9\x08\x2c\x2d\x68\x66\x67\xc6\x07\xba\x08\xca\x07\xcb\x07\xdf\x07\xdb\x07\xcf\x07\xc8\x07\xdd\x07\xd9\x07\xcd\x07\xc9\x07\xdc\x07\xd8\x07\xcc\x07\xc7\x07\xde\x07\xda\x07\xce\x07\xe0\x07\xef\x07\xeb\x07\xe7\x07\xe1\x07\xed\x07\xe9\x07\xe5\x07\xe2\x07\xee\x07\xea\x07\xe6\x07\xe3\x07\xec\x07\xe8\x07\xe4\x07\x90\x08\xc4\x08\xd3\x07\xd2\x07\xd1\x07\xd0\x07\xd7\x07\xd6\x07\xd5\x07\xd4\x07\x80\x08\x81\x08\x82\x08\x83\x08\x84\x08\x85\x08\x86\x08\x87\x08\x88\x08\x89\x08\x8a\x08\x8b\x08\x8c\x08\x8d\x08\x8e\x08\x8f\x08\xf8\x07\xf9\x07\xfb\x07\xfa\x07\xfc\x07\xfd\x07\xff\x07\xfe\x07\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x65\x72\x5f\x69\x6d\x6d\x75\x6e\x65\x0f\xec\x03\x22\xe8\x02\xe9\x02\xfb\x04\xf8\x02\xfc\x04\xfd\x04\xe0\x06\xe1\x06\x9c\x01\xed\x03\xc2\x08\xe2\x06\xe3\x06\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x70\x72\x65\x73\x73\x75\x72\x65\x5f\x70\x6c\x61\x74\x65\x73\x0c\xf8\x01\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfe\x01\xff\x01\xce\x06\xcf\x06\x80\x02\x81\x02\xfd\x01\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x72\x6d\x61\x64\x69\x6c\x6c\x6f\x5f\x73\x70\x61\x77\x6e\x61\x62\x6c\x65\x5f\x6f\x6e\x0a\x08\x8a\x04\xc4\x03\xc8\x03\xc5\x03\xd2\x03\xd0\x03\xcc\x03\x27\x0a\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x63\x61\x63\x69\x61\x5f\x6c\x6f\x67\x73\x04\x35\x4b\x40\x53\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x6e\x65\x74\x68\x65\x72\x69\x74\x65\x5f\x74\x6f\x6f\x6c\x00\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x64\x6c\x65\x73\x11\x87\x07\x88\x07\x89\x07\x8a\x07\x8b\x07\x8c\x07\x8d\x07\x8e\x07\x8f\x07\x90\x07\x91\x07\x92\x07\x93\x07\x94\x07\x95\x07\x96\x07\x97\x07\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x61\x67\x6f\x6e\x5f\x74\x72\x61\x6e\x73\x70\x61\x72\x65\x6e\x74\x03\xed\x03\xb7\x01\xb8\x01\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x75\x6e\x64\x65\x72\x77\x61\x74\x65\x72\x5f\x62\x6f\x6e\x65\x6d\x65\x61\x6c\x73\x10\x88\x01\xda\x05\xdb\x05\xdc\x05\xdd\x05\xde\x05\xe4\x05\xe5\x05\xe6\x05\xe7\x05\xe8\x05\xee\x05\xef\x05\xf0\x05\xf1\x05\xf2\x05\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x70\x72\x65\x73\x73\x75\x72\x65\x5f\x70\x6c\x61\x74\x65\x73\x02\xf6\x01\x81\x07\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6d\x70\x65\x72\x6d\x65\x61\x62\x6c\x65\x12\x65\x9d\x02\x9e\x02\x9f\x02\xa0\x02\xa1\x02\xa2\x02\xa3\x02\xa4\x02\xa5\x02\xa6\x02\xa7\x02\xa8\x02\xa9\x02\xaa\x02\xab\x02\xac\x02\xbe\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x03\x87\x02\x89\x02\xbf\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x6e\x64\x03\x25\x27\x26\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x79\x6c\x69\x75\x6d\x02\xc2\x06\xb9\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x70\x70\x65\x72\x5f\x6f\x72\x65\x73\x02\xca\x07\xcb\x07\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x6c\x64\x5f\x6f\x72\x65\x73\x03\x2a\x30\x2b\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x61\x6c\x6c\x5f\x64\x72\x69\x70\x6c\x65\x61\x66\x5f\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x02\x8c\x02\x9c\x08\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x6f\x72\x72\x65\x63\x74\x5f\x66\x6f\x72\x5f\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x74\x6f\x6f\x6c\x00\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6d\x65\x6c\x5f\x73\x61\x6e\x64\x5f\x73\x74\x65\x70\x5f\x73\x6f\x75\x6e\x64\x5f\x62\x6c\x6f\x63\x6b\x73\x13\x25\x27\x26\xb6\x05\xb7\x05\xb8\x05\xb9\x05\xba\x05\xbb\x05\xbc\x05\xbd\x05\xbe\x05\xbf\x05\xc0\x05\xc1\x05\xc2\x05\xc3\x05\xc4\x05\xc5\x05\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6d\x70\x6c\x65\x74\x65\x73\x5f\x66\x69\x6e\x64\x5f\x74\x72\x65\x65\x5f\x74\x75\x74\x6f\x72\x69\x61\x6c\x39\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\xbe\x06\xbf\x06\xc0\x06\xc1\x06\xb5\x06\xb6\x06\xb7\x06\xb8\x06\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x80\x05\xbb\x06\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6f\x67\x73\x5f\x74\x68\x61\x74\x5f\x62\x75\x72\x6e\x24\x37\x4d\x42\x55\x38\x14\x43\x56\x31\x47\x44\x4f\x35\x4b\x40\x53\x33\x49\x3e\x51\x34\x4a\x3f\x52\x32\x48\x3d\x50\x39\x4e\x45\x57\x36\x4c\x41\x54\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x69\x6e\x65\x61\x62\x6c\x65\x2f\x68\x6f\x65\x1d\x5b\x58\x59\x5f\x5e\x5c\x5a\x61\x62\x60\x5d\x80\x05\xbb\x06\xf9\x03\xc8\x05\xe5\x06\xc4\x06\x63\x64\xc0\x07\xc1\x07\x9c\x08\x98\x08\xc8\x08\xc9\x08\xc2\x07\xc4\x07\xc3\x07\xc5\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x72\x74\x0a\x09\x08\x0b\x0a\xd6\x02\xa1\x08\x9c\x08\xc8\x08\xa2\x08\x3b\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x1d\x00\x23\x24\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\xb7\x01\xb8\x01\x87\x02\xcf\x02\xd0\x02\xd1\x02\xed\x03\x91\x04\x92\x04\x83\x05\xf9\x05\xfa\x05\xfb\x05\xbc\x06\xbd\x06\xc9\x06\x9b\x08\xa0\x08\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x64\x6c\x65\x5f\x63\x61\x6b\x65\x73\x11\x98\x07\x99\x07\x9a\x07\x9b\x07\x9c\x07\x9d\x07\x9e\x07\x9f\x07\xa0\x07\xa1\x07\xa2\x07\xa3\x07\xa4\x07\xa5\x07\xa6\x07\xa7\x07\xa8\x07\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x65\x64\x73\x5f\x69\x72\x6f\x6e\x5f\x74\x6f\x6f\x6c\x0c\xc0\x01\xbe\x01\xbf\x01\xef\x02\xf0\x02\xf4\x02\xad\x01\xbb\x08\x2a\x2b\x82\x02\x83\x02\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x6d\x61\x67\x65\x5f\x74\x79\x70\x65\x21\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x65\x66\x66\x65\x63\x74\x73\x01\x27\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x66\x61\x6c\x6c\x03\x0a\x08\x26\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x67\x6e\x69\x74\x65\x73\x5f\x61\x72\x6d\x6f\x72\x5f\x73\x74\x61\x6e\x64\x73\x02\x15\x03\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x63\x68\x5f\x72\x65\x73\x69\x73\x74\x61\x6e\x74\x5f\x74\x6f\x04\x1b\x17\x24\x2a\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x75\x72\x6e\x73\x5f\x61\x72\x6d\x6f\x72\x5f\x73\x74\x61\x6e\x64\x73\x01\x1f\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x76\x6f\x69\x64\x73\x5f\x67\x75\x61\x72\x64\x69\x61\x6e\x5f\x74\x68\x6f\x72\x6e\x73\x06\x1b\x2a\x0f\x09\x23\x01\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x72\x65\x73\x69\x73\x74\x61\x6e\x63\x65\x02\x20\x13\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6e\x69\x63\x5f\x65\x6e\x76\x69\x72\x6f\x6e\x6d\x65\x6e\x74\x61\x6c\x5f\x63\x61\x75\x73\x65\x73\x07\x02\x11\x14\x15\x18\x19\x1f\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x63\x65\x5f\x73\x6d\x61\x73\x68\x01\x1a\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x77\x6f\x6c\x66\x5f\x61\x72\x6d\x6f\x72\x0d\x20\x13\x04\x06\x07\x11\x16\x17\x1b\x21\x27\x2a\x2f\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x6d\x61\x67\x65\x73\x5f\x68\x65\x6c\x6d\x65\x74\x03\x0b\x0c\x0d\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x75\x72\x6e\x5f\x66\x72\x6f\x6d\x5f\x73\x74\x65\x70\x70\x69\x6e\x67\x02\x03\x14\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x73\x68\x69\x65\x6c\x64\x1d\x1f\x16\x04\x06\x10\x12\x2f\x05\x27\x0a\x08\x11\x26\x1b\x17\x20\x13\x24\x21\x02\x03\x07\x0b\x0d\x14\x15\x18\x19\x29\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x5f\x69\x6d\x70\x61\x63\x74\x01\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x66\x72\x65\x65\x7a\x69\x6e\x67\x01\x11\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x70\x72\x6f\x6a\x65\x63\x74\x69\x6c\x65\x08\x00\x2c\x1e\x2d\x0e\x30\x2b\x2e\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x65\x6e\x63\x68\x61\x6e\x74\x6d\x65\x6e\x74\x73\x01\x24\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x77\x61\x79\x73\x5f\x6d\x6f\x73\x74\x5f\x73\x69\x67\x6e\x69\x66\x69\x63\x61\x6e\x74\x5f\x66\x61\x6c\x6c\x01\x20\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x5f\x62\x72\x65\x61\x6b\x5f\x61\x72\x6d\x6f\x72\x5f\x73\x74\x61\x6e\x64\x03\x23\x22\x1a\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x61\x72\x6d\x6f\x72\x13\x1f\x16\x04\x06\x10\x12\x2f\x05\x27\x0a\x08\x11\x26\x1b\x17\x20\x13\x24\x21\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x79\x70\x61\x73\x73\x65\x73\x5f\x69\x6e\x76\x75\x6c\x6e\x65\x72\x61\x62\x69\x6c\x69\x74\x79\x02\x20\x13\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x5f\x6b\x6e\x6f\x63\x6b\x62\x61\x63\x6b\x1c\x09\x23\x01\x15\x19\x1f\x18\x14\x16\x04\x06\x27\x02\x0a\x08\x10\x20\x12\x1b\x2f\x05\x07\x29\x11\x26\x21\x13\x03\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x5f\x61\x6e\x67\x65\x72\x01\x1d\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x64\x72\x6f\x77\x6e\x69\x6e\x67\x01\x06\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x77\x61\x79\x73\x5f\x74\x72\x69\x67\x67\x65\x72\x73\x5f\x73\x69\x6c\x76\x65\x72\x66\x69\x73\x68\x01\x1b\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6e\x69\x63\x5f\x63\x61\x75\x73\x65\x73\x1b\x02\x11\x14\x15\x18\x19\x1f\x00\x05\x09\x0e\x0f\x17\x1b\x1c\x1e\x23\x24\x28\x2b\x2c\x2d\x2e\x2f\x30\x22\x1a\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x77\x61\x79\x73\x5f\x68\x75\x72\x74\x73\x5f\x65\x6e\x64\x65\x72\x5f\x64\x72\x61\x67\x6f\x6e\x73\x04\x0f\x09\x23\x01\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x66\x69\x72\x65\x07\x15\x03\x1f\x18\x14\x2d\x0e\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x65\x72\x5f\x69\x6d\x6d\x75\x6e\x65\x5f\x74\x6f\x01\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x65\x78\x70\x6c\x6f\x73\x69\x6f\x6e\x04\x0f\x09\x23\x01\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x77\x61\x79\x73\x5f\x6b\x69\x6c\x6c\x73\x5f\x61\x72\x6d\x6f\x72\x5f\x73\x74\x61\x6e\x64\x73\x05\x00\x2c\x0e\x30\x2e\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6c\x69\x67\x68\x74\x6e\x69\x6e\x67\x01\x19\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x70\x6c\x61\x79\x65\x72\x5f\x61\x74\x74\x61\x63\x6b\x02\x22\x1a\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x6d\x65\x6e\x74\x16\x2b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x76\x65\x6e\x74\x73\x5f\x64\x65\x63\x6f\x72\x61\x74\x65\x64\x5f\x70\x6f\x74\x5f\x73\x68\x61\x74\x74\x65\x72\x69\x6e\x67\x01\x21\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x65\x61\x73\x75\x72\x65\x07\x02\x28\x25\x23\x0e\x16\x29\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x6f\x6f\x6c\x74\x69\x70\x5f\x6f\x72\x64\x65\x72\x2a\x02\x28\x1f\x05\x29\x0e\x20\x22\x01\x0f\x19\x06\x04\x18\x24\x17\x0a\x0c\x11\x1c\x1b\x03\x0b\x1a\x09\x0d\x12\x21\x14\x08\x1d\x15\x1e\x00\x23\x25\x07\x26\x13\x27\x10\x16\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x6f\x75\x62\x6c\x65\x5f\x74\x72\x61\x64\x65\x5f\x70\x72\x69\x63\x65\x07\x02\x28\x25\x23\x0e\x16\x29\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6e\x5f\x74\x72\x61\x64\x65\x64\x5f\x65\x71\x75\x69\x70\x6d\x65\x6e\x74\x23\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x61\x64\x65\x61\x62\x6c\x65\x27\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x02\x28\x0e\x16\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6e\x5f\x72\x61\x6e\x64\x6f\x6d\x5f\x6c\x6f\x6f\x74\x27\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x02\x28\x0e\x16\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x62\x6f\x77\x02\x10\x16\x29\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x76\x65\x6e\x74\x73\x5f\x62\x65\x65\x5f\x73\x70\x61\x77\x6e\x73\x5f\x77\x68\x65\x6e\x5f\x6d\x69\x6e\x69\x6e\x67\x01\x21\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x76\x65\x6e\x74\x73\x5f\x69\x6e\x66\x65\x73\x74\x65\x64\x5f\x73\x70\x61\x77\x6e\x73\x01\x21\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x6e\x5f\x74\x72\x65\x61\x73\x75\x72\x65\x23\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x72\x69\x70\x74\x69\x64\x65\x02\x13\x05\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x64\x61\x6d\x61\x67\x65\x06\x20\x22\x01\x0f\x06\x04\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x6e\x5f\x6d\x6f\x62\x5f\x73\x70\x61\x77\x6e\x5f\x65\x71\x75\x69\x70\x6d\x65\x6e\x74\x23\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x63\x72\x6f\x73\x73\x62\x6f\x77\x02\x17\x18\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x65\x6c\x74\x73\x5f\x6c\x6f\x6f\x74\x01\x0a\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x61\x72\x6d\x6f\x72\x04\x1b\x03\x0b\x1a\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x62\x6f\x6f\x74\x73\x02\x0e\x07\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x5f\x65\x6e\x63\x68\x61\x6e\x74\x69\x6e\x67\x5f\x74\x61\x62\x6c\x65\x23\x1b\x0b\x09\x03\x1a\x1e\x00\x26\x07\x20\x22\x01\x11\x0a\x12\x24\x08\x21\x27\x0d\x19\x1c\x0c\x10\x14\x15\x13\x0f\x1f\x05\x17\x1d\x18\x06\x04\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x65\x76\x65\x6e\x74\x73\x5f\x69\x63\x65\x5f\x6d\x65\x6c\x74\x69\x6e\x67\x01\x21\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x75\x72\x73\x65\x02\x02\x28\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x78\x63\x6c\x75\x73\x69\x76\x65\x5f\x73\x65\x74\x2f\x6d\x69\x6e\x69\x6e\x67\x02\x0d\x21\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x74\x69\x74\x79\x5f\x74\x79\x70\x65\x25\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x78\x6f\x6c\x6f\x74\x6c\x5f\x61\x6c\x77\x61\x79\x73\x5f\x68\x6f\x73\x74\x69\x6c\x65\x73\x03\x24\x3c\x26\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x65\x65\x7a\x65\x5f\x69\x6d\x6d\x75\x6e\x65\x5f\x65\x6e\x74\x69\x74\x79\x5f\x74\x79\x70\x65\x73\x04\x7a\x62\x73\x8b\x01\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6d\x6d\x75\x6e\x65\x5f\x74\x6f\x5f\x6f\x6f\x7a\x69\x6e\x67\x01\x6f\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6c\x6c\x61\x67\x65\x72\x04\x2c\x41\x61\x86\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x75\x6e\x64\x65\x61\x64\x0e\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x29\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x65\x6e\x73\x69\x74\x69\x76\x65\x5f\x74\x6f\x5f\x62\x61\x6e\x65\x5f\x6f\x66\x5f\x61\x72\x74\x68\x72\x6f\x70\x6f\x64\x73\x05\x0b\x28\x6c\x76\x15\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6f\x61\x74\x0a\x54\x77\x0c\x47\x00\x16\x1f\x59\x4e\x09\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x67\x5f\x66\x6f\x6f\x64\x02\x6f\x4d\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x5f\x65\x71\x75\x69\x70\x5f\x73\x61\x64\x64\x6c\x65\x08\x3f\x6e\x91\x01\x22\x53\x5e\x7b\x13\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x64\x69\x72\x65\x63\x74\x61\x62\x6c\x65\x5f\x70\x72\x6f\x6a\x65\x63\x74\x69\x6c\x65\x03\x32\x89\x01\x12\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x61\x6c\x6c\x5f\x64\x61\x6d\x61\x67\x65\x5f\x69\x6d\x6d\x75\x6e\x65\x10\x43\x73\x6a\x02\x0a\x0b\x0e\x14\x19\x37\x5d\x4d\x56\x5c\x8b\x01\x11\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x61\x69\x64\x65\x72\x73\x06\x2c\x61\x67\x86\x01\x41\x8a\x01\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6f\x77\x64\x65\x72\x5f\x73\x6e\x6f\x77\x5f\x77\x61\x6c\x6b\x61\x62\x6c\x65\x5f\x6d\x6f\x62\x73\x04\x66\x28\x6c\x34\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x72\x74\x68\x72\x6f\x70\x6f\x64\x05\x0b\x28\x6c\x76\x15\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x76\x65\x72\x74\x65\x64\x5f\x68\x65\x61\x6c\x69\x6e\x67\x5f\x61\x6e\x64\x5f\x68\x61\x72\x6d\x0e\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6d\x6d\x75\x6e\x65\x5f\x74\x6f\x5f\x69\x6e\x66\x65\x73\x74\x65\x64\x01\x6c\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x78\x6f\x6c\x6f\x74\x6c\x5f\x68\x75\x6e\x74\x5f\x74\x61\x72\x67\x65\x74\x73\x07\x82\x01\x65\x68\x1a\x79\x3a\x7c\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x7a\x6f\x6d\x62\x69\x65\x73\x07\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x65\x6e\x73\x69\x74\x69\x76\x65\x5f\x74\x6f\x5f\x73\x6d\x69\x74\x65\x0e\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x73\x6d\x6f\x75\x6e\x74\x73\x5f\x75\x6e\x64\x65\x72\x77\x61\x74\x65\x72\x0c\x13\x19\x22\x3f\x4b\x53\x5e\x67\x76\x7b\x80\x01\x91\x01\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x5f\x77\x65\x61\x72\x5f\x68\x6f\x72\x73\x65\x5f\x61\x72\x6d\x6f\x72\x01\x3f\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6d\x70\x61\x63\x74\x5f\x70\x72\x6f\x6a\x65\x63\x74\x69\x6c\x65\x73\x0c\x06\x75\x33\x72\x32\x70\x25\x81\x01\x23\x8d\x01\x89\x01\x12\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x68\x69\x76\x65\x5f\x69\x6e\x68\x61\x62\x69\x74\x6f\x72\x73\x01\x0b\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x74\x5f\x73\x63\x61\x72\x79\x5f\x66\x6f\x72\x5f\x70\x75\x66\x66\x65\x72\x66\x69\x73\x68\x0b\x83\x01\x3c\x26\x1a\x65\x68\x82\x01\x21\x79\x3a\x7c\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x6e\x5f\x63\x6f\x6e\x74\x72\x6f\x6c\x6c\x69\x6e\x67\x5f\x72\x69\x64\x65\x72\x02\x6f\x4d\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6b\x65\x6c\x65\x74\x6f\x6e\x73\x05\x6d\x7a\x8c\x01\x6e\x10\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x5f\x74\x75\x72\x6e\x5f\x69\x6e\x5f\x62\x6f\x61\x74\x73\x01\x11\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x5f\x62\x72\x65\x61\x74\x68\x65\x5f\x75\x6e\x64\x65\x72\x5f\x77\x61\x74\x65\x72\x1b\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x07\x35\x3c\x26\x83\x01\x3a\x1a\x65\x68\x79\x82\x01\x7c\x05\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x72\x72\x6f\x77\x73\x02\x06\x75\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x65\x72\x5f\x66\x72\x69\x65\x6e\x64\x73\x0e\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x65\x65\x7a\x65\x5f\x68\x75\x72\x74\x73\x5f\x65\x78\x74\x72\x61\x5f\x74\x79\x70\x65\x73\x03\x7b\x0e\x4d\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x5f\x61\x6e\x67\x65\x72\x5f\x66\x72\x6f\x6d\x5f\x77\x69\x6e\x64\x5f\x63\x68\x61\x72\x67\x65\x09\x11\x6d\x10\x7a\x90\x01\x40\x76\x15\x6f\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x71\x75\x61\x74\x69\x63\x0c\x83\x01\x07\x3c\x26\x1a\x65\x68\x82\x01\x21\x79\x3a\x7c\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6c\x6c\x61\x67\x65\x72\x5f\x66\x72\x69\x65\x6e\x64\x73\x04\x2c\x41\x61\x86\x01\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x66\x6c\x65\x63\x74\x73\x5f\x70\x72\x6f\x6a\x65\x63\x74\x69\x6c\x65\x73\x01\x11\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x67\x6e\x6f\x72\x65\x73\x5f\x70\x6f\x69\x73\x6f\x6e\x5f\x61\x6e\x64\x5f\x72\x65\x67\x65\x6e\x0e\x6d\x7a\x8c\x01\x6e\x10\x91\x01\x90\x01\x92\x01\x93\x01\x8f\x01\x24\x40\x8b\x01\x5d\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x65\x6e\x73\x69\x74\x69\x76\x65\x5f\x74\x6f\x5f\x69\x6d\x70\x61\x6c\x69\x6e\x67\x0c\x83\x01\x07\x3c\x26\x1a\x65\x68\x82\x01\x21\x79\x3a\x7c\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6c\x75\x69\x64\x02\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x61\x76\x61\x02\x04\x03\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x74\x65\x72\x02\x02\x01\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x61\x6d\x65\x5f\x65\x76\x65\x6e\x74\x05\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x73\x37\x01\x02\x03\x05\x06\x07\x08\x00\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x18\x19\x1a\x1b\x1c\x20\x21\x22\x23\x24\x26\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x17\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x67\x6e\x6f\x72\x65\x5f\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x73\x5f\x73\x6e\x65\x61\x6b\x69\x6e\x67\x06\x1a\x24\x29\x2a\x1d\x1c\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x64\x65\x6e\x5f\x63\x61\x6e\x5f\x6c\x69\x73\x74\x65\x6e\x38\x01\x02\x03\x05\x06\x07\x08\x00\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x18\x19\x1a\x1b\x1c\x20\x21\x22\x23\x24\x26\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x27\x25\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x6c\x61\x79\x5f\x63\x61\x6e\x5f\x6c\x69\x73\x74\x65\x6e\x01\x21\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x68\x72\x69\x65\x6b\x65\x72\x5f\x63\x61\x6e\x5f\x6c\x69\x73\x74\x65\x6e\x01\x25\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x73\x74\x72\x75\x6d\x65\x6e\x74\x03\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x63\x72\x65\x61\x6d\x69\x6e\x67\x5f\x67\x6f\x61\x74\x5f\x68\x6f\x72\x6e\x73\x04\x00\x01\x07\x02\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x61\x74\x5f\x68\x6f\x72\x6e\x73\x08\x04\x06\x05\x03\x00\x01\x07\x02\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x67\x75\x6c\x61\x72\x5f\x67\x6f\x61\x74\x5f\x68\x6f\x72\x6e\x73\x04\x04\x06\x05\x03\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x74\x65\x6d\xb0\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6b\x75\x6c\x6c\x73\x07\x8f\x09\x91\x09\x90\x09\x8d\x09\x8e\x09\x92\x09\x93\x09\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6f\x75\x6c\x5f\x66\x69\x72\x65\x5f\x62\x61\x73\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x02\xdc\x02\xdd\x02\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x69\x6d\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x0b\xd1\x06\xd5\x06\xcd\x06\xce\x06\xd7\x06\xd3\x06\xcf\x06\xd8\x06\xd0\x06\xaf\x05\x9a\x09\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x65\x61\x64\x5f\x61\x72\x6d\x6f\x72\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x61\x63\x6f\x6e\x5f\x70\x61\x79\x6d\x65\x6e\x74\x5f\x69\x74\x65\x6d\x73\x05\xd8\x06\xce\x06\xcd\x06\xd7\x06\xd3\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x73\x6c\x61\x62\x73\x0c\x8e\x02\x8f\x02\x90\x02\x91\x02\x92\x02\x94\x02\x95\x02\x99\x02\x9a\x02\x96\x02\x97\x02\x93\x02\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x61\x6c\x5f\x6f\x72\x65\x73\x02\x40\x41\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6c\x65\x5f\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x8c\x01\xb1\x01\x9b\x01\xa6\x01\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x69\x63\x6b\x65\x6e\x5f\x66\x6f\x6f\x64\x06\xfd\x06\x97\x08\x96\x08\xc2\x09\xbf\x09\xc0\x09\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x61\x6c\x6c\x5f\x66\x6c\x6f\x77\x65\x72\x73\x10\xe5\x01\xe6\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xe7\x01\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x72\x72\x6f\x74\x5f\x70\x6f\x69\x73\x6f\x6e\x6f\x75\x73\x5f\x66\x6f\x6f\x64\x01\x90\x08\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x74\x72\x61\x70\x64\x6f\x6f\x72\x73\x0c\x80\x06\xfe\x05\x82\x06\x83\x06\xff\x05\xfc\x05\xfd\x05\x86\x06\x87\x06\x84\x06\x85\x06\x81\x06\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x5f\x66\x6f\x6f\x64\x03\x87\x09\x88\x09\xc1\x09\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x6c\x65\x61\x74\x68\x65\x72\x5f\x61\x72\x6d\x6f\x72\x01\xbb\x07\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x61\x72\x6d\x6f\x72\x01\xcd\x06\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x72\x6f\x6e\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x01\xd3\x06\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x69\x6d\x6d\x61\x62\x6c\x65\x5f\x61\x72\x6d\x6f\x72\x19\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x73\x61\x66\x65\x5f\x61\x72\x6d\x6f\x72\x04\x90\x07\x91\x07\x92\x07\x93\x07\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x6d\x61\x63\x65\x01\x83\x09\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x6c\x10\xd5\x01\xd6\x01\xd7\x01\xd8\x01\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x61\x69\x72\x73\x3a\x9c\x03\x9d\x03\x9e\x03\x9f\x03\xa0\x03\xa2\x03\xa3\x03\xa7\x03\xa8\x03\xa4\x03\xa5\x03\xa1\x03\xa6\x03\xc4\x02\x99\x03\x8f\x03\x87\x03\x86\x03\xbc\x02\xc8\x03\x9f\x04\x99\x04\x98\x04\x9a\x04\x8b\x05\x8c\x05\x8d\x05\x8e\x05\x8f\x05\x90\x05\x91\x05\x92\x05\x93\x05\x94\x05\x95\x05\x96\x05\x97\x05\x98\x05\x8e\x0a\x96\x0a\x92\x0a\x99\x05\x9a\x05\x9c\x05\x9b\x05\x6d\x6c\x6b\x6a\x80\x01\x7f\x7e\x81\x01\x88\x03\x0e\x13\x17\x82\x03\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6f\x67\x73\x2c\x8d\x01\xb2\x01\x9a\x01\xa5\x01\x8c\x01\xb1\x01\x9b\x01\xa6\x01\x86\x01\xab\x01\x94\x01\x9f\x01\x8a\x01\xaf\x01\x98\x01\xa3\x01\x88\x01\xad\x01\x96\x01\xa1\x01\x89\x01\xae\x01\x97\x01\xa2\x01\x87\x01\xac\x01\x95\x01\xa0\x01\x8e\x01\xb3\x01\x9c\x01\xa7\x01\x8b\x01\xb0\x01\x99\x01\xa4\x01\x91\x01\x9d\x01\xb4\x01\xa8\x01\x92\x01\x9e\x01\xb5\x01\xa9\x01\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x65\x65\x70\x65\x72\x5f\x64\x72\x6f\x70\x5f\x6d\x75\x73\x69\x63\x5f\x64\x69\x73\x63\x73\x0c\xcf\x09\xd0\x09\xd1\x09\xd2\x09\xd5\x09\xd6\x09\xd7\x09\xd8\x09\xd9\x09\xda\x09\xdb\x09\xdc\x09\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6d\x65\x6c\x5f\x66\x6f\x6f\x64\x01\xc8\x02\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x6c\x64\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x01\xd7\x06\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x72\x72\x6f\x77\x73\x03\xca\x06\xc7\x09\xc6\x09\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x77\x6f\x6c\x66\x5f\x61\x72\x6d\x6f\x72\x01\xc4\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x6c\x5f\x63\x61\x72\x70\x65\x74\x73\x10\xdc\x03\xdd\x03\xde\x03\xdf\x03\xe0\x03\xe1\x03\xe2\x03\xe3\x03\xe4\x03\xe5\x03\xe6\x03\xe7\x03\xe8\x03\xe9\x03\xea\x03\xeb\x03\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6d\x70\x61\x73\x73\x65\x73\x02\xcc\x07\xcd\x07\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x75\x72\x6e\x61\x63\x65\x5f\x6d\x69\x6e\x65\x63\x61\x72\x74\x5f\x66\x75\x65\x6c\x02\xcb\x06\xcc\x06\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x77\x5f\x66\x6f\x6f\x64\x01\xfe\x06\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6f\x6f\x6b\x73\x68\x65\x6c\x66\x5f\x62\x6f\x6f\x6b\x73\x05\xc7\x07\x81\x09\x98\x09\x80\x09\xcd\x09\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x66\x69\x73\x68\x69\x6e\x67\x01\xdf\x07\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x63\x6f\x72\x61\x74\x65\x64\x5f\x70\x6f\x74\x5f\x69\x6e\x67\x72\x65\x64\x69\x65\x6e\x74\x73\x18\xc3\x07\xc8\x0a\xc9\x0a\xca\x0a\xcb\x0a\xcc\x0a\xcd\x0a\xce\x0a\xcf\x0a\xd1\x0a\xd3\x0a\xd4\x0a\xd5\x0a\xd6\x0a\xd7\x0a\xd8\x0a\xd9\x0a\xdb\x0a\xdc\x0a\xdd\x0a\xde\x0a\xd0\x0a\xd2\x0a\xda\x0a\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x64\x6f\x6f\x72\x73\x0c\xe7\x05\xe8\x05\xe9\x05\xea\x05\xeb\x05\xed\x05\xee\x05\xf1\x05\xf2\x05\xef\x05\xf0\x05\xec\x05\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x73\x77\x6f\x72\x64\x06\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x6f\x72\x73\x65\x5f\x66\x6f\x6f\x64\x07\xfe\x06\xfe\x07\xdb\x03\xc8\x06\x8c\x09\x9c\x07\x9d\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x65\x61\x74\x0b\x98\x08\x9a\x08\x99\x08\x9b\x08\xab\x09\x9a\x07\x9e\x09\xaa\x09\x99\x07\x9d\x09\x9c\x08\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x70\x65\x64\x5f\x73\x74\x65\x6d\x73\x04\x92\x01\x9e\x01\xb5\x01\xa9\x01\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6d\x65\x72\x61\x6c\x64\x5f\x6f\x72\x65\x73\x02\x4a\x4b\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x66\x69\x72\x65\x5f\x61\x73\x70\x65\x63\x74\x07\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\x83\x09\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x69\x6d\x73\x6f\x6e\x5f\x73\x74\x65\x6d\x73\x04\x91\x01\x9d\x01\xb4\x01\xa8\x01\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6d\x62\x6f\x6f\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x93\x01\xaa\x01\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6c\x66\x5f\x66\x6f\x6f\x64\x12\x98\x08\x9a\x08\x99\x08\x9b\x08\xab\x09\x9a\x07\x9e\x09\xaa\x09\x99\x07\x9d\x09\x9c\x08\xe3\x07\xe7\x07\xe4\x07\xe8\x07\xe5\x07\xe6\x07\x9f\x09\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x6f\x72\x73\x65\x5f\x74\x65\x6d\x70\x74\x5f\x69\x74\x65\x6d\x73\x03\x8c\x09\x9c\x07\x9d\x07\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x62\x6f\x77\x01\xc9\x06\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x67\x6e\x6f\x72\x65\x64\x5f\x62\x79\x5f\x70\x69\x67\x6c\x69\x6e\x5f\x62\x61\x62\x69\x65\x73\x01\xbb\x07\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x77\x6f\x72\x64\x73\x06\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x03\x23\x8c\x0a\x09\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x6c\x65\x67\x5f\x61\x72\x6d\x6f\x72\x06\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x65\x72\x72\x61\x63\x6f\x74\x74\x61\x11\xec\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\xd4\x03\xd5\x03\xd6\x03\xd7\x03\xd8\x03\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x72\x74\x5f\x62\x6c\x6f\x63\x6b\x73\x02\xa3\x04\xa4\x04\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x72\x6b\x5f\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x8d\x01\xb2\x01\x9a\x01\xa5\x01\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x64\x75\x72\x61\x62\x69\x6c\x69\x74\x79\x43\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\xa9\x06\xc9\x09\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\xc9\x06\xe6\x09\xe3\x09\xc6\x06\x93\x08\xb4\x0a\xdf\x07\xa6\x06\xa7\x06\x83\x09\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x72\x69\x64\x65\x72\x5f\x66\x6f\x6f\x64\x01\xfa\x01\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x69\x6c\x6c\x61\x67\x65\x72\x5f\x70\x69\x63\x6b\x73\x5f\x75\x70\x09\xfd\x06\x88\x09\x87\x09\xc2\x09\xbf\x09\xc0\x09\xff\x06\xfe\x06\xc1\x09\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x6e\x5f\x66\x6c\x61\x6d\x6d\x61\x62\x6c\x65\x5f\x77\x6f\x6f\x64\x1e\x92\x01\x9e\x01\xb5\x01\xa9\x01\x91\x01\x9d\x01\xb4\x01\xa8\x01\x2e\x2f\x99\x02\x9a\x02\xe4\x05\xe5\x05\xd6\x02\xd7\x02\x86\x06\x87\x06\x9a\x06\x9b\x06\xa7\x03\xa8\x03\xd4\x05\xd5\x05\xf1\x05\xf2\x05\xa8\x07\xa9\x07\xb5\x07\xb4\x07\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x61\x6c\x73\x02\xcb\x06\xcc\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x6f\x67\x6c\x69\x6e\x5f\x66\x6f\x6f\x64\x01\xf9\x01\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x66\x6f\x6f\x64\x02\x99\x07\x9a\x07\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x69\x72\x6f\x6e\x5f\x61\x72\x6d\x6f\x72\x01\xd3\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x68\x75\x6c\x6b\x65\x72\x5f\x62\x6f\x78\x65\x73\x11\xa8\x04\xb8\x04\xb4\x04\xb5\x04\xb2\x04\xb0\x04\xb6\x04\xac\x04\xb1\x04\xae\x04\xab\x04\xaa\x04\xaf\x04\xb3\x04\xb7\x04\xa9\x04\xad\x04\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x70\x72\x65\x66\x65\x72\x72\x65\x64\x5f\x77\x65\x61\x70\x6f\x6e\x73\x01\xe6\x09\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x72\x65\x61\x6b\x73\x5f\x64\x65\x63\x6f\x72\x61\x74\x65\x64\x5f\x70\x6f\x74\x73\x20\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\xe3\x09\x83\x09\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6e\x76\x69\x6c\x03\xc1\x03\xc2\x03\xc3\x03\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x69\x72\x63\x68\x5f\x6c\x6f\x67\x73\x04\x88\x01\xad\x01\x96\x01\xa1\x01\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6e\x64\x61\x5f\x65\x61\x74\x73\x5f\x66\x72\x6f\x6d\x5f\x67\x72\x6f\x75\x6e\x64\x02\x8d\x02\xff\x07\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x78\x65\x73\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x6d\x69\x6e\x69\x6e\x67\x19\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\x93\x08\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x61\x70\x69\x73\x5f\x6f\x72\x65\x73\x02\x4c\x4d\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x6f\x65\x73\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x74\x75\x72\x74\x6c\x65\x5f\x68\x65\x6c\x6d\x65\x74\x01\xc3\x06\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6c\x61\x6d\x61\x5f\x66\x6f\x6f\x64\x02\xfe\x06\xdb\x03\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x69\x66\x66\x65\x72\x5f\x66\x6f\x6f\x64\x01\xbf\x09\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x68\x65\x61\x64\x5f\x61\x72\x6d\x6f\x72\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x65\x6e\x63\x65\x73\x0d\xcc\x02\xd0\x02\xd2\x02\xd3\x02\xcd\x02\xce\x02\xcf\x02\xd6\x02\xd7\x02\xd4\x02\xd5\x02\xd1\x02\x8e\x03\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x70\x6c\x69\x6e\x67\x73\x0b\x31\x32\x33\x34\x35\x37\x38\xcd\x01\xce\x01\x39\x36\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x72\x72\x6f\x74\x5f\x66\x6f\x6f\x64\x06\xfd\x06\x97\x08\x96\x08\xc2\x09\xbf\x09\xc0\x09\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x64\x73\x10\x8e\x08\x8f\x08\x8b\x08\x8c\x08\x89\x08\x87\x08\x8d\x08\x83\x08\x88\x08\x85\x08\x82\x08\x81\x08\x86\x08\x8a\x08\x80\x08\x84\x08\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x61\x72\x6d\x6f\x72\x19\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x61\x62\x62\x69\x74\x5f\x66\x6f\x6f\x64\x03\x87\x09\x8c\x09\xe5\x01\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x72\x6f\x6e\x5f\x6f\x72\x65\x73\x02\x42\x43\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x75\x6e\x64\x6c\x65\x73\x11\xce\x07\xde\x07\xda\x07\xdb\x07\xd8\x07\xd6\x07\xdc\x07\xd2\x07\xd7\x07\xd4\x07\xd1\x07\xd0\x07\xd5\x07\xd9\x07\xdd\x07\xd3\x07\xcf\x07\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x6c\x6c\x61\x67\x65\x72\x5f\x70\x72\x65\x66\x65\x72\x72\x65\x64\x5f\x77\x65\x61\x70\x6f\x6e\x73\x01\xe6\x09\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x61\x6b\x5f\x6c\x6f\x67\x73\x04\x86\x01\xab\x01\x94\x01\x9f\x01\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x72\x6f\x77\x6e\x65\x64\x5f\x70\x72\x65\x66\x65\x72\x72\x65\x64\x5f\x77\x65\x61\x70\x6f\x6e\x73\x01\xe3\x09\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x6f\x6f\x72\x73\x15\xe7\x05\xe8\x05\xe9\x05\xea\x05\xeb\x05\xed\x05\xee\x05\xf1\x05\xf2\x05\xef\x05\xf0\x05\xec\x05\xf3\x05\xf4\x05\xf5\x05\xf6\x05\xf7\x05\xf8\x05\xf9\x05\xfa\x05\xe6\x05\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6f\x63\x65\x6c\x6f\x74\x5f\x66\x6f\x6f\x64\x02\xe3\x07\xe4\x07\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x6f\x74\x65\x62\x6c\x6f\x63\x6b\x5f\x74\x6f\x70\x5f\x69\x6e\x73\x74\x72\x75\x6d\x65\x6e\x74\x73\x07\x90\x09\x8d\x09\x91\x09\x92\x09\x8e\x09\x93\x09\x8f\x09\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x67\x67\x73\x03\xc9\x07\xca\x07\xcb\x07\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x61\x6e\x6e\x65\x72\x73\x10\xac\x09\xad\x09\xae\x09\xaf\x09\xb0\x09\xb1\x09\xb2\x09\xb3\x09\xb4\x09\xb5\x09\xb6\x09\xb7\x09\xb8\x09\xb9\x09\xba\x09\xbb\x09\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x72\x65\x77\x69\x6e\x67\x5f\x66\x75\x65\x6c\x01\xa6\x08\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x63\x72\x61\x66\x74\x69\x6e\x67\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x03\x23\x8c\x0a\x09\x19\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6d\x65\x6c\x74\x73\x5f\x74\x6f\x5f\x67\x6c\x61\x73\x73\x02\x3b\x3e\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x66\x65\x6e\x63\x65\x73\x0c\xcc\x02\xd0\x02\xd2\x02\xd3\x02\xcd\x02\xce\x02\xcf\x02\xd6\x02\xd7\x02\xd4\x02\xd5\x02\xd1\x02\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x72\x65\x70\x65\x6c\x6c\x65\x6e\x74\x73\x03\xe1\x02\xff\x09\x83\x0a\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x78\x6f\x6c\x6f\x74\x6c\x5f\x66\x6f\x6f\x64\x01\xc0\x07\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x69\x6c\x6c\x61\x67\x65\x72\x5f\x70\x6c\x61\x6e\x74\x61\x62\x6c\x65\x5f\x73\x65\x65\x64\x73\x06\xfd\x06\x88\x09\x87\x09\xc2\x09\xbf\x09\xc0\x09\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x65\x67\x5f\x61\x72\x6d\x6f\x72\x06\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x2a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x65\x72\x5f\x73\x6b\x65\x6c\x65\x74\x6f\x6e\x5f\x64\x69\x73\x6c\x69\x6b\x65\x64\x5f\x77\x65\x61\x70\x6f\x6e\x73\x02\xc9\x06\xe6\x09\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x6e\x64\x61\x5f\x66\x6f\x6f\x64\x01\x8d\x02\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x66\x6f\x6f\x74\x5f\x61\x72\x6d\x6f\x72\x06\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x61\x6d\x70\x65\x6e\x73\x5f\x76\x69\x62\x72\x61\x74\x69\x6f\x6e\x73\x20\xd5\x01\xd6\x01\xd7\x01\xd8\x01\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xdc\x03\xdd\x03\xde\x03\xdf\x03\xe0\x03\xe1\x03\xe2\x03\xe3\x03\xe4\x03\xe5\x03\xe6\x03\xe7\x03\xe8\x03\xe9\x03\xea\x03\xeb\x03\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x6e\x67\x72\x6f\x76\x65\x5f\x6c\x6f\x67\x73\x04\x8e\x01\xb3\x01\x9c\x01\xa7\x01\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6a\x75\x6e\x67\x6c\x65\x5f\x6c\x6f\x67\x73\x04\x89\x01\xae\x01\x97\x01\xa2\x01\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x65\x63\x74\x65\x72\x6e\x5f\x62\x6f\x6f\x6b\x73\x02\x81\x09\x80\x09\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x63\x68\x65\x73\x74\x5f\x61\x72\x6d\x6f\x72\x06\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x75\x72\x74\x6c\x65\x5f\x66\x6f\x6f\x64\x01\xd3\x01\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6c\x61\x6d\x61\x5f\x74\x65\x6d\x70\x74\x5f\x69\x74\x65\x6d\x73\x01\xdb\x03\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x69\x67\x6e\x73\x0c\x9e\x07\x9f\x07\xa0\x07\xa2\x07\xa1\x07\xa4\x07\xa5\x07\xa8\x07\xa9\x07\xa6\x07\xa7\x07\xa3\x07\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x73\x74\x61\x69\x72\x73\x0c\x9c\x03\x9d\x03\x9e\x03\x9f\x03\xa0\x03\xa2\x03\xa3\x03\xa7\x03\xa8\x03\xa4\x03\xa5\x03\xa1\x03\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x72\x75\x63\x65\x5f\x6c\x6f\x67\x73\x04\x87\x01\xac\x01\x95\x01\xa0\x01\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x77\x65\x61\x70\x6f\x6e\x0d\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\x83\x09\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x62\x75\x74\x74\x6f\x6e\x73\x0c\xca\x05\xcb\x05\xcc\x05\xcd\x05\xce\x05\xd0\x05\xd1\x05\xd4\x05\xd5\x05\xd2\x05\xd3\x05\xcf\x05\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6f\x6f\x6b\x5f\x63\x6c\x6f\x6e\x69\x6e\x67\x5f\x74\x61\x72\x67\x65\x74\x01\x80\x09\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6e\x65\x74\x68\x65\x72\x69\x74\x65\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x01\xd8\x06\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x69\x73\x68\x65\x73\x06\xe3\x07\xe7\x07\xe4\x07\xe8\x07\xe6\x07\xe5\x07\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x62\x72\x69\x63\x6b\x73\x04\xea\x02\xeb\x02\xec\x02\xed\x02\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x68\x6f\x76\x65\x6c\x73\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x65\x73\x74\x5f\x62\x6f\x61\x74\x73\x0a\xab\x06\xad\x06\xaf\x06\xb1\x06\xb3\x06\xb7\x06\xb9\x06\xbb\x06\xbd\x06\xb5\x06\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x65\x71\x75\x69\x70\x70\x61\x62\x6c\x65\x22\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\xa9\x06\x8f\x09\x91\x09\x90\x09\x8d\x09\x8e\x09\x92\x09\x93\x09\xd9\x02\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x72\x65\x65\x70\x65\x72\x5f\x69\x67\x6e\x69\x74\x65\x72\x73\x02\xc6\x06\xfe\x08\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x74\x72\x69\x64\x65\x6e\x74\x01\xe3\x09\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x73\x68\x61\x72\x70\x5f\x77\x65\x61\x70\x6f\x6e\x0c\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6c\x61\x62\x73\x3e\x8e\x02\x8f\x02\x90\x02\x91\x02\x92\x02\x94\x02\x95\x02\x99\x02\x9a\x02\x96\x02\x97\x02\x93\x02\x98\x02\x9b\x02\x9c\x02\xa2\x02\x9d\x02\xa8\x02\xa5\x02\xa6\x02\xa1\x02\xa0\x02\xa4\x02\x9f\x02\xa9\x02\xaa\x02\xab\x02\x9d\x05\x9e\x05\x9f\x05\xa0\x05\xa1\x05\xa2\x05\xa3\x05\xa4\x05\xa5\x05\xa6\x05\xa7\x05\xa8\x05\xa9\x05\x9e\x02\xa7\x02\x8d\x0a\x95\x0a\x91\x0a\xaa\x05\xab\x05\xad\x05\xac\x05\x84\x01\x83\x01\x82\x01\x71\x70\x6f\x6e\x85\x01\xa3\x02\x0d\x12\x16\x83\x03\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x6d\x69\x6e\x69\x6e\x67\x5f\x6c\x6f\x6f\x74\x18\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x6e\x65\x74\x68\x65\x72\x69\x74\x65\x5f\x61\x72\x6d\x6f\x72\x01\xd8\x06\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x76\x61\x6e\x69\x73\x68\x69\x6e\x67\x4c\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x82\x07\x86\x07\x92\x07\x8a\x07\x8e\x07\x96\x07\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x80\x07\x84\x07\x90\x07\x88\x07\x8c\x07\x94\x07\xc2\x06\xa9\x06\xc9\x09\xee\x06\xdf\x06\xe4\x06\xf3\x06\xda\x06\xe9\x06\xf1\x06\xe2\x06\xe7\x06\xf6\x06\xdd\x06\xec\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\xef\x06\xe0\x06\xe5\x06\xf4\x06\xdb\x06\xea\x06\xf2\x06\xe3\x06\xe8\x06\xf7\x06\xde\x06\xed\x06\xc9\x06\xe6\x09\xe3\x09\xc6\x06\x93\x08\xb4\x0a\xdf\x07\xa6\x06\xa7\x06\x83\x09\xcc\x07\xd9\x02\x8f\x09\x91\x09\x90\x09\x8d\x09\x8e\x09\x92\x09\x93\x09\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x6e\x67\x69\x6e\x67\x5f\x73\x69\x67\x6e\x73\x0c\xaa\x07\xab\x07\xac\x07\xae\x07\xaf\x07\xad\x07\xb0\x07\xb1\x07\xb4\x07\xb5\x07\xb2\x07\xb3\x07\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x0c\x24\x25\x26\x27\x28\x2a\x2b\x2e\x2f\x2c\x2d\x29\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x74\x72\x61\x70\x64\x6f\x6f\x72\x73\x15\x80\x06\xfe\x05\x82\x06\x83\x06\xff\x05\xfc\x05\xfd\x05\x86\x06\x87\x06\x84\x06\x85\x06\x81\x06\xfb\x05\x88\x06\x89\x06\x8a\x06\x8b\x06\x8c\x06\x8d\x06\x8e\x06\x8f\x06\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x64\x73\x74\x6f\x6e\x65\x5f\x6f\x72\x65\x73\x02\x48\x49\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x75\x70\x6c\x69\x63\x61\x74\x65\x73\x5f\x61\x6c\x6c\x61\x79\x73\x01\xd1\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x65\x72\x72\x79\x5f\x6c\x6f\x67\x73\x04\x8b\x01\xb0\x01\x99\x01\xa4\x01\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6c\x6f\x77\x65\x72\x73\x1e\xe5\x01\xe6\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xe7\x01\xef\x03\xf0\x03\xf2\x03\xf1\x03\xf5\x01\xc0\x01\xce\x01\x39\xbb\x01\x82\x02\x83\x02\xb9\x02\xf6\x01\xc9\x02\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x75\x74\x74\x6f\x6e\x73\x0e\xca\x05\xcb\x05\xcc\x05\xcd\x05\xce\x05\xd0\x05\xd1\x05\xd4\x05\xd5\x05\xd2\x05\xd3\x05\xcf\x05\xc8\x05\xc9\x05\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x79\x65\x61\x62\x6c\x65\x06\x80\x07\x81\x07\x82\x07\x83\x07\xa6\x09\xc5\x06\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x6e\x6b\x73\x0c\x24\x25\x26\x27\x28\x2a\x2b\x2e\x2f\x2c\x2d\x29\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x6f\x61\x74\x73\x14\xaa\x06\xac\x06\xae\x06\xb0\x06\xb2\x06\xb6\x06\xb8\x06\xba\x06\xbc\x06\xb4\x06\xab\x06\xad\x06\xaf\x06\xb1\x06\xb3\x06\xb7\x06\xb9\x06\xbb\x06\xbd\x06\xb5\x06\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6f\x78\x5f\x66\x6f\x6f\x64\x02\x80\x0a\x81\x0a\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x6f\x6e\x65\x5f\x62\x75\x74\x74\x6f\x6e\x73\x02\xc8\x05\xc9\x05\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x65\x6e\x63\x68\x61\x6e\x74\x61\x62\x6c\x65\x2f\x63\x72\x6f\x73\x73\x62\x6f\x77\x01\xe6\x09\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x68\x65\x73\x74\x5f\x61\x72\x6d\x6f\x72\x06\x81\x07\x85\x07\x91\x07\x89\x07\x8d\x07\x95\x07\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x6f\x67\x5f\x66\x6f\x6f\x64\x01\xc8\x07\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6b\x65\x6c\x65\x74\x6f\x6e\x5f\x70\x72\x65\x66\x65\x72\x72\x65\x64\x5f\x77\x65\x61\x70\x6f\x6e\x73\x01\xc9\x06\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x61\x69\x6c\x73\x04\x9e\x06\x9c\x06\x9d\x06\x9f\x06\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x6f\x72\x65\x73\x02\x4e\x4f\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x72\x69\x64\x65\x72\x5f\x74\x65\x6d\x70\x74\x5f\x69\x74\x65\x6d\x73\x02\xfa\x01\xa7\x06\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x65\x61\x76\x65\x73\x0b\xb9\x01\xb6\x01\xb7\x01\xbd\x01\xbc\x01\xba\x01\xb8\x01\xbf\x01\xc0\x01\xbe\x01\xbb\x01\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x61\x7a\x65\x5f\x64\x69\x73\x67\x75\x69\x73\x65\x5f\x65\x71\x75\x69\x70\x6d\x65\x6e\x74\x01\xd9\x02\x0f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x6c\x6c\x73\x1a\xab\x03\xac\x03\xad\x03\xae\x03\xaf\x03\xb0\x03\xb1\x03\xb2\x03\xb4\x03\xb5\x03\xb6\x03\xb7\x03\xb8\x03\xb9\x03\xba\x03\xbc\x03\xbb\x03\xbd\x03\xbe\x03\xc0\x03\xbf\x03\xb3\x03\x0f\x14\x18\x84\x03\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x61\x70\x5f\x69\x6e\x76\x69\x73\x69\x62\x69\x6c\x69\x74\x79\x5f\x65\x71\x75\x69\x70\x6d\x65\x6e\x74\x01\xd9\x02\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x65\x6e\x63\x65\x5f\x67\x61\x74\x65\x73\x0c\x94\x06\x92\x06\x96\x06\x97\x06\x93\x06\x90\x06\x91\x06\x9a\x06\x9b\x06\x98\x06\x99\x06\x95\x06\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x72\x6d\x61\x64\x69\x6c\x6c\x6f\x5f\x66\x6f\x6f\x64\x01\xa4\x08\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x61\x74\x5f\x66\x6f\x6f\x64\x01\xfe\x06\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x6f\x64\x65\x6e\x5f\x70\x72\x65\x73\x73\x75\x72\x65\x5f\x70\x6c\x61\x74\x65\x73\x0c\xda\x05\xdb\x05\xdc\x05\xdd\x05\xde\x05\xe0\x05\xe1\x05\xe4\x05\xe5\x05\xe2\x05\xe3\x05\xdf\x05\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x67\x6f\x6c\x64\x5f\x61\x72\x6d\x6f\x72\x01\xd7\x06\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x63\x61\x63\x69\x61\x5f\x6c\x6f\x67\x73\x04\x8a\x01\xaf\x01\x98\x01\xa3\x01\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x74\x5f\x66\x6f\x6f\x64\x02\xe3\x07\xe4\x07\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x68\x65\x65\x70\x5f\x66\x6f\x6f\x64\x01\xfe\x06\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x61\x6e\x64\x6c\x65\x73\x11\x99\x0a\x9a\x0a\x9b\x0a\x9c\x0a\x9d\x0a\x9e\x0a\x9f\x0a\xa0\x0a\xa1\x0a\xa2\x0a\xa3\x0a\xa4\x0a\xa5\x0a\xa6\x0a\xa7\x0a\xa8\x0a\xa9\x0a\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x67\x6c\x69\x6e\x5f\x6c\x6f\x76\x65\x64\x19\x46\x50\x47\x5c\x8f\x0a\xd8\x05\xd7\x06\xfd\x09\xe0\x07\x8c\x09\xab\x08\x9c\x07\x9d\x07\x90\x07\x91\x07\x92\x07\x93\x07\xa4\x09\xe4\x06\xe6\x06\xe5\x06\xe7\x06\xe8\x06\xd6\x06\x56\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x5f\x66\x6f\x6f\x64\x1d\xe5\x01\xe6\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xef\x03\xf0\x03\xf2\x03\xf1\x03\xf5\x01\xc0\x01\xce\x01\x39\xbb\x01\x82\x02\x83\x02\xb9\x02\xf6\x01\xc9\x02\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x70\x70\x65\x72\x5f\x6f\x72\x65\x73\x02\x44\x45\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x61\x6e\x64\x03\x3b\x3e\x3c\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x67\x6f\x6c\x64\x5f\x6f\x72\x65\x73\x03\x46\x50\x47\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x72\x65\x65\x7a\x65\x5f\x69\x6d\x6d\x75\x6e\x65\x5f\x77\x65\x61\x72\x61\x62\x6c\x65\x73\x05\x83\x07\x82\x07\x81\x07\x80\x07\xa6\x09\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6c\x6f\x67\x73\x5f\x74\x68\x61\x74\x5f\x62\x75\x72\x6e\x24\x8d\x01\xb2\x01\x9a\x01\xa5\x01\x8c\x01\xb1\x01\x9b\x01\xa6\x01\x86\x01\xab\x01\x94\x01\x9f\x01\x8a\x01\xaf\x01\x98\x01\xa3\x01\x88\x01\xad\x01\x96\x01\xa1\x01\x89\x01\xae\x01\x97\x01\xa2\x01\x87\x01\xac\x01\x95\x01\xa0\x01\x8e\x01\xb3\x01\x9c\x01\xa7\x01\x8b\x01\xb0\x01\x99\x01\xa4\x01\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6f\x6d\x70\x6c\x65\x74\x65\x73\x5f\x66\x69\x6e\x64\x5f\x74\x72\x65\x65\x5f\x74\x75\x74\x6f\x72\x69\x61\x6c\x39\x8d\x01\xb2\x01\x9a\x01\xa5\x01\x8c\x01\xb1\x01\x9b\x01\xa6\x01\x86\x01\xab\x01\x94\x01\x9f\x01\x8a\x01\xaf\x01\x98\x01\xa3\x01\x88\x01\xad\x01\x96\x01\xa1\x01\x89\x01\xae\x01\x97\x01\xa2\x01\x87\x01\xac\x01\x95\x01\xa0\x01\x8e\x01\xb3\x01\x9c\x01\xa7\x01\x8b\x01\xb0\x01\x99\x01\xa4\x01\x91\x01\x9d\x01\xb4\x01\xa8\x01\x92\x01\x9e\x01\xb5\x01\xa9\x01\xb9\x01\xb6\x01\xb7\x01\xbd\x01\xbc\x01\xba\x01\xb8\x01\xbf\x01\xc0\x01\xbe\x01\xbb\x01\xa3\x04\xa4\x04\x0e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x72\x74\x0a\x1c\x1b\x1e\x1d\x89\x03\x1f\x86\x02\x89\x02\x20\x90\x01\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x69\x61\x6d\x6f\x6e\x64\x5f\x74\x6f\x6f\x6c\x5f\x6d\x61\x74\x65\x72\x69\x61\x6c\x73\x01\xcd\x06\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x64\x65\x63\x6f\x72\x61\x74\x65\x64\x5f\x70\x6f\x74\x5f\x73\x68\x65\x72\x64\x73\x17\xc8\x0a\xc9\x0a\xca\x0a\xcb\x0a\xcc\x0a\xcd\x0a\xce\x0a\xcf\x0a\xd1\x0a\xd3\x0a\xd4\x0a\xd5\x0a\xd6\x0a\xd7\x0a\xd8\x0a\xd9\x0a\xdb\x0a\xdc\x0a\xdd\x0a\xde\x0a\xd0\x0a\xd2\x0a\xda\x0a\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x70\x61\x69\x72\x73\x5f\x63\x68\x61\x69\x6e\x5f\x61\x72\x6d\x6f\x72\x01\xd3\x06\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x69\x63\x6b\x61\x78\x65\x73\x06\xf0\x06\xe1\x06\xe6\x06\xf5\x06\xdc\x06\xeb\x06\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x66\x6f\x6f\x74\x5f\x61\x72\x6d\x6f\x72\x06\x83\x07\x87\x07\x93\x07\x8b\x07\x8f\x07\x97\x07\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x63\x6c\x75\x73\x74\x65\x72\x5f\x6d\x61\x78\x5f\x68\x61\x72\x76\x65\x73\x74\x61\x62\x6c\x65\x73\x06\xf0\x06\xe6\x06\xeb\x06\xf5\x06\xe1\x06\xdc\x06\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x61\x69\x6e\x74\x69\x6e\x67\x5f\x76\x61\x72\x69\x61\x6e\x74\x01\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x63\x65\x61\x62\x6c\x65\x2e\x17\x01\x00\x02\x05\x1f\x2e\x22\x0c\x24\x29\x0d\x2d\x15\x19\x08\x27\x2c\x26\x31\x12\x20\x1e\x07\x25\x0e\x04\x16\x1a\x23\x2b\x03\x06\x09\x0a\x0b\x10\x11\x13\x18\x1b\x1c\x1d\x21\x28\x2a\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6f\x69\x6e\x74\x5f\x6f\x66\x5f\x69\x6e\x74\x65\x72\x65\x73\x74\x5f\x74\x79\x70\x65\x03\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x62\x65\x65\x5f\x68\x6f\x6d\x65\x02\x0f\x10\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x63\x71\x75\x69\x72\x61\x62\x6c\x65\x5f\x6a\x6f\x62\x5f\x73\x69\x74\x65\x0d\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x76\x69\x6c\x6c\x61\x67\x65\x0f\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x18\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x6f\x72\x6c\x64\x67\x65\x6e\x2f\x62\x69\x6f\x6d\x65\x48\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6e\x65\x74\x68\x65\x72\x5f\x66\x6f\x72\x74\x72\x65\x73\x73\x05\x22\x31\x07\x3b\x02\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6f\x63\x65\x61\x6e\x5f\x72\x75\x69\x6e\x5f\x77\x61\x72\x6d\x03\x1d\x3a\x0c\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x72\x69\x76\x65\x72\x02\x29\x18\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x61\x74\x65\x72\x5f\x6f\x6e\x5f\x6d\x61\x70\x5f\x6f\x75\x74\x6c\x69\x6e\x65\x73\x0d\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x29\x18\x36\x1f\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6d\x69\x6e\x65\x73\x68\x61\x66\x74\x32\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x29\x18\x03\x2d\x20\x17\x1b\x33\x2f\x05\x3e\x3c\x3d\x37\x30\x25\x26\x01\x1c\x32\x15\x14\x04\x24\x08\x27\x19\x34\x21\x1a\x3f\x0e\x2a\x2e\x28\x35\x36\x1f\x2b\x0f\x1e\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6a\x75\x6e\x67\x6c\x65\x5f\x74\x65\x6d\x70\x6c\x65\x02\x01\x1c\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x74\x72\x69\x61\x6c\x5f\x63\x68\x61\x6d\x62\x65\x72\x73\x35\x21\x0b\x16\x09\x06\x0d\x23\x0c\x1d\x3a\x34\x36\x1f\x2f\x2e\x2d\x3d\x19\x3e\x30\x3c\x37\x28\x20\x03\x15\x26\x14\x04\x08\x27\x2b\x2a\x1c\x00\x0e\x40\x1b\x33\x18\x29\x1a\x25\x35\x24\x32\x01\x13\x3f\x05\x17\x0f\x1e\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x6f\x72\x65\x5f\x66\x72\x65\x71\x75\x65\x6e\x74\x5f\x64\x72\x6f\x77\x6e\x65\x64\x5f\x73\x70\x61\x77\x6e\x73\x02\x29\x18\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x76\x69\x6c\x6c\x61\x67\x65\x5f\x64\x65\x73\x65\x72\x74\x01\x0e\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6a\x75\x6e\x67\x6c\x65\x03\x01\x1c\x32\x1b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x73\x6e\x6f\x77\x5f\x66\x6f\x78\x65\x73\x0a\x2e\x1a\x16\x30\x18\x2d\x17\x1b\x2f\x19\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x66\x6f\x72\x65\x73\x74\x07\x15\x14\x04\x24\x08\x27\x19\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6f\x63\x65\x61\x6e\x09\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x76\x69\x6c\x6c\x61\x67\x65\x5f\x73\x61\x76\x61\x6e\x6e\x61\x01\x2a\x16\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6f\x76\x65\x72\x77\x6f\x72\x6c\x64\x36\x21\x0b\x16\x09\x06\x0d\x23\x0c\x1d\x3a\x34\x36\x1f\x2f\x2e\x2d\x3d\x19\x3e\x30\x3c\x37\x28\x20\x03\x15\x26\x14\x04\x08\x27\x2b\x2a\x1c\x00\x0e\x40\x1b\x33\x18\x29\x1a\x25\x35\x24\x32\x01\x13\x3f\x05\x17\x0f\x1e\x0a\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x6f\x75\x74\x5f\x70\x61\x74\x72\x6f\x6c\x5f\x73\x70\x61\x77\x6e\x73\x01\x21\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x76\x69\x6c\x6c\x61\x67\x65\x5f\x74\x61\x69\x67\x61\x01\x37\x33\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x6c\x6f\x77\x73\x5f\x74\x72\x6f\x70\x69\x63\x61\x6c\x5f\x66\x69\x73\x68\x5f\x73\x70\x61\x77\x6e\x73\x5f\x61\x74\x5f\x61\x6e\x79\x5f\x68\x65\x69\x67\x68\x74\x01\x1e\x2f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6f\x6c\x61\x72\x5f\x62\x65\x61\x72\x73\x5f\x73\x70\x61\x77\x6e\x5f\x6f\x6e\x5f\x61\x6c\x74\x65\x72\x6e\x61\x74\x65\x5f\x62\x6c\x6f\x63\x6b\x73\x02\x16\x0b\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x63\x6c\x6f\x73\x65\x72\x5f\x77\x61\x74\x65\x72\x5f\x66\x6f\x67\x02\x36\x1f\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x76\x69\x6c\x6c\x61\x67\x65\x5f\x70\x6c\x61\x69\x6e\x73\x02\x28\x20\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x62\x75\x72\x69\x65\x64\x5f\x74\x72\x65\x61\x73\x75\x72\x65\x02\x03\x2d\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6f\x63\x65\x61\x6e\x5f\x72\x75\x69\x6e\x5f\x63\x6f\x6c\x64\x06\x16\x06\x23\x0b\x09\x0d\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x72\x6f\x64\x75\x63\x65\x73\x5f\x63\x6f\x72\x61\x6c\x73\x5f\x66\x72\x6f\x6d\x5f\x62\x6f\x6e\x65\x6d\x65\x61\x6c\x01\x3a\x1a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x6e\x6f\x77\x5f\x67\x6f\x6c\x65\x6d\x5f\x6d\x65\x6c\x74\x73\x0c\x00\x02\x07\x0e\x13\x22\x2a\x2b\x31\x3b\x3f\x40\x22\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x73\x74\x72\x6f\x6e\x67\x68\x6f\x6c\x64\x36\x21\x0b\x16\x09\x06\x0d\x23\x0c\x1d\x3a\x34\x36\x1f\x2f\x2e\x2d\x3d\x19\x3e\x30\x3c\x37\x28\x20\x03\x15\x26\x14\x04\x08\x27\x2b\x2a\x1c\x00\x0e\x40\x1b\x33\x18\x29\x1a\x25\x35\x24\x32\x01\x13\x3f\x05\x17\x0f\x1e\x0a\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6d\x69\x6e\x65\x73\x68\x61\x66\x74\x5f\x6d\x65\x73\x61\x03\x00\x13\x40\x2c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x64\x65\x73\x65\x72\x74\x01\x0e\x29\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x6f\x75\x74\x5f\x77\x61\x6e\x64\x65\x72\x69\x6e\x67\x5f\x74\x72\x61\x64\x65\x72\x5f\x73\x70\x61\x77\x6e\x73\x01\x39\x24\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x61\x6e\x63\x69\x65\x6e\x74\x5f\x63\x69\x74\x79\x01\x0a\x2b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x73\x77\x61\x6d\x70\x02\x36\x1f\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x73\x68\x69\x70\x77\x72\x65\x63\x6b\x09\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x14\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x73\x61\x76\x61\x6e\x6e\x61\x03\x2a\x2b\x3f\x21\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x73\x77\x61\x6d\x70\x5f\x68\x75\x74\x01\x36\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x63\x6f\x6c\x64\x5f\x76\x61\x72\x69\x61\x6e\x74\x5f\x66\x72\x6f\x67\x73\x11\x2e\x1a\x17\x1b\x2f\x16\x0b\x19\x0a\x18\x30\x2d\x38\x11\x12\x2c\x10\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x69\x67\x6c\x6f\x6f\x03\x30\x2e\x2f\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x74\x72\x61\x69\x6c\x5f\x72\x75\x69\x6e\x73\x06\x37\x30\x25\x26\x24\x1c\x29\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x73\x68\x69\x70\x77\x72\x65\x63\x6b\x5f\x62\x65\x61\x63\x68\x65\x64\x02\x03\x2d\x11\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x68\x69\x6c\x6c\x03\x3e\x3c\x3d\x2c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x6e\x65\x74\x68\x65\x72\x05\x22\x31\x07\x3b\x02\x10\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x65\x6e\x64\x05\x38\x11\x12\x2c\x10\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x74\x72\x6f\x6e\x67\x68\x6f\x6c\x64\x5f\x62\x69\x61\x73\x65\x64\x5f\x74\x6f\x24\x28\x35\x2e\x1a\x0e\x15\x14\x04\x08\x27\x24\x25\x26\x37\x30\x2a\x2b\x3e\x3d\x3c\x3f\x1c\x32\x01\x00\x13\x40\x20\x19\x2f\x17\x1b\x33\x21\x0f\x1e\x1f\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x77\x69\x74\x68\x6f\x75\x74\x5f\x7a\x6f\x6d\x62\x69\x65\x5f\x73\x69\x65\x67\x65\x73\x01\x21\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x62\x65\x61\x63\x68\x02\x03\x2d\x2e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x73\x74\x61\x6e\x64\x61\x72\x64\x17\x03\x2d\x29\x18\x37\x30\x25\x26\x15\x14\x04\x24\x08\x27\x19\x21\x1a\x0f\x1e\x2a\x2e\x28\x35\x28\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x70\x69\x6c\x6c\x61\x67\x65\x72\x5f\x6f\x75\x74\x70\x6f\x73\x74\x0c\x0e\x28\x2a\x2e\x37\x20\x17\x1b\x33\x2f\x05\x19\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x61\x6c\x6c\x6f\x77\x73\x5f\x73\x75\x72\x66\x61\x63\x65\x5f\x73\x6c\x69\x6d\x65\x5f\x73\x70\x61\x77\x6e\x73\x02\x36\x1f\x12\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x74\x61\x69\x67\x61\x04\x37\x30\x25\x26\x23\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x77\x61\x72\x6d\x5f\x76\x61\x72\x69\x61\x6e\x74\x5f\x66\x72\x6f\x67\x73\x11\x0e\x3a\x01\x1c\x32\x2a\x2b\x3f\x22\x31\x07\x3b\x02\x00\x13\x40\x1f\x2d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x71\x75\x69\x72\x65\x64\x5f\x6f\x63\x65\x61\x6e\x5f\x6d\x6f\x6e\x75\x6d\x65\x6e\x74\x5f\x73\x75\x72\x72\x6f\x75\x6e\x64\x69\x6e\x67\x0b\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x29\x18\x1c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x6d\x69\x6e\x65\x73\x68\x61\x66\x74\x5f\x62\x6c\x6f\x63\x6b\x69\x6e\x67\x01\x0a\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6d\x6f\x75\x6e\x74\x61\x69\x6e\x06\x20\x17\x1b\x33\x2f\x05\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x76\x69\x6c\x6c\x61\x67\x65\x5f\x73\x6e\x6f\x77\x79\x01\x2e\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6f\x63\x65\x61\x6e\x5f\x6d\x6f\x6e\x75\x6d\x65\x6e\x74\x04\x0b\x09\x0d\x0c\x15\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x62\x61\x64\x6c\x61\x6e\x64\x73\x03\x00\x13\x40\x1d\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x67\x6f\x6c\x64\x5f\x72\x61\x62\x62\x69\x74\x73\x01\x0e\x1e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x77\x68\x69\x74\x65\x5f\x72\x61\x62\x62\x69\x74\x73\x0a\x2e\x1a\x16\x30\x18\x2d\x17\x1b\x2f\x19\x2c\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x6a\x75\x6e\x67\x6c\x65\x03\x01\x1c\x32\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x70\x6c\x61\x79\x73\x5f\x75\x6e\x64\x65\x72\x77\x61\x74\x65\x72\x5f\x6d\x75\x73\x69\x63\x0b\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x29\x18\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x6e\x65\x74\x68\x65\x72\x5f\x66\x6f\x73\x73\x69\x6c\x01\x31\x26\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x64\x65\x73\x65\x72\x74\x5f\x70\x79\x72\x61\x6d\x69\x64\x01\x0e\x2a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x63\x6f\x6c\x64\x5f\x76\x61\x72\x69\x61\x6e\x74\x5f\x66\x61\x72\x6d\x5f\x61\x6e\x69\x6d\x61\x6c\x73\x1a\x2e\x1a\x17\x1b\x2f\x16\x0b\x19\x0a\x18\x30\x2d\x38\x11\x12\x2c\x10\x06\x09\x25\x26\x37\x3c\x3d\x3e\x33\x2b\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x6f\x63\x65\x61\x6e\x09\x0b\x09\x0d\x0c\x16\x23\x06\x1d\x3a\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x65\x6e\x64\x5f\x63\x69\x74\x79\x02\x11\x12\x17\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x64\x65\x65\x70\x5f\x6f\x63\x65\x61\x6e\x04\x0b\x09\x0d\x0c\x13\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x73\x5f\x6e\x65\x74\x68\x65\x72\x05\x22\x31\x07\x3b\x02\x25\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x72\x65\x64\x75\x63\x65\x5f\x77\x61\x74\x65\x72\x5f\x61\x6d\x62\x69\x65\x6e\x74\x5f\x73\x70\x61\x77\x6e\x73\x02\x29\x18\x27\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x62\x61\x73\x74\x69\x6f\x6e\x5f\x72\x65\x6d\x6e\x61\x6e\x74\x04\x07\x22\x31\x3b\x2a\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x73\x70\x61\x77\x6e\x73\x5f\x77\x61\x72\x6d\x5f\x76\x61\x72\x69\x61\x6e\x74\x5f\x66\x61\x72\x6d\x5f\x61\x6e\x69\x6d\x61\x6c\x73\x13\x0e\x3a\x01\x1c\x32\x2a\x2b\x3f\x22\x31\x07\x3b\x02\x00\x13\x40\x1f\x0c\x1d\x28\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x77\x6f\x6f\x64\x6c\x61\x6e\x64\x5f\x6d\x61\x6e\x73\x69\x6f\x6e\x02\x08\x27\x20\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x69\x6e\x63\x72\x65\x61\x73\x65\x64\x5f\x66\x69\x72\x65\x5f\x62\x75\x72\x6e\x6f\x75\x74\x08\x01\x21\x1f\x2f\x17\x1b\x36\x1c\x2e\x6d\x69\x6e\x65\x63\x72\x61\x66\x74\x3a\x68\x61\x73\x5f\x73\x74\x72\x75\x63\x74\x75\x72\x65\x2f\x72\x75\x69\x6e\x65\x64\x5f\x70\x6f\x72\x74\x61\x6c\x5f\x6d\x6f\x75\x6e\x74\x61\x69\x6e\x0f\x00\x13\x40\x3e\x3c\x3d\x2b\x3f\x34\x20\x17\x1b\x33\x2f\x05',
 ]
-async def main(player):
-    for i in regestries:
-        await player.packet.send(i)
+_framed = {}
+
+def framed(compression:int) -> bytes:
+    """Every registry and tag packet, framed for a compression threshold and joined into one write."""
+    blob = _framed.get(compression)
+    if blob is None:
+        blob = _framed[compression] = b"".join(Packet.frame(i, compression) for i in regestries)
+    return blob
+
+async def main(player) -> int:
+    """Sends the registries and returns how many bytes that took."""
+    blob = framed(player.packet.compression)
+    await player.packet.send_framed(blob)
+    return len(blob)
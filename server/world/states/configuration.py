@@ -1,66 +1,101 @@
 from server.packet.build import Build
 from server.packet.parse import Parse
+from server.packet import Packet
 from server.world.engine import JoinGameError
 from server.player import Player
 from server.config import config as _config
 from server.world import logger
+from server.metrics import metrics
+from server.world.dispatch import dispatch
 from server.vars import Var
-from time import time
-import asyncio
-
-async def loop(player: Player):
-    while True:
-        with Parse(await player.packet.recv()) as parse:
-            packet_id = parse.varint()
-            if packet_id == 0x00:
-                player.info = parse.rest()
-            elif packet_id == 0x02:
-                if parse.string() == "minecraft:brand":
-                    player.brand = parse.string()
 
-async def config(player:Player):
-    logger.debug(f"⚙️ Step 1: Configuration started")
-    # Step 1: Receive Login Start
-
-    try: await asyncio.wait_for(loop(player), timeout=1)
-    except asyncio.TimeoutError:
-        logger.debug("⚙️ Step 2: Configuration started")
-    except ConnectionResetError:
-        logger.debug("⚙️ Step 2: Configuration started")
+_intro = {}
 
-    async with Build(0x01, player) as build:
+def intro(compression:int) -> bytes:
+    """Brand, feature flags and known packs, framed for a compression threshold once and reused by every join."""
+    blob = _intro.get(compression)
+    if blob is None:
+        build = Build(0x01, send=False)
         build.string("minecraft:brand")
         build.string("mcords")
+        brand = build.get()
 
-    async with Build(0x0c, player) as build:
+        build = Build(0x0c, send=False)
         build.array(["minecraft:vanilla"],build.string)
+        flags = build.get()
 
-    async with Build(0x0e, player) as build:
+        build = Build(0x0e, send=False)
         build.array([{"namespace":"minecraft","id":"core","version":_config.get("version","1.21.5")}],lambda pack: (
-        build.string(pack["namespace"]),
-        build.string(pack["id"]),
-        build.string(pack["version"])
-    ))
-
-    with Parse(await player.packet.recv()) as parse:
-        packet_id = parse.varint()
-        if packet_id != 0x07:
-            raise JoinGameError({"text":f"Expected packet 0x07 got: 0x{packet_id:02x}"})
-            # await player.disconnect({"text":f"Expected packet 0x07 got: 0x{packet_id:02x}"})
-
-    logger.debug("⚙️ Step 3: Sending regestries")
-    from server.world.regestries import main
-    await main(player)
-
-    logger.debug("⚙️ Step 4: Sending config succes")
-    await player.packet.send(b'\x03') #Config success
-    # async with Build(0x03, player) as build:
-    #     pass
-    with Parse(await player.packet.recv()) as parse:
-        packet_id = parse.varint()
-        if packet_id != 0x03:
-            raise JoinGameError({"text":f"Expected packet 0x03 got: 0x{packet_id:02x}"})
-            # await player.disconnect({"text":f"Expected packet 0x03 got: 0x{packet_id:02x}"})
-        logger.debug("✅ Config Success")
-
-    player.state = "play"
\ No newline at end of file
+            build.string(pack["namespace"]),
+            build.string(pack["id"]),
+            build.string(pack["version"])
+        ))
+        packs = build.get()
+
+        blob = _intro[compression] = b"".join(Packet.frame(data, compression) for data in (brand, flags, packs))
+    return blob
+
+def invalidate_intro():
+    _intro.clear()
+
+def prepare(compression:int):
+    """Builds the static configuration packets ahead of the first join."""
+    from server.world.regestries import framed
+    intro(compression)
+    framed(compression)
+
+async def known_packs(player:Player, packs:list):
+    """Answers Select Known Packs with the registries and Finish Configuration."""
+    # The registry blobs carry no NBT, the client fills every entry in from its own copy of the core pack
+    version = _config.get("version","1.21.5")
+    if ("minecraft", "core", version) not in packs:
+        metrics.count("known-packs-miss")
+        async with Build(0x02, player) as build:
+            build.text({"text":f"This server needs the vanilla {version} data pack"})
+        raise JoinGameError(f"Client doesn't know the minecraft:core {version} pack")
+    metrics.count("known-packs-hit")
+
+    async with player.batch():
+        logger.debug("⚙️ Step 2: Sending regestries")
+        from server.world.regestries import main
+        metrics.count("registry-bytes-sent", await main(player))
+
+        logger.debug("⚙️ Step 3: Sending config succes")
+        await player.packet.send(b'\x03') #Config success
+
+@dispatch.on("config", 0x00, decode=lambda parse: (parse.rest(),))
+async def client_information(player:Player, info:bytes):
+    player.info = info
+
+def plugin_message(parse:Parse) -> tuple[str, str | None]:
+    channel = parse.string()
+    return channel, parse.string() if channel == "minecraft:brand" else None
+
+@dispatch.on("config", 0x02, decode=plugin_message)
+async def plugin(player:Player, channel:str, brand:str | None):
+    if channel == "minecraft:brand":
+        player.brand = brand
+
+@dispatch.on("config", 0x07, decode=lambda parse: (parse.array(lambda: (parse.string(), parse.string(), parse.string())) or [],))
+async def select_known_packs(player:Player, packs:list):
+    if player.configured:
+        raise JoinGameError({"text":"Known packs were already selected"})
+    await known_packs(player, packs)
+    player.configured = True
+
+@dispatch.on("config", 0x03)
+async def acknowledge_finish(player:Player) -> bool:
+    if not player.configured:
+        raise JoinGameError({"text":"Configuration acknowledged before it was finished"})
+    logger.debug("✅ Config Success")
+    return True
+
+async def config(player:Player):
+    """Sends brand, feature flags and known packs, then handles the client until it finishes configuration."""
+    logger.debug(f"⚙️ Step 1: Configuration started")
+    await player.packet.send_framed(intro(player.packet.compression))
+
+    while not await dispatch("config", player, await player.packet.recv()):
+        pass
+
+    player.state = "play"
@@ -1,12 +1,13 @@
-from Crypto.Cipher import PKCS1_v1_5, AES
 from server.packet.build import Build
 from server.packet.parse import Parse
-from Crypto.PublicKey import RSA
 from server.player import Player
+from server.keys import keys, crypto
 from server.world import logger
 from server.world.engine import JoinGameError
-import requests, hashlib, os
+from server.session import session
 from server.vars import Var
+from json import dumps
+import os
 
 async def login(player:Player, online_mode=True, compression = -1):
     logger.debug(f"⚙️ Step 1: Receive Login Start")
@@ -46,10 +47,10 @@ async def login(player:Player, online_mode=True, compression = -1):
         player.state = "config"
         return
 
-    logger.debug(f"⚙️ Step 2: Generate RSA keypair and verify token")
-    # Step 2: Generate RSA keypair and verify token
-    rsa_key = RSA.generate(1024)
-    public_key = rsa_key.publickey().export_key(format='DER')
+    logger.debug(f"⚙️ Step 2: Pick RSA keypair and verify token")
+    # Step 2: Pick RSA keypair and verify token
+    keypair = keys.current()
+    public_key = keypair.public_key
     verify_token = os.urandom(16)
 
     logger.debug(f"⚙️ Step 3: Send Encryption Request")
@@ -64,37 +65,31 @@ async def login(player:Player, online_mode=True, compression = -1):
     # Step 4: Receive Encryption Response
     with Parse(await player.packet.recv()) as parse:
         packet_id = parse.varint()
-        secret = parse.array(parse.byte)
-        token = parse.array(parse.byte)
+        secret = parse.byte_array()
+        token = parse.byte_array()
 
     if packet_id != 0x01:
         raise JoinGameError("Expected Encryption Response")
 
     logger.debug(f"⚙️ Step 5: Decrypt shared secret and verify token")
-    # Step 5: Decrypt shared secret and verify token
-    cipher = PKCS1_v1_5.new(rsa_key)
-    shared_secret = cipher.decrypt(secret, None)
-    decrypted_token = cipher.decrypt(token, None)
-
-    if decrypted_token != verify_token:
+    # Step 5: Decrypt shared secret, verify token and compute the server hash off the event loop.
+    # The slot is only held for the crypto itself, not while waiting on the client.
+    if not crypto.reserve():
+        async with Build(0x00, player) as build:
+            build.string(dumps({"text":"Server is busy, try again in a moment"}, separators=(",", ":")))
+        raise JoinGameError("Login crypto queue is full")
+    try:
+        verified = await crypto.verify(keypair, secret, token, verify_token)
+    finally:
+        crypto.release()
+
+    if verified is None:
         raise JoinGameError("Verify token mismatch")
+    shared_secret, server_hash = verified
 
     logger.debug(f"⚙️ Step 6: Mojang Authentication")
     # Step 6: Mojang Authentication
-    sha1 = hashlib.sha1()
-    sha1.update(b"")  # empty server ID
-    sha1.update(shared_secret)
-    sha1.update(public_key)
-    server_hash = Var.java_hex(sha1.digest())
-
-    resp = requests.get(
-        "https://sessionserver.mojang.com/session/minecraft/hasJoined",
-        params={"username": username, "serverId": server_hash}
-    )
-    if resp.status_code != 200:
-        raise JoinGameError("Mojang authentication failed")
-
-    profile = resp.json()
+    profile = await session.has_joined(username, server_hash)
     uuid = profile["id"]
     # name = profile["name"]
 
@@ -103,10 +98,6 @@ async def login(player:Player, online_mode=True, compression = -1):
 
     player.packet.set_encryption(shared_secret)
 
-    # Verify Token Validation (Step 5)
-    if decrypted_token != verify_token:
-        raise JoinGameError("Verify token mismatch: Decrypted token does not match original")
-
     # Step 8: Send Login Success
     logger.debug("⚙️ Step 8: Send Login Success")
 
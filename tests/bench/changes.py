@@ -0,0 +1,44 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from server.world.changes import BlockChanges
+from server.packet.build import Build
+from server.packet import Packet
+from timeit import repeat
+
+ROUNDS = 2000
+COMPRESSION = 256
+# The lobby floor repaint: the tile that was left and the one that was entered
+CHANGES = [(8, 0, 8, 12), (9, 0, 8, 13)]
+
+def per_block(packets:list[Packet]):
+    """Every block as its own Block Update, built and framed for every viewer."""
+    for packet in packets:
+        for x, y, z, state in CHANGES:
+            build = Build(0x08, send=False)
+            build.position(x, y, z)
+            build.varint(state)
+            packet.queue(build.get())
+
+def batched(packets:list[Packet]):
+    """One BlockChanges per tick, framed once and shared by every viewer."""
+    changes = BlockChanges()
+    for x, y, z, state in CHANGES:
+        changes.set(x, y, z, state)
+    frame = b"".join(Packet.frame(data, COMPRESSION) for data in changes.packets())
+    for packet in packets:
+        packet.queue_framed(frame)
+
+def tick(func, packets:list[Packet]):
+    func(packets)
+    for packet in packets:
+        packet._outbound.clear()
+
+if __name__ == "__main__":
+    for viewers in (1, 50):
+        packets = [Packet(state="play", compression=COMPRESSION) for _ in range(viewers)]
+        for name, func in (("per-block", per_block), ("batched", batched)):
+            elapsed = min(repeat(lambda: tick(func, packets), number=ROUNDS, repeat=5))
+            func(packets)
+            sent = [frame for packet in packets for frame in packet._outbound]
+            size, count = sum(map(len, sent)), len(sent)
+            tick(lambda packets: None, packets)
+            print(f"{name:<10} {viewers:>3} viewers {elapsed / ROUNDS * 1e6:>8.2f} µs per tick, {count:>3} packets, {size:>5} bytes")
@@ -0,0 +1,45 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from Crypto.Cipher import AES
+from server.packet import Packet
+from server.world import logger # recv imports it lazily; keep it out of the timings
+import main as _main # and logger.debug imports main lazily too
+from server.vars import Var
+from time import perf_counter
+import asyncio
+
+FRAMES = 20000
+KEY = bytes(range(16))
+
+def stream(payloads: list[bytes], encrypted: bool) -> asyncio.StreamReader:
+    data = b"".join(Var.write_varint(len(p)) + p for p in payloads)
+    if encrypted:
+        data = AES.new(KEY, AES.MODE_CFB, iv=KEY, segment_size=8).encrypt(data)
+    reader = asyncio.StreamReader(limit=len(data) + 1)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+async def bench(name: str, payloads: list[bytes], encrypted: bool):
+    packet = Packet(stream(payloads, encrypted), state="play")
+    if encrypted:
+        packet.set_encryption(KEY)
+
+    start = perf_counter()
+    for payload in payloads:
+        assert await packet.recv() == payload
+    elapsed = perf_counter() - start
+    print(f"{name:<28} {len(payloads) / elapsed:>12,.0f} frames/s")
+
+async def main():
+    movement = b"\x1d" + bytes(25)
+    keepalive = b"\x1a" + bytes(8)
+    mixed = [movement if i % 3 else keepalive for i in range(FRAMES)]
+    large = [b"\x07" + bytes(2048)] * (FRAMES // 10)
+
+    await bench("small frames", mixed, False)
+    await bench("small frames (encrypted)", mixed, True)
+    await bench("2 KiB frames", large, False)
+    await bench("2 KiB frames (encrypted)", large, True)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from server.world.changes import BlockChanges
+from server.world import World
+from server.player import Player
+from server.packet import Packet
+from collections import deque
+import tracemalloc
+
+PLAYERS = 1000
+
+def seat(world:World, player:Player):
+    """What World.join sets up for a player, without the reader task and timers."""
+    player.world = world
+    player.inbox = deque()
+    player.overlay = {}
+    player.changes = BlockChanges()
+    world.players[player] = None
+
+def memory(world:World, players:list[Player], tiles:int) -> float:
+    """Bytes per player added by `tiles` overlaid blocks each, as the floor highlight does."""
+    tracemalloc.start()
+    for player in players:
+        for x in range(tiles):
+            world.show(player, x, 0, 0, 1)
+        player.changes.packets()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(players)
+
+if __name__ == "__main__":
+    packet = Packet(state="play")
+    world = World([])
+    tracemalloc.start()
+    players = [Player(None, None, packet) for _ in range(PLAYERS)]
+    for player in players:
+        seat(world, player)
+    print(f"{'player in the shared lobby':<36} {tracemalloc.get_traced_memory()[0] / PLAYERS:>8,.0f} bytes each")
+    tracemalloc.stop()
+
+    for tiles in (1, 16):
+        world = World([])
+        players = [Player(None, None, packet) for _ in range(PLAYERS)]
+        for player in players:
+            seat(world, player)
+        print(f"{f'{tiles} overlaid block(s)':<36} {memory(world, players, tiles):>8,.0f} bytes each")
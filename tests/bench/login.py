@@ -0,0 +1,29 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from Crypto.Cipher import PKCS1_v1_5
+from Crypto.PublicKey import RSA
+from server.keys import KeyPair, keys
+from time import perf_counter
+import asyncio, os
+
+LOGINS = 50
+
+def join(keypair: KeyPair):
+    """Server side crypto of one Encryption Request/Response exchange."""
+    verify_token = os.urandom(16)
+    client = PKCS1_v1_5.new(RSA.import_key(keypair.public_key))
+    secret, token = client.encrypt(os.urandom(16)), client.encrypt(verify_token)
+
+    keypair.cipher.decrypt(secret, None)
+    assert keypair.cipher.decrypt(token, None) == verify_token
+
+def bench(name: str, keypair):
+    start = perf_counter()
+    for _ in range(LOGINS):
+        join(keypair())
+    elapsed = perf_counter() - start
+    print(f"{name:<28} {LOGINS / elapsed:>10,.1f} joins/s")
+
+if __name__ == "__main__":
+    bench("keypair per login", KeyPair)
+    asyncio.run(keys.prepare())
+    bench("shared keypair", keys.current)
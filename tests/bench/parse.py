@@ -0,0 +1,34 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from server.packet.parse import Parse
+from server.vars import Var
+from timeit import repeat
+from struct import pack
+
+ROUNDS = 100000
+
+handshake = b"\x00" + Var.write_varint(772) + Var.write_string("play.example.net") + pack(">H", 25565) + Var.write_varint(2)
+position = b"\x1c" + pack(">ddd", 8.5, 1.0, 8.5) + b"\x01"
+position_rotation = b"\x1d" + pack(">dddff", 8.5, 1.0, 8.5, 90.0, 0.0) + b"\x01"
+encryption_response = b"\x01" + Var.write_varint(128) + bytes(128) + Var.write_varint(128) + bytes(128)
+
+def parse_handshake():
+    with Parse(handshake) as parse:
+        parse.varint(); parse.varint(); parse.string(); parse.short(); parse.varint()
+
+def parse_movement(data):
+    with Parse(data) as parse:
+        parse.varint(); parse.double(); parse.double(); parse.double()
+
+def parse_encryption_response():
+    with Parse(encryption_response) as parse:
+        parse.varint(); parse.byte_array(); parse.byte_array()
+
+def bench(name, func):
+    elapsed = min(repeat(func, number=ROUNDS, repeat=5))
+    print(f"{name:<24} {ROUNDS / elapsed:>12,.0f} packets/s")
+
+if __name__ == "__main__":
+    bench("handshake", parse_handshake)
+    bench("movement (0x1c)", lambda: parse_movement(position))
+    bench("movement (0x1d)", lambda: parse_movement(position_rotation))
+    bench("encryption response", parse_encryption_response)
@@ -0,0 +1,73 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from server.player import Player
+from server.packet import Packet
+from timeit import repeat
+import tracemalloc, asyncio
+
+PLAYERS = 10000
+ROUNDS = 1000000
+
+class LegacyPlayer:
+    """Player as it was before __slots__: a Data class and a Lock per instance, the rest bolted on."""
+    def __init__(self, packet:Packet):
+        self.reader = None
+        self.writer = None
+        self.info = {}
+        self.packet = packet
+
+        class Data:
+            def __init__(self):
+                self.lock = asyncio.Lock()
+        self.data = Data()
+
+def legacy_player(packet:Packet) -> LegacyPlayer:
+    """A LegacyPlayer with everything login, play and the first movement packet used to add."""
+    player = LegacyPlayer(packet)
+    player.username = "tester"
+    player.uuid = "00000000-0000-0000-0000-000000000001"
+    player.Id = 0
+    player.brand = "vanilla"
+    class Position: # World.message defined this on the first movement packet
+        def __init__(self):
+            self.x = 0
+            self.y = 0
+            self.z = 0
+    player.pos = Position()
+    player.pos.x, player.pos.y, player.pos.z = 8.5, 1.0, 8.5
+    player.keepAlive = 0.0
+    player.data.m = [8, 8]
+    player.data.p = [8, 8]
+    player.data.bonce = 0
+    return player
+
+def slotted_player(packet:Packet) -> Player:
+    player = Player(None, None, packet)
+    player.username = "tester"
+    player.uuid = "00000000-0000-0000-0000-000000000001"
+    player.Id = 0
+    player.brand = "vanilla"
+    player.x, player.y, player.z = 8.5, 1.0, 8.5
+    player.tile = (8, 8)
+    return player
+
+def memory(factory, packet:Packet) -> float:
+    tracemalloc.start()
+    players = [factory(packet) for _ in range(PLAYERS)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del players
+    return size / PLAYERS
+
+def bench(name, func):
+    elapsed = min(repeat(func, number=ROUNDS, repeat=5))
+    print(f"{name:<36} {elapsed / ROUNDS * 1e9:>8.1f} ns")
+
+if __name__ == "__main__":
+    packet = Packet(state="play")
+    print(f"{'legacy player':<36} {memory(legacy_player, packet):>8,.0f} bytes each")
+    print(f"{'slotted player':<36} {memory(slotted_player, packet):>8,.0f} bytes each")
+
+    legacy = legacy_player(packet)
+    slotted = slotted_player(packet)
+    bench("legacy position check + read", lambda: hasattr(legacy, "pos") and (legacy.pos.x, legacy.pos.z, legacy.data.m))
+    bench("slotted position check + read", lambda: slotted.x is not None and (slotted.x, slotted.z, slotted.tile))
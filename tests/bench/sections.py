@@ -0,0 +1,65 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))); del sys, os
+from server.world.container import paletted, BLOCKS
+from server.packet.build import Build
+from timeit import repeat
+import numpy as np
+
+ROUNDS = 200
+
+rng = np.random.default_rng(0)
+sections = {
+    "single-valued": np.full((16, 16, 16), 1),
+    "indirect (16 ids)": rng.choice(np.arange(1, 400, 25), (16, 16, 16)),
+    "direct (400 ids)": rng.integers(1, 400, (16, 16, 16)),
+}
+
+def python_section(blocks: np.ndarray):
+    """The per-block loop chunk.section used: dict palette, then longs packed one entry at a time."""
+    build = Build(0x00, send=False)
+    values = blocks.ravel().tolist()
+    state_to_index = {}
+    for state in values:
+        if state not in state_to_index:
+            state_to_index[state] = len(state_to_index)
+
+    if len(state_to_index) == 1:
+        build.byte(0)
+        build.varint(values[0])
+        return build.get()
+
+    bits = max(4, (len(state_to_index) - 1).bit_length())
+    if bits > 8:
+        bits = 15
+        build.byte(bits)
+        indexes = values
+    else:
+        build.byte(bits)
+        build.varint(len(state_to_index))
+        for state in state_to_index:
+            build.varint(state)
+        indexes = [state_to_index[state] for state in values]
+    per_long = 64 // bits
+    for start in range(0, len(indexes), per_long):
+        value = 0
+        for shift, index in enumerate(indexes[start:start + per_long]):
+            value |= index << (shift * bits)
+        build.raw(value.to_bytes(8, "big"))
+    return build.get()
+
+def numpy_section(blocks: np.ndarray):
+    build = Build(0x00, send=False)
+    paletted(build, blocks, BLOCKS)
+    return build.get()
+
+def bench(name, func, blocks):
+    elapsed = min(repeat(lambda: func(blocks), number=ROUNDS, repeat=5))
+    print(f"{name:<36} {ROUNDS / elapsed:>10,.0f} sections/s")
+
+if __name__ == "__main__":
+    # Indirect palettes list the same ids in a different order, direct ones have to match byte for byte
+    direct = sections["direct (400 ids)"]
+    assert python_section(direct) == numpy_section(direct)
+
+    for name, blocks in sections.items():
+        bench(f"python {name}", python_section, blocks)
+        bench(f"numpy  {name}", numpy_section, blocks)
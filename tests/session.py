@@ -0,0 +1,33 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))); del sys, os
+# Local stand-in for sessionserver.mojang.com.
+# Run it and set `session-server=http://127.0.0.1:8765` in server.properties to
+# test online-mode logins or load-test joins without touching Mojang.
+from server.vars import Var
+from aiohttp import web
+import asyncio, argparse
+
+async def has_joined(request: web.Request) -> web.Response:
+    username = request.query.get("username", "")
+    if not username or not request.query.get("serverId"):
+        return web.Response(status=204)
+    await asyncio.sleep(request.app["delay"])
+    return web.json_response({
+        "id": Var.get_offline_uuid(username).replace("-", ""),
+        "name": username,
+        "properties": [],
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Mojang session server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before answering, to mimic Mojang latency")
+    args = parser.parse_args()
+
+    app = web.Application()
+    app["delay"] = args.delay
+    app.router.add_get("/session/minecraft/hasJoined", has_joined)
+    web.run_app(app, host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
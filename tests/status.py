@@ -0,0 +1,38 @@
+import sys; import os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))); del sys, os
+from server.properties import status_response
+from server.packet.parse import Parse
+from server.packet import Packet
+from server.player import Player
+from server.world import lobby
+from json import loads
+import asyncio
+
+def online() -> int:
+    """Players online according to the cached Status Response."""
+    with Parse(status_response(772)) as parse:
+        parse.varint() # Frame length
+        parse.varint() # Packet id
+        return loads(parse.string())["players"]["online"]
+
+async def main():
+    server = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+    reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+
+    before = online()
+    player = Player(reader, writer, Packet(reader, writer, state="play"))
+    session = asyncio.create_task(lobby.join(player))
+    await asyncio.sleep(0.1)
+    joined = online()
+
+    session.cancel()
+    await asyncio.gather(session, return_exceptions=True)
+    left = online()
+    writer.close()
+    server.close()
+
+    assert joined == before + 1, (before, joined)
+    assert left == before, (before, left)
+    print(f"status players online: {before} -> {joined} after the join -> {left} after leaving")
+
+if __name__ == "__main__":
+    asyncio.run(main())